@@ -3,6 +3,7 @@
 from .grid3d import (
     Grid3D,
     GridAxis,
+    GridTile,
     IrregularGrid3D,
     RegularGrid3D,
     create_grid,
@@ -14,9 +15,11 @@ from .types import (
     DownsamplingStatistic,
     GridResolution,
     InterpolationResult,
+    KrigingSolver,
     ModelType,
     NormalizationParams,
     PreprocessingParams,
+    SearchStrategy,
     SklearnClassifier,
     SklearnEstimator,
     StandardizationParams,
@@ -31,12 +34,15 @@ __all__ = [
     "GridData",
     "GridDataSpecs",
     "GridResolution",
+    "GridTile",
     "InterpolationResult",
     "IrregularGrid3D",
+    "KrigingSolver",
     "ModelType",
     "NormalizationParams",
     "PreprocessingParams",
     "RegularGrid3D",
+    "SearchStrategy",
     "SklearnClassifier",
     "SklearnEstimator",
     "StandardizationParams",
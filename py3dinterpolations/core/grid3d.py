@@ -1,9 +1,14 @@
 """3D grid definitions for interpolation."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import cached_property
 
 import numpy as np
+import numpy.typing as npt
+import shapely
+from scipy.spatial import cKDTree
 from shapely.geometry.base import BaseGeometry
 
 from .griddata import GridData
@@ -26,15 +31,45 @@ class GridAxis:
     max: float
     res: float
 
-    @property
+    @cached_property
     def grid(self) -> np.ndarray:
-        """1D array of evenly spaced values along this axis."""
-        return np.arange(self.min, self.max, self.res)
+        """1D array of evenly spaced values along this axis.
+
+        Computed once and read-only, so that it can be shared safely.
+        """
+        return _read_only(np.arange(self.min, self.max, self.res))
 
     def __repr__(self) -> str:
         return f"GridAxis({self.name.value}: [{self.min}, {self.max}), res={self.res})"
 
 
+@dataclass(frozen=True)
+class GridTile:
+    """A rectangular block of grid nodes, described without copying them.
+
+    Args:
+        z: Node index slice along Z.
+        y: Node index slice along Y.
+        x: Node index slice along X.
+        grid: 1D views of the tile's coordinates per axis.
+    """
+
+    z: slice
+    y: slice
+    x: slice
+    grid: dict[str, np.ndarray]
+
+    @property
+    def index(self) -> tuple[slice, slice, slice]:
+        """(Z, Y, X) slices selecting the tile in result volumes."""
+        return (self.z, self.y, self.x)
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """(Z, Y, X) number of nodes of the tile."""
+        return (len(self.grid["Z"]), len(self.grid["Y"]), len(self.grid["X"]))
+
+
 class Grid3D(ABC):
     """Abstract base class for 3D interpolation grids.
 
@@ -42,12 +77,46 @@ class Grid3D(ABC):
         x: X axis definition.
         y: Y axis definition.
         z: Z axis definition.
+        dtype: Floating point type of the full-size coordinate volumes
+            (``mesh``, ``normalized_mesh``, ``prediction_points``). The 1D
+            axes stay float64 so that nodes remain exact.
+        samples: (N, 3) sample coordinates that ``max_extrapolation_distance``
+            is measured from.
+        max_extrapolation_distance: Leave nodes further than this 3D
+            distance from every sample out of ``node_mask``. None keeps
+            nodes at any distance.
+
+    Raises:
+        ValueError: If only one of samples and max_extrapolation_distance is
+            given, or the distance is not positive.
     """
 
-    def __init__(self, x: GridAxis, y: GridAxis, z: GridAxis):
+    def __init__(
+        self,
+        x: GridAxis,
+        y: GridAxis,
+        z: GridAxis,
+        dtype: npt.DTypeLike = np.float64,
+        samples: np.ndarray | None = None,
+        max_extrapolation_distance: float | None = None,
+    ):
+        if (samples is None) != (max_extrapolation_distance is None):
+            msg = "samples and max_extrapolation_distance must be given together"
+            raise ValueError(msg)
+        if max_extrapolation_distance is not None and max_extrapolation_distance <= 0:
+            msg = (
+                "max_extrapolation_distance must be positive, "
+                f"got {max_extrapolation_distance}"
+            )
+            raise ValueError(msg)
         self._x = x
         self._y = y
         self._z = z
+        self._dtype = np.dtype(dtype)
+        self._samples = (
+            None if samples is None else np.asarray(samples, dtype=float).reshape(-1, 3)
+        )
+        self._max_extrapolation_distance = max_extrapolation_distance
         self._result: InterpolationResult | None = None
 
     @property
@@ -62,6 +131,10 @@ class Grid3D(ABC):
     def Z(self) -> GridAxis:
         return self._z
 
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
     def get_axis(self, axis: str | Axis) -> GridAxis:
         """Get a grid axis by name.
 
@@ -90,7 +163,7 @@ class Grid3D(ABC):
 
     @property
     def grid(self) -> dict[str, np.ndarray]:
-        """1D grid arrays per axis."""
+        """1D grid arrays per axis, cached and read-only."""
         return {
             "X": self.X.grid,
             "Y": self.Y.grid,
@@ -99,14 +172,19 @@ class Grid3D(ABC):
 
     @property
     def normalized_grid(self) -> dict[str, np.ndarray]:
-        """Min-max normalized 1D grid arrays per axis."""
+        """Min-max normalized 1D grid arrays per axis, cached and read-only."""
+        return dict(self._normalized_axes)
+
+    @cached_property
+    def _normalized_axes(self) -> dict[str, np.ndarray]:
+        """Normalized axes, computed on first use."""
         result = {}
         for axis_name, arr in self.grid.items():
             arr_min, arr_max = arr.min(), arr.max()
             if arr_max - arr_min == 0:
-                result[axis_name] = np.zeros_like(arr)
+                result[axis_name] = _read_only(np.zeros_like(arr))
             else:
-                result[axis_name] = (arr - arr_min) / (arr_max - arr_min)
+                result[axis_name] = _read_only((arr - arr_min) / (arr_max - arr_min))
         return result
 
     @property
@@ -116,24 +194,141 @@ class Grid3D(ABC):
             return self.X.res
         return {"X": self.X.res, "Y": self.Y.res, "Z": self.Z.res}
 
-    @property
-    def mesh(self) -> dict[str, np.ndarray]:
-        """3D meshgrid arrays."""
+    def meshgrid(
+        self, sparse: bool = True, normalized: bool = False
+    ) -> dict[str, np.ndarray]:
+        """3D coordinate arrays of the grid nodes, shaped (Y, X, Z).
+
+        Args:
+            sparse: Return broadcastable arrays of shapes (1, X, 1),
+                (Y, 1, 1) and (1, 1, Z), which cost no more memory than the
+                axes. False builds dense full-volume arrays.
+            normalized: Use the normalized axes.
+
+        Returns:
+            Coordinate arrays per axis, in the grid's dtype.
+        """
+        grid = self._normalized_axes if normalized else self.grid
         mx, my, mz = np.meshgrid(
-            self.grid["X"], self.grid["Y"], self.grid["Z"], indexing="xy"
+            *(grid[axis].astype(self._dtype, copy=False) for axis in ("X", "Y", "Z")),
+            indexing="xy",
+            sparse=sparse,
         )
         return {"X": mx, "Y": my, "Z": mz}
 
+    @property
+    def mesh(self) -> dict[str, np.ndarray]:
+        """Dense 3D meshgrid arrays, built on every access.
+
+        Prefer ``meshgrid()``, whose sparse arrays broadcast to the same
+        volumes without allocating them.
+        """
+        return self.meshgrid(sparse=False)
+
     @property
     def normalized_mesh(self) -> dict[str, np.ndarray]:
-        """Normalized 3D meshgrid arrays."""
-        mx, my, mz = np.meshgrid(
-            self.normalized_grid["X"],
-            self.normalized_grid["Y"],
-            self.normalized_grid["Z"],
-            indexing="xy",
+        """Dense normalized 3D meshgrid arrays, built on every access."""
+        return self.meshgrid(sparse=False, normalized=True)
+
+    def iter_tiles(self, tile_shape: int | tuple[int, int, int]) -> Iterator[GridTile]:
+        """Iterate over the grid in rectangular tiles, in (Z, Y, X) order.
+
+        Tiles only hold index slices and views of the 1D axes, so iterating
+        allocates nothing per node. Tiles at the upper edges are smaller
+        when the grid is not a multiple of the tile shape.
+
+        Args:
+            tile_shape: Number of nodes per tile along (Z, Y, X), as in the
+                result volumes, or one number for all axes.
+
+        Yields:
+            GridTile for each block of nodes.
+
+        Raises:
+            ValueError: If tile_shape does not hold three positive integers.
+        """
+        shape = (tile_shape,) * 3 if isinstance(tile_shape, int) else tile_shape
+        if len(shape) != 3 or any(n < 1 for n in shape):
+            msg = f"tile_shape must hold three positive integers, got {tile_shape}"
+            raise ValueError(msg)
+        tz, ty, tx = shape
+        x, y, z = self.X.grid, self.Y.grid, self.Z.grid
+        for z0 in range(0, len(z), tz):
+            for y0 in range(0, len(y), ty):
+                for x0 in range(0, len(x), tx):
+                    zs, ys, xs = (
+                        slice(z0, min(z0 + tz, len(z))),
+                        slice(y0, min(y0 + ty, len(y))),
+                        slice(x0, min(x0 + tx, len(x))),
+                    )
+                    yield GridTile(
+                        z=zs, y=ys, x=xs, grid={"X": x[xs], "Y": y[ys], "Z": z[zs]}
+                    )
+
+    def _node_coordinates(self) -> np.ndarray:
+        """(N, 3) coordinates of every node, in (Y, X, Z) order."""
+        mesh = self.meshgrid()
+        shape = (len(self.Y.grid), len(self.X.grid), len(self.Z.grid))
+        return np.column_stack(
+            [np.broadcast_to(mesh[axis], shape).ravel() for axis in ("X", "Y", "Z")]
         )
-        return {"X": mx, "Y": my, "Z": mz}
+
+    @property
+    def samples(self) -> np.ndarray | None:
+        """Sample coordinates the extrapolation distance is measured from."""
+        return self._samples
+
+    @property
+    def max_extrapolation_distance(self) -> float | None:
+        """Largest distance from the samples at which nodes are predicted."""
+        return self._max_extrapolation_distance
+
+    @cached_property
+    def distance_mask(self) -> np.ndarray | None:
+        """(Z, Y, X) read-only mask of the nodes near a sample.
+
+        Nodes are queried against a KD-tree of the samples one Z level at a
+        time, with the search bounded by the distance so that far nodes are
+        rejected early. Levels further than the distance from the samples'
+        Z range are skipped. None without a distance.
+        """
+        if self._samples is None or self._max_extrapolation_distance is None:
+            return None
+        distance = self._max_extrapolation_distance
+        x, y, z = self.X.grid, self.Y.grid, self.Z.grid
+        mask = np.zeros((len(z), len(y), len(x)), dtype=bool)
+        if len(self._samples) == 0:
+            return _read_only(mask)
+        tree = cKDTree(self._samples)
+        z_min, z_max = self._samples[:, 2].min(), self._samples[:, 2].max()
+        xy = np.column_stack(
+            [np.tile(x, len(y)), np.repeat(y, len(x)), np.empty(len(x) * len(y))]
+        )
+        for k in np.flatnonzero((z >= z_min - distance) & (z <= z_max + distance)):
+            xy[:, 2] = z[k]
+            found, _ = tree.query(xy, distance_upper_bound=distance)
+            mask[k] = np.isfinite(found).reshape(len(y), len(x))
+        return _read_only(mask)
+
+    @property
+    def node_mask(self) -> np.ndarray | None:
+        """(Z, Y, X) read-only mask of the nodes to predict, None for all.
+
+        Laid out like the result volumes. ``Modeler.predict(masked=True)``
+        only evaluates the nodes inside the mask and fills the others with
+        NaN.
+        """
+        return self.distance_mask
+
+    def _masked_node_coordinates(self) -> np.ndarray:
+        """(N, 3) coordinates of the nodes in ``node_mask``, in (Y, X, Z) order."""
+        mask = self.node_mask
+        if mask is None:
+            return self._node_coordinates()
+        iy, ix, iz = np.nonzero(mask.transpose(1, 2, 0))
+        return np.column_stack(
+            [self.X.grid[ix], self.Y.grid[iy], self.Z.grid[iz]]
+        ).astype(self._dtype, copy=False)
 
     @abstractmethod
     def prediction_points(self) -> np.ndarray:
@@ -160,6 +355,10 @@ class RegularGrid3D(Grid3D):
         z_min: Minimum Z value.
         z_max: Maximum Z value.
         gridres: Uniform grid resolution.
+        dtype: Floating point type of the full-size coordinate volumes.
+        samples: Sample coordinates, see Grid3D.
+        max_extrapolation_distance: Distance limit from the samples, see
+            Grid3D.
     """
 
     def __init__(
@@ -171,17 +370,22 @@ class RegularGrid3D(Grid3D):
         z_min: float,
         z_max: float,
         gridres: float,
+        dtype: npt.DTypeLike = np.float64,
+        samples: np.ndarray | None = None,
+        max_extrapolation_distance: float | None = None,
     ):
         super().__init__(
             x=GridAxis(Axis.X, x_min, x_max, gridres),
             y=GridAxis(Axis.Y, y_min, y_max, gridres),
             z=GridAxis(Axis.Z, z_min, z_max, gridres),
+            dtype=dtype,
+            samples=samples,
+            max_extrapolation_distance=max_extrapolation_distance,
         )
 
     def prediction_points(self) -> np.ndarray:
-        """Return all grid points as (N, 3) array."""
-        m = self.mesh
-        return np.column_stack([m["X"].ravel(), m["Y"].ravel(), m["Z"].ravel()])
+        """Return grid points, within the distance limit if any, as (N, 3)."""
+        return self._masked_node_coordinates()
 
 
 class IrregularGrid3D(Grid3D):
@@ -198,6 +402,10 @@ class IrregularGrid3D(Grid3D):
         z_max: Maximum Z value.
         z_res: Z axis resolution.
         hull: Optional convex hull geometry for XY filtering.
+        dtype: Floating point type of the full-size coordinate volumes.
+        samples: Sample coordinates, see Grid3D.
+        max_extrapolation_distance: Distance limit from the samples, see
+            Grid3D.
     """
 
     def __init__(
@@ -212,30 +420,75 @@ class IrregularGrid3D(Grid3D):
         z_max: float,
         z_res: float,
         hull: BaseGeometry | None = None,
+        dtype: npt.DTypeLike = np.float64,
+        samples: np.ndarray | None = None,
+        max_extrapolation_distance: float | None = None,
     ):
         super().__init__(
             x=GridAxis(Axis.X, x_min, x_max, x_res),
             y=GridAxis(Axis.Y, y_min, y_max, y_res),
             z=GridAxis(Axis.Z, z_min, z_max, z_res),
+            dtype=dtype,
+            samples=samples,
+            max_extrapolation_distance=max_extrapolation_distance,
         )
         self._hull = hull
 
+    @property
+    def hull(self) -> BaseGeometry | None:
+        """Convex hull filtering the XY nodes, if any."""
+        return self._hull
+
+    @cached_property
+    def hull_mask(self) -> np.ndarray | None:
+        """(Y, X) read-only mask of the XY nodes inside the hull.
+
+        Computed once with shapely's vectorized ``contains_xy`` on the XY
+        lattice; every Z level shares it. None without a hull.
+        """
+        if self._hull is None:
+            return None
+        mask = shapely.contains_xy(
+            self._hull, self.X.grid[np.newaxis, :], self.Y.grid[:, np.newaxis]
+        )
+        return _read_only(np.asarray(mask, dtype=bool))
+
+    @property
+    def node_mask(self) -> np.ndarray | None:
+        """Hull mask broadcast along Z, combined with the distance mask."""
+        return self._node_mask
+
+    @cached_property
+    def _node_mask(self) -> np.ndarray | None:
+        """Combined mask, computed on first use."""
+        hull_mask = self.hull_mask
+        distance_mask = self.distance_mask
+        if hull_mask is None:
+            return distance_mask
+        if distance_mask is None:
+            return np.broadcast_to(hull_mask, (len(self.Z.grid), *hull_mask.shape))
+        return _read_only(distance_mask & hull_mask)
+
     def prediction_points(self) -> np.ndarray:
-        """Return grid points filtered by convex hull if available."""
-        m = self.mesh
-        points = np.column_stack([m["X"].ravel(), m["Y"].ravel(), m["Z"].ravel()])
-        if self._hull is not None:
-            from shapely import Point
+        """Return grid points filtered by convex hull if available.
+
+        Points are in (Y, X, Z) order, as in ``mesh``. Only the nodes
+        inside the hull, and within the distance limit if any, are built.
+        """
+        return self._masked_node_coordinates()
+
 
-            mask = np.array([self._hull.contains(Point(p[0], p[1])) for p in points])
-            filtered: np.ndarray = points[mask]
-            return filtered
-        return points
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Mark an array read-only and return it."""
+    array.flags.writeable = False
+    return array
 
 
 def create_grid(
     griddata: GridData,
     resolution: float | dict[str, float],
+    dtype: npt.DTypeLike | None = None,
+    max_extrapolation_distance: float | None = None,
 ) -> Grid3D:
     """Factory to create the appropriate Grid3D from data and resolution.
 
@@ -243,15 +496,23 @@ def create_grid(
         griddata: Source data to derive grid extents from.
         resolution: Uniform float for RegularGrid3D,
             or per-axis dict for IrregularGrid3D.
+        dtype: Floating point type of the grid's coordinate volumes.
+            Defaults to the dtype of ``griddata``.
+        max_extrapolation_distance: Skip grid nodes further than this 3D
+            distance from every sample of ``griddata``. None predicts nodes
+            at any distance.
 
     Returns:
         A Grid3D subclass instance.
 
     Raises:
         TypeError: If resolution type is unsupported.
+        ValueError: If max_extrapolation_distance is not positive.
     """
     specs = griddata.specs
     res = GridResolution.from_input(resolution)
+    dtype = griddata.dtype if dtype is None else np.dtype(dtype)
+    samples = None if max_extrapolation_distance is None else griddata.numpy_data[:, :3]
 
     if isinstance(resolution, (int, float)):
         return RegularGrid3D(
@@ -262,6 +523,9 @@ def create_grid(
             z_min=specs.zmin,
             z_max=specs.zmax,
             gridres=res.x,
+            dtype=dtype,
+            samples=samples,
+            max_extrapolation_distance=max_extrapolation_distance,
         )
     if isinstance(resolution, dict):
         return IrregularGrid3D(
@@ -275,6 +539,9 @@ def create_grid(
             z_max=specs.zmax,
             z_res=res.z,
             hull=griddata.hull,
+            dtype=dtype,
+            samples=samples,
+            max_extrapolation_distance=max_extrapolation_distance,
         )
     msg = f"resolution must be float or dict, got {type(resolution)}"
     raise TypeError(msg)
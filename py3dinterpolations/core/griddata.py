@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from shapely.geometry.base import BaseGeometry
 
@@ -23,6 +24,9 @@ class GridData:
         Z: Column name for Z coordinate.
         V: Column name for value.
         preprocessing_params: Parameters from preprocessing applied to this data.
+        dtype: Floating point type of the values, e.g. ``"float32"`` for
+            visualization-grade runs. Coordinates are always kept in float64,
+            which float32 cannot replace for projected coordinates.
     """
 
     def __init__(
@@ -35,8 +39,10 @@ class GridData:
         Z: str = "Z",
         V: str = "V",
         preprocessing_params: PreprocessingParams | None = None,
+        dtype: npt.DTypeLike = np.float64,
     ):
         self.preprocessing_params = preprocessing_params
+        self.dtype = np.dtype(dtype)
         self.columns = {"ID": ID, "X": X, "Y": Y, "Z": Z, "V": V}
         self.data = self._set_data(data)
 
@@ -45,7 +51,7 @@ class GridData:
         df = data.copy()[list(self.columns.values())]
         df = df.rename(columns={v: k for k, v in self.columns.items()})
         df = df.set_index(["ID", "X", "Y", "Z"])
-        df["V"] = df["V"].astype(float)
+        df["V"] = df["V"].astype(self.dtype)
         return df.sort_index(ascending=False)
 
     @property
@@ -37,6 +37,21 @@ class ModelType(StrEnum):
     IDW = "idw"
 
 
+class KrigingSolver(StrEnum):
+    """Solvers for global ordinary kriging systems."""
+
+    PYKRIGE = "pykrige"
+    NATIVE = "native"
+
+
+class SearchStrategy(StrEnum):
+    """Hyperparameter search strategies for Estimator."""
+
+    GRID = "grid"
+    RANDOM = "random"
+    HALVING = "halving"
+
+
 class DownsamplingStatistic(StrEnum):
     """Supported downsampling statistics."""
 
@@ -1,20 +1,40 @@
 """Modelling pipeline for 3D interpolation."""
 
-from .estimator import Estimator
+from .estimator import Estimator, IDWEstimator, SearchKwargs
 from .interpolate import interpolate
 from .modeler import Modeler
-from .models import BaseModel, IDWModel, KrigingModel, SklearnModel, get_model
-from .preprocessor import PreprocessingKwargs, Preprocessor, reverse_preprocessing
+from .models import (
+    BaseModel,
+    ExperimentalVariogram,
+    IDWModel,
+    KrigingModel,
+    SearchEllipsoid,
+    SklearnModel,
+    experimental_variogram,
+    get_model,
+)
+from .preprocessor import (
+    PreprocessingKwargs,
+    Preprocessor,
+    apply_preprocessing,
+    reverse_preprocessing,
+)
 
 __all__ = [
     "BaseModel",
     "Estimator",
+    "ExperimentalVariogram",
+    "IDWEstimator",
     "IDWModel",
     "KrigingModel",
     "Modeler",
     "PreprocessingKwargs",
     "Preprocessor",
+    "SearchEllipsoid",
+    "SearchKwargs",
     "SklearnModel",
+    "apply_preprocessing",
+    "experimental_variogram",
     "get_model",
     "interpolate",
     "reverse_preprocessing",
@@ -1,23 +1,389 @@
 """Cross-validation parameter estimation for interpolation models."""
 
-from typing import cast
+import hashlib
+import itertools
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any, TypedDict, cast
 
+import numpy as np
+import scipy.linalg
+from pykrige.ok3d import OrdinaryKriging3D
 from pykrige.rk import Krige
-from sklearn.model_selection import GridSearchCV
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist, pdist, squareform
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import (
+    GridSearchCV,
+    HalvingGridSearchCV,
+    ParameterGrid,
+    ParameterSampler,
+    RandomizedSearchCV,
+    cross_val_score,
+)
 
 from ..core.griddata import GridData
+from ..core.types import SearchStrategy
+from .models import IDWModel
+from .models.compat import (
+    adjust_for_anisotropy,
+    fit_variogram_model,
+    variogram_parameter_list,
+)
+
+logger = logging.getLogger(__name__)
+
+# Leave-one-out scores, higher is better as in sklearn's scoring strings
+_SCORERS: dict[str, Callable[[np.ndarray, np.ndarray], float]] = {
+    "neg_mean_absolute_error": lambda y, p: -float(mean_absolute_error(y, p)),
+    "neg_mean_squared_error": lambda y, p: -float(mean_squared_error(y, p)),
+    "neg_root_mean_squared_error": lambda y, p: (
+        -float(np.sqrt(mean_squared_error(y, p)))
+    ),
+    "r2": lambda y, p: float(r2_score(y, p)),
+}
+
+# Smallest subsample scored by successive halving; smaller folds leave too
+# few pairs to fit a variogram and too few neighbours for the moving window
+_HALVING_MIN_SAMPLES = 50
+
+# Number of training folds whose distances are kept per search and process,
+# and the memory they may hold beyond the most recent fold
+_FOLD_CACHE_SIZE = 8
+_FOLD_CACHE_BYTES = 1024**3
+
+
+class _FoldDistances:
+    """Distances of one training fold, shared by every search candidate.
+
+    Coordinates are adjusted for anisotropy as in pykrige's
+    OrdinaryKriging3D, so these distances are the ones pykrige would
+    recompute for each candidate.
+
+    Args:
+        points: (N, 3) training coordinates.
+        values: (N,) training values.
+        scaling: pykrige's (y, z) anisotropy scaling.
+        angles: pykrige's (x, y, z) anisotropy angles.
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        values: np.ndarray,
+        scaling: tuple[float, float],
+        angles: tuple[float, float, float],
+    ):
+        self._center = (points.max(axis=0) + points.min(axis=0)) / 2.0
+        self._scaling = list(scaling)
+        self._angles = list(angles)
+        self.adjusted = self._adjust(points)
+        self._lags = pdist(self.adjusted)
+        self._semivariance = 0.5 * pdist(values[:, np.newaxis], "sqeuclidean")
+        self.square = squareform(self._lags)
+        # pykrige queries its KD-tree with (z, y, x) columns
+        self._tree = cKDTree(self.adjusted[:, ::-1])
+        self._lock = threading.Lock()
+        self._experimental: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        self._holdouts: dict[tuple[str, int | None], tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the fold's distance arrays."""
+        with self._lock:
+            holdouts = sum(d.nbytes + i.nbytes for d, i in self._holdouts.values())
+        arrays = (self.square, self._lags, self._semivariance)
+        return sum(int(array.nbytes) for array in arrays) + holdouts
+
+    def _adjust(self, points: np.ndarray) -> np.ndarray:
+        return adjust_for_anisotropy(points, self._center, self._scaling, self._angles)
+
+    def experimental_variogram(self, nlags: int) -> tuple[np.ndarray, np.ndarray]:
+        """Binned lags and semivariances, with pykrige's equal-width bins."""
+        with self._lock:
+            if nlags not in self._experimental:
+                # Same bins and summation order as pykrige, whose variogram
+                # fit is sensitive to rounding in the binned values
+                dmin, dmax = self._lags.min(), self._lags.max()
+                width = (dmax - dmin) / nlags
+                bins = [dmin + n * width for n in range(nlags)] + [dmax + 0.001]
+                lags, semivariance = [], []
+                for lo, hi in itertools.pairwise(bins):
+                    in_bin = (self._lags >= lo) & (self._lags < hi)
+                    if in_bin.any():
+                        lags.append(np.mean(self._lags[in_bin]))
+                        semivariance.append(np.mean(self._semivariance[in_bin]))
+                self._experimental[nlags] = (np.array(lags), np.array(semivariance))
+            return self._experimental[nlags]
+
+    def holdout(
+        self, points: np.ndarray, n_closest: int | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Distances from holdout points to their neighbouring training points.
+
+        Args:
+            points: (M, 3) holdout coordinates.
+            n_closest: Number of closest training points. None uses all.
+
+        Returns:
+            Tuple of (M, k) distances and (M, k) training indices.
+        """
+        key = (_digest(points), n_closest)
+        with self._lock:
+            if key not in self._holdouts:
+                adjusted = self._adjust(points)
+                if n_closest is None:
+                    distances = cdist(adjusted, self.adjusted)
+                    indices = np.broadcast_to(
+                        np.arange(len(self.adjusted)), distances.shape
+                    )
+                else:
+                    distances, indices = self._tree.query(
+                        adjusted[:, ::-1], k=n_closest, eps=0.0
+                    )
+                    distances = distances.reshape(len(points), n_closest)
+                    indices = indices.reshape(len(points), n_closest)
+                self._holdouts[key] = (distances, indices)
+            return self._holdouts[key]
+
+
+def _digest(*arrays: np.ndarray) -> str:
+    """Content hash of arrays, used to recognise a fold across candidates."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array, dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+class _FoldCache:
+    """Distances of the most recent training folds of one search.
+
+    Clones of a ``_CachedKrige`` share their cache within a process. When
+    pickled to a worker process, a cache resolves to that worker's copy for
+    the same search, so candidates scored by one worker share folds too.
+    Each copy keeps at most ``_FOLD_CACHE_SIZE`` folds, and evicts the
+    oldest ones while they hold more than ``_FOLD_CACHE_BYTES``.
+
+    Args:
+        key: Identifies the search across processes. None draws a new key.
+    """
+
+    def __init__(self, key: str | None = None):
+        self.key = uuid.uuid4().hex if key is None else key
+        self._folds: OrderedDict[str, _FoldDistances] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __reduce__(self) -> tuple[Callable[[str], "_FoldCache"], tuple[str]]:
+        return _worker_fold_cache, (self.key,)
+
+    def get(
+        self,
+        points: np.ndarray,
+        values: np.ndarray,
+        scaling: tuple[float, float],
+        angles: tuple[float, float, float],
+    ) -> _FoldDistances:
+        """Cached distances of a training fold, computed on first use."""
+        key = _digest(points, values, np.asarray(scaling), np.asarray(angles))
+        with self._lock:
+            fold = self._folds.get(key)
+            if fold is not None:
+                self._folds.move_to_end(key)
+                return fold
+        fold = _FoldDistances(points, values, scaling, angles)
+        with self._lock:
+            self._folds[key] = fold
+            held = sum(cached.nbytes for cached in self._folds.values())
+            while len(self._folds) > _FOLD_CACHE_SIZE or (
+                held > _FOLD_CACHE_BYTES and len(self._folds) > 1
+            ):
+                _, evicted = self._folds.popitem(last=False)
+                held -= evicted.nbytes
+        return fold
+
+    def clear(self) -> None:
+        """Release every cached fold."""
+        with self._lock:
+            self._folds.clear()
+
+
+# Worker processes keep the cache of the search they last served; a task
+# of another search releases it
+_worker_fold_caches: dict[str, _FoldCache] = {}
+_worker_fold_caches_lock = threading.Lock()
+
+
+def _worker_fold_cache(key: str) -> _FoldCache:
+    """This process's fold cache of the search ``key``."""
+    with _worker_fold_caches_lock:
+        cache = _worker_fold_caches.get(key)
+        if cache is None:
+            _worker_fold_caches.clear()
+            cache = _worker_fold_caches[key] = _FoldCache(key)
+        return cache
+
+
+class _CachedKrige(Krige):  # type: ignore[misc]
+    """pykrige's Krige with fold-wise distances cached across candidates.
+
+    Candidates fitted on the same training fold share its pairwise and
+    holdout distances and its binned experimental variogram, so each one
+    only fits and evaluates the variogram function and solves its kriging
+    systems. Predictions follow ``Krige.predict``: a moving window of
+    ``n_closest_points`` samples, solved in one batch. Settings other than
+    3D ordinary kriging with a built-in variogram model fall back to
+    pykrige.
+
+    Folds are cached in ``fold_cache``, which clones share; without one,
+    each fit computes its fold's distances.
+    """
+
+    fold_cache: _FoldCache | None = None
+
+    def __sklearn_clone__(self) -> "_CachedKrige":
+        clone = cast(_CachedKrige, super().__sklearn_clone__())
+        clone.fold_cache = self.fold_cache
+        return clone
+
+    def _is_cacheable(self, n_samples: int) -> bool:
+        return bool(
+            self.method == "ordinary3d"
+            and self.variogram_model in OrdinaryKriging3D.variogram_dict
+            and not self.pseudo_inv
+            and self.coordinates_type == "euclidean"
+            and (self.n_closest_points is None or self.n_closest_points <= n_samples)
+        )
+
+    def fit(
+        self, x: np.ndarray, y: np.ndarray, *args: object, **kwargs: object
+    ) -> None:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self._fold: _FoldDistances | None = None
+        if not self._is_cacheable(len(x)):
+            super().fit(x, y, *args, **kwargs)
+            return
+
+        scaling = (self.anisotropy_scaling[0], self.anisotropy_scaling[1])
+        angles = (
+            self.anisotropy_angle[0],
+            self.anisotropy_angle[1],
+            self.anisotropy_angle[2],
+        )
+        if self.fold_cache is None:
+            fold = _FoldDistances(x, y, scaling, angles)
+        else:
+            fold = self.fold_cache.get(x, y, scaling, angles)
+        function = OrdinaryKriging3D.variogram_dict[self.variogram_model]
+        parameters = variogram_parameter_list(
+            self.variogram_model, self.variogram_parameters
+        )
+        if parameters is None:
+            lags, semivariance = fold.experimental_variogram(self.nlags)
+            parameters = fit_variogram_model(
+                lags, semivariance, self.variogram_model, function, self.weight
+            )
+        self._fold = fold
+        self._values = y
+        self._variogram: Callable[[np.ndarray], np.ndarray] = lambda d: function(
+            parameters, d
+        )
+        self.model = fold
+
+    def predict(self, x: np.ndarray, *args: object, **kwargs: object) -> np.ndarray:
+        if getattr(self, "_fold", None) is None:
+            return cast(np.ndarray, super().predict(x, *args, **kwargs))
+        fold = self._fold
+        assert fold is not None
+        distances, indices = fold.holdout(
+            np.asarray(x, dtype=float), self.n_closest_points
+        )
+        n_query, k = distances.shape
+        n = len(self._values)
+
+        # The kriging matrix of the fold, with the Lagrange row last
+        a_all = np.ones((n + 1, n + 1))
+        a_all[:n, :n] = -self._variogram(fold.square)
+        np.fill_diagonal(a_all, 0.0)
+
+        b = np.empty((n_query, k + 1))
+        b[:, :k] = -self._variogram(distances)
+        if self.exact_values:
+            b[:, :k][np.abs(distances) <= OrdinaryKriging3D.eps] = 0.0
+        b[:, k] = 1.0
+
+        if self.n_closest_points is None:
+            weights = scipy.linalg.solve(a_all, b.T).T
+            return np.asarray(weights[:, :n] @ self._values)
+        selector = np.column_stack([indices, np.full(n_query, n)])
+        a = a_all[selector[:, :, np.newaxis], selector[:, np.newaxis, :]]
+        weights = np.linalg.solve(a, b[:, :, np.newaxis])[:, :, 0]
+        return np.asarray((weights[:, :k] * self._values[indices]).sum(axis=1))
+
+
+class SearchKwargs(TypedDict, total=False):
+    """Type-safe kwargs for Estimator's search strategy."""
+
+    n_iter: int
+    time_budget: float | None
+    patience: int | None
+    random_state: int | None
+    n_jobs: int | None
 
 
 class Estimator:
-    """Parameter estimation via sklearn GridSearchCV.
+    """Parameter estimation via sklearn cross-validation searches.
 
     Currently supports pykrige's Krige wrapper for cross-validation.
 
+    The ``search`` strategy controls how many candidates are evaluated:
+
+    - ``"grid"`` scores every combination with ``GridSearchCV``.
+    - ``"random"`` scores ``n_iter`` combinations sampled from ``params``,
+      whose values may also be scipy distributions.
+    - ``"halving"`` runs successive halving on sample subsets
+      (``HalvingGridSearchCV``): every combination is first scored on a
+      small random subsample, and only the best third of them advances to
+      the next round on three times as many samples, up to the full data.
+
+    With ``time_budget`` or ``patience``, grid and random candidates are
+    scored one after the other, and the search stops early once the budget
+    is spent or the best score has not improved for ``patience``
+    candidates. Results then only list the evaluated candidates.
+
     Args:
         griddata: Training data.
-        params: Parameter grid for GridSearchCV.
+        params: Parameter grid (or distributions, for random search).
         scoring: Scoring method. See sklearn docs.
         verbose: Verbosity level (0-3).
+        n_jobs: Number of processes evaluating candidates and folds in
+            parallel, as in sklearn. None runs serially, -1 uses all CPUs.
+        cache_distances: Compute each fold's sample-sample and
+            sample-holdout distances once per search and process and share
+            them among candidates, so a candidate only fits the variogram and
+            solves. Costs about two N x N arrays per cached fold, with at
+            most 8 folds and about 1 GB per process. The calling process
+            releases its folds once the search is done; worker processes
+            keep theirs until they serve another search or sit idle long
+            enough for joblib to stop them. False runs pykrige's Krige
+            unchanged.
+        search: Search strategy, see above.
+        n_iter: Number of candidates sampled by random search.
+        time_budget: Seconds after which no further grid or random
+            candidate is started. None has no limit.
+        patience: Stop grid or random search after this many consecutive
+            candidates without a better score. None never stops early.
+        random_state: Seed for candidate sampling and halving subsamples.
+
+    Raises:
+        ValueError: If ``time_budget`` or ``patience`` is combined with
+            halving, or if no evaluated candidate could be scored.
     """
 
     def __init__(
@@ -26,26 +392,268 @@ class Estimator:
         params: dict[str, list[object]],
         scoring: str = "neg_mean_absolute_error",
         verbose: int = 3,
+        n_jobs: int | None = None,
+        cache_distances: bool = True,
+        search: SearchStrategy | str = SearchStrategy.GRID,
+        n_iter: int = 10,
+        time_budget: float | None = None,
+        patience: int | None = None,
+        random_state: int | None = None,
     ):
-        self.estimator = GridSearchCV(
-            Krige(),
-            params,
-            scoring=scoring,
-            verbose=verbose,
-        )
-        self.estimator.fit(
-            y=griddata.numpy_data[:, 3],
-            X=griddata.numpy_data[:, 0:3],
+        search = SearchStrategy(search)
+        if time_budget is not None and time_budget <= 0:
+            msg = f"time_budget must be positive, got {time_budget}"
+            raise ValueError(msg)
+        if patience is not None and patience < 1:
+            msg = f"patience must be a positive integer, got {patience}"
+            raise ValueError(msg)
+        budgeted = time_budget is not None or patience is not None
+        if budgeted and search == SearchStrategy.HALVING:
+            msg = "time_budget and patience only apply to grid and random search"
+            raise ValueError(msg)
+
+        krige: Krige = Krige()
+        fold_cache = None
+        if cache_distances:
+            fold_cache = _FoldCache()
+            krige = _CachedKrige()
+            krige.fold_cache = fold_cache
+        X = griddata.numpy_data[:, 0:3]
+        y = griddata.numpy_data[:, 3]
+
+        candidates: Iterable[dict[str, object]]
+        if search == SearchStrategy.RANDOM:
+            if all(isinstance(values, list) for values in params.values()):
+                # Sampling a finite grid draws each combination at most once
+                n_iter = min(n_iter, len(ParameterGrid(params)))
+            candidates = ParameterSampler(params, n_iter, random_state=random_state)
+        else:
+            candidates = ParameterGrid(params)
+
+        self.estimator: (
+            GridSearchCV | RandomizedSearchCV | HalvingGridSearchCV | None
+        ) = None
+        try:
+            if budgeted:
+                self._cv_results = _sequential_search(
+                    krige, candidates, X, y, scoring, n_jobs, time_budget, patience
+                )
+                self._best_index = int(np.argmin(self._cv_results["rank_test_score"]))
+                return
+            if search == SearchStrategy.GRID:
+                self.estimator = GridSearchCV(
+                    krige, params, scoring=scoring, verbose=verbose, n_jobs=n_jobs
+                )
+            elif search == SearchStrategy.RANDOM:
+                self.estimator = RandomizedSearchCV(
+                    krige,
+                    params,
+                    n_iter=n_iter,
+                    scoring=scoring,
+                    verbose=verbose,
+                    n_jobs=n_jobs,
+                    random_state=random_state,
+                )
+            else:
+                self.estimator = HalvingGridSearchCV(
+                    krige,
+                    params,
+                    min_resources=_halving_min_samples(
+                        len(y), len(ParameterGrid(params))
+                    ),
+                    scoring=scoring,
+                    verbose=verbose,
+                    n_jobs=n_jobs,
+                    random_state=random_state,
+                )
+
+            self.estimator.fit(X=X, y=y)
+        finally:
+            # Cached folds hold two N x N arrays each, only needed while searching
+            if fold_cache is not None:
+                fold_cache.clear()
+        self._cv_results = cast(dict[str, Any], self.estimator.cv_results_)
+        self._best_index = cast(int, self.estimator.best_index_)
+
+    @property
+    def best_params(self) -> dict[str, object]:
+        if self.estimator is not None:
+            return cast(dict[str, object], self.estimator.best_params_)
+        return cast(dict[str, object], self._cv_results["params"][self._best_index])
+
+    @property
+    def best_score(self) -> float:
+        if self.estimator is not None:
+            return cast(float, self.estimator.best_score_)
+        return float(self._cv_results["mean_test_score"][self._best_index])
+
+    @property
+    def cv_results(self) -> dict[str, object]:
+        return self._cv_results
+
+
+def _halving_min_samples(n_samples: int, n_candidates: int, factor: int = 3) -> int:
+    """Subsample size of the first halving round.
+
+    Chosen so that the last round scores the surviving candidates on all
+    samples, with no round smaller than ``_HALVING_MIN_SAMPLES``.
+    """
+    rounds = 0
+    while (
+        factor**rounds < n_candidates
+        and n_samples // factor ** (rounds + 1) >= _HALVING_MIN_SAMPLES
+    ):
+        rounds += 1
+    return int(n_samples // factor**rounds)
+
+
+def _sequential_search(
+    estimator: object,
+    candidates: Iterable[dict[str, object]],
+    X: np.ndarray,
+    y: np.ndarray,
+    scoring: str,
+    n_jobs: int | None,
+    time_budget: float | None,
+    patience: int | None,
+) -> dict[str, Any]:
+    """Score candidates one by one until the budget or patience runs out.
+
+    Folds are the same as in sklearn's searches, so scores are comparable.
+    Failed fits score NaN, like sklearn's ``error_score=nan``.
+    """
+    start = time.perf_counter()
+    evaluated: list[dict[str, object]] = []
+    scores: list[float] = []
+    best = -np.inf
+    stale = 0
+    for candidate in candidates:
+        elapsed = time.perf_counter() - start
+        if evaluated and time_budget is not None and elapsed >= time_budget:
+            logger.info(
+                "Search stopped after %d candidates: time budget of %.1f s spent",
+                len(evaluated),
+                time_budget,
+            )
+            break
+        model = clone(estimator).set_params(**candidate)
+        fold_scores = cross_val_score(
+            model, X, y, scoring=scoring, n_jobs=n_jobs, error_score=np.nan
         )
+        score = float(np.mean(fold_scores))
+        logger.info("Cross-validation: %s -> %s", candidate, score)
+        evaluated.append(candidate)
+        scores.append(score)
+
+        if score > best:
+            best, stale = score, 0
+        else:
+            stale += 1
+        if patience is not None and stale >= patience:
+            logger.info(
+                "Search stopped after %d candidates: no improvement in %d",
+                len(evaluated),
+                patience,
+            )
+            break
+
+    mean_test_score = np.array(scores)
+    if np.isnan(mean_test_score).all():
+        msg = "No parameter combination could be scored"
+        raise ValueError(msg)
+    return {
+        "params": evaluated,
+        "mean_test_score": mean_test_score,
+        "rank_test_score": _rank(mean_test_score),
+    }
+
+
+def _rank(scores: np.ndarray) -> np.ndarray:
+    """Ranks of scores, best first; NaN ranks last and ties share a rank."""
+    ranked = np.where(np.isnan(scores), -np.inf, scores)
+    return np.searchsorted(np.sort(-ranked), -ranked, side="left") + 1
+
+
+class IDWEstimator:
+    """Parameter estimation for IDW via leave-one-out cross-validation.
+
+    Leave-one-out residuals are computed in closed form from a single
+    distance pass per combination of the non-``power`` parameters, see
+    ``IDWModel.predict_leave_one_out``; all powers share that pass and no
+    model is refitted per fold.
+
+    A combination that leaves any sample without an estimate (e.g. a
+    ``max_distance`` smaller than its nearest neighbour) scores NaN and is
+    never selected, like a failed fit with sklearn's ``error_score=nan``.
+
+    Args:
+        griddata: Training data.
+        params: Parameter grid over IDWModel constructor arguments.
+        scoring: One of ``"neg_mean_absolute_error"``,
+            ``"neg_mean_squared_error"``, ``"neg_root_mean_squared_error"``
+            or ``"r2"``.
+
+    Raises:
+        ValueError: If the scoring method is unknown or no combination
+            produces a score.
+    """
+
+    def __init__(
+        self,
+        griddata: GridData,
+        params: dict[str, list[object]],
+        scoring: str = "neg_mean_absolute_error",
+    ):
+        if scoring not in _SCORERS:
+            msg = f"Unknown scoring {scoring!r}, expected one of {list(_SCORERS)}"
+            raise ValueError(msg)
+        scorer = _SCORERS[scoring]
+
+        grid = dict(params)
+        powers = cast(list[float] | None, grid.pop("power", None))
+        data = griddata.numpy_data
+        x, y, z, v = data[:, 0], data[:, 1], data[:, 2], data[:, 3]
+
+        # None keeps each model's own power
+        labels: list[float | None] = [None] if powers is None else list(powers)
+        candidates: list[dict[str, object]] = []
+        scores: list[float] = []
+        for model_params in ParameterGrid(grid):
+            model = IDWModel(**model_params)
+            model.fit(x, y, z, v)
+            estimates = model.predict_leave_one_out(powers)
+            for power, estimate in zip(labels, estimates, strict=True):
+                candidate = dict(model_params)
+                if power is not None:
+                    candidate["power"] = power
+                score = scorer(v, estimate) if np.isfinite(estimate).all() else np.nan
+                logger.info("IDW leave-one-out: %s -> %s", candidate, score)
+                candidates.append(candidate)
+                scores.append(score)
+
+        mean_test_score = np.array(scores)
+        if np.isnan(mean_test_score).all():
+            msg = "No parameter combination estimated every sample"
+            raise ValueError(msg)
+        rank = _rank(mean_test_score)
+
+        self._best_index = int(np.argmin(rank))
+        self._cv_results: dict[str, object] = {
+            "params": candidates,
+            "mean_test_score": mean_test_score,
+            "rank_test_score": rank,
+        }
 
     @property
     def best_params(self) -> dict[str, object]:
-        return cast(dict[str, object], self.estimator.best_params_)
+        params = cast(list[dict[str, object]], self._cv_results["params"])
+        return params[self._best_index]
 
     @property
     def best_score(self) -> float:
-        return cast(float, self.estimator.best_score_)
+        scores = cast(np.ndarray, self._cv_results["mean_test_score"])
+        return float(scores[self._best_index])
 
     @property
     def cv_results(self) -> dict[str, object]:
-        return cast(dict[str, object], self.estimator.cv_results_)
+        return self._cv_results
@@ -1,11 +1,15 @@
 """Top-level interpolation function."""
 
 import logging
+from pathlib import Path
+from typing import Any, cast
+
+import numpy.typing as npt
 
 from ..core.grid3d import create_grid
 from ..core.griddata import GridData
-from ..core.types import ModelType
-from .estimator import Estimator
+from ..core.types import ModelType, SearchStrategy
+from .estimator import Estimator, IDWEstimator, SearchKwargs
 from .modeler import Modeler
 from .models import get_model
 from .preprocessor import PreprocessingKwargs, Preprocessor
@@ -19,7 +23,13 @@ def interpolate(
     grid_resolution: float | dict[str, float],
     model_params: dict[str, object] | None = None,
     model_params_grid: dict[str, list[object]] | None = None,
+    search: SearchStrategy | str = SearchStrategy.GRID,
+    search_kwargs: SearchKwargs | None = None,
     preprocessing: PreprocessingKwargs | None = None,
+    memory_limit: int | str | None = None,
+    dtype: npt.DTypeLike | None = None,
+    output_path: str | Path | None = None,
+    max_extrapolation_distance: float | None = None,
     **predict_kwargs: object,
 ) -> Modeler:
     """Interpolate GridData and return the Modeler with results.
@@ -30,16 +40,37 @@ def interpolate(
         grid_resolution: Grid resolution. Float for regular, dict for irregular.
         model_params: Model constructor parameters.
         model_params_grid: Parameter grid for cross-validation search.
+            IDW is scored by leave-one-out cross-validation, see
+            ``IDWEstimator``.
+        search: Search strategy over ``model_params_grid`` for kriging:
+            ``"grid"``, ``"random"`` or ``"halving"``. See ``Estimator``.
+        search_kwargs: Keyword args for the search (e.g. n_iter,
+            time_budget, patience, random_state, n_jobs).
         preprocessing: Keyword args for Preprocessor
             (e.g. downsampling_res, normalize_xyz).
-        **predict_kwargs: Extra kwargs passed to model.predict().
+        memory_limit: Memory budget for prediction temporaries, in bytes or
+            as a string such as ``"2GB"``. Passed to the model, which sizes
+            its batches from it.
+        dtype: Floating point type used by the grid, the model and the
+            result, e.g. ``"float32"``. Defaults to the dtype of ``griddata``.
+        output_path: Directory for disk-backed result arrays. When given,
+            the grid is predicted slab by slab into memory-mapped ``.npy``
+            files instead of RAM. See ``Modeler.predict``.
+        max_extrapolation_distance: Skip grid nodes further than this 3D
+            distance from every sample, in the units of ``griddata``; they
+            are NaN in the result. For irregular grids, nodes outside the
+            convex hull of the samples are skipped too. See ``create_grid``
+            and the ``masked`` option of ``Modeler.predict``.
+        **predict_kwargs: Extra kwargs passed to model.predict(), e.g.
+            ``compute_variance=False`` for kriging, or ``variance_stride=4``
+            for local or native kriging.
 
     Returns:
         Modeler instance with .result populated.
 
     Raises:
-        ValueError: If neither or both model_params/model_params_grid are given.
-        NotImplementedError: If parameter search is used for non-kriging models.
+        ValueError: If neither or both model_params/model_params_grid are given,
+            or if IDW is given a search other than ``"grid"``.
     """
     logger.info("Starting interpolation with model=%s", model_type)
 
@@ -50,8 +81,16 @@ def interpolate(
         msg = "Cannot provide both model_params and model_params_grid"
         raise ValueError(msg)
 
+    if dtype is None:
+        dtype = griddata.dtype
+
     # Build grid
-    grid = create_grid(griddata, grid_resolution)
+    grid = create_grid(
+        griddata,
+        grid_resolution,
+        dtype=dtype,
+        max_extrapolation_distance=max_extrapolation_distance,
+    )
 
     # Preprocess if needed
     if preprocessing is not None:
@@ -60,22 +99,34 @@ def interpolate(
 
     # Parameter search via estimator
     if model_params is None:
-        model_type_enum = ModelType(model_type)
-        if model_type_enum != ModelType.ORDINARY_KRIGING:
-            msg = "Parameter search is only supported for ordinary_kriging"
-            raise NotImplementedError(msg)
-
         assert model_params_grid is not None
-        est = Estimator(griddata, model_params_grid)
+        est: Estimator | IDWEstimator
+        if ModelType(model_type) == ModelType.IDW:
+            if SearchStrategy(search) != SearchStrategy.GRID or search_kwargs:
+                msg = "IDW parameter grids are always searched exhaustively"
+                raise ValueError(msg)
+            est = IDWEstimator(griddata, model_params_grid)
+        else:
+            est = Estimator(
+                griddata, model_params_grid, search=search, **(search_kwargs or {})
+            )
         model_params = dict(est.best_params)
         model_params.pop("method", None)
 
-    # Build and fit model
+    # Build the model, fitted by the first prediction
+    model_params = {**model_params, "dtype": dtype}
+    if memory_limit is not None:
+        model_params["memory_limit"] = memory_limit
     model = get_model(model_type, **model_params)
     modeler = Modeler(griddata=griddata, grid=grid, model=model)
 
-    # Predict
-    modeler.predict(**predict_kwargs)
+    # Predict, skipping masked nodes only when the caller asked for it
+    predict_kwargs.setdefault("masked", max_extrapolation_distance is not None)
+    modeler.predict(
+        dtype=dtype,
+        output_path=output_path,
+        **cast(dict[str, Any], predict_kwargs),
+    )
 
     logger.info("Interpolation complete")
     return modeler
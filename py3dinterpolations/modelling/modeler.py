@@ -1,50 +1,124 @@
 """High-level modelling orchestrator."""
 
 import logging
+from collections.abc import Iterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
 
 import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import shapely
 
-from ..core.grid3d import Grid3D
+from ..core.grid3d import Grid3D, GridTile, IrregularGrid3D, RegularGrid3D
 from ..core.griddata import GridData
-from ..core.types import InterpolationResult
-from .models.base import BaseModel
+from ..core.types import (
+    Axis,
+    DownsamplingParams,
+    InterpolationResult,
+    NormalizationParams,
+    PreprocessingParams,
+    StandardizationParams,
+)
+from .models.base import BaseModel, check_points
+from .models.persistence import load_state, prefixed, save_state
+from .preprocessor import apply_preprocessing
 
 logger = logging.getLogger(__name__)
 
+# Approximate number of grid nodes per slab in out-of-core prediction
+_SLAB_NODES = 1_000_000
+
+# Metadata file of a saved Modeler; the model is saved in a subdirectory
+_MODELER_FILE = "modeler.json"
+_MODEL_DIR = "model"
+_COLUMNS = ("ID", "X", "Y", "Z", "V")
+_RESULT_FIELDS = ("interpolated", "variance", "probability")
+
 
 class Modeler:
     """Orchestrates fitting a model and predicting on a 3D grid.
 
     Handles normalization-aware grid selection and standardization reversal.
 
+    The model is fitted lazily, on the first call to ``predict``, ``update``
+    or ``save``, or explicitly with ``fit``. Once fitted, it can predict on
+    any number of grids: pass ``grid`` to ``predict`` to switch grids
+    without refitting. Use ``from_fitted`` to wrap a model that was already
+    fitted on the training data.
+
     Args:
         griddata: Training data.
-        grid: 3D grid for predictions.
-        model: Fitted or unfitted BaseModel instance. Will be fit on construction.
+        grid: 3D grid for predictions. None requires a grid to be passed to
+            ``predict``.
+        model: Unfitted BaseModel instance, fitted on ``griddata`` when
+            first needed.
     """
 
     def __init__(
         self,
         griddata: GridData,
-        grid: Grid3D,
+        grid: Grid3D | None,
         model: BaseModel,
     ):
         self._griddata = griddata
         self._grid = grid
         self._model = model
+        self._fitted = False
         self._result: InterpolationResult | None = None
+        self._last_predict: dict[str, Any] | None = None
 
-        # Fit the model on training data
-        data = griddata.numpy_data
+    @classmethod
+    def from_fitted(
+        cls, model: BaseModel, griddata: GridData, grid: Grid3D | None = None
+    ) -> "Modeler":
+        """Wrap a model that was already fitted on ``griddata``.
+
+        The model is not refitted. ``griddata`` must be the (preprocessed)
+        data it was fitted on: its preprocessing parameters map grids to the
+        model's coordinates and reverse standardization of the results.
+
+        Args:
+            model: Fitted model.
+            griddata: Training data of the model.
+            grid: 3D grid for predictions. None requires a grid to be passed
+                to ``predict``.
+
+        Returns:
+            A Modeler ready to predict.
+        """
+        modeler = cls(griddata, grid, model)
+        modeler._fitted = True
+        return modeler
+
+    def fit(self) -> "Modeler":
+        """Fit the model on the training data.
+
+        Called automatically when first needed; call it explicitly to fit
+        up front, or to refit after the model was changed.
+
+        Returns:
+            This Modeler.
+        """
+        data = self._griddata.numpy_data
         self._model.fit(data[:, 0], data[:, 1], data[:, 2], data[:, 3])
-        logger.info("Model %s fitted on %d points", model.name, len(data))
+        self._fitted = True
+        logger.info("Model %s fitted on %d points", self._model.name, len(data))
+        return self
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether the model has been fitted on the training data."""
+        return self._fitted
 
     @property
     def griddata(self) -> GridData:
         return self._griddata
 
     @property
-    def grid(self) -> Grid3D:
+    def grid(self) -> Grid3D | None:
+        """Grid of the last prediction, or the grid given at construction."""
         return self._grid
 
     @property
@@ -55,49 +129,622 @@ class Modeler:
     def result(self) -> InterpolationResult | None:
         return self._result
 
-    def predict(self, **kwargs: object) -> np.ndarray:
+    def predict(
+        self,
+        grid: Grid3D | None = None,
+        dtype: npt.DTypeLike | None = None,
+        output_path: str | Path | None = None,
+        slab_size: int | None = None,
+        masked: bool = False,
+        **kwargs: object,
+    ) -> np.ndarray:
         """Make predictions, handling normalization and standardization reversal.
 
+        With ``masked=True`` and a grid that has a node mask, e.g. the
+        convex hull of an ``IrregularGrid3D``, only the nodes inside it are
+        predicted, by passing the mask to the model's ``predict`` as its
+        ``mask`` keyword, and the others are NaN, so the cost scales with
+        the footprint of the data rather than with its bounding box.
+
+        With ``output_path``, prediction runs out-of-core: the grid is
+        predicted one slab of Z levels at a time and each slab is written to
+        disk-backed ``.npy`` files (``interpolated.npy`` and, when the model
+        provides them, ``variance.npy`` and ``probability.npy``) in that
+        directory. The result then holds read-only memory maps of those
+        files, so the volume never needs to fit in RAM.
+
+        Args:
+            grid: Grid to predict on. It becomes the Modeler's grid, and the
+                result is attached to it, so that a single fit can serve
+                several grids, e.g. a coarse preview and a fine production
+                grid, each keeping its own result. None predicts on the
+                current grid.
+            dtype: Floating point type of the result arrays. Defaults to the
+                dtype of the training data.
+            output_path: Directory for the disk-backed result arrays.
+                None keeps the result in memory.
+            slab_size: Number of Z levels predicted per slab in out-of-core
+                mode. Defaults to slabs of about one million nodes.
+            masked: Predict only the nodes inside the grid's node mask,
+                leaving the others NaN. False predicts every node of the
+                grid.
+            **kwargs: Extra kwargs passed to model.predict(), e.g.
+                ``compute_variance=False`` to skip the kriging variance.
+
         Returns:
-            Interpolated numpy array.
+            Interpolated numpy array (a memory map in out-of-core mode).
+
+        Raises:
+            ValueError: If no grid is given and the Modeler has none.
         """
+        if grid is not None:
+            self._grid = grid
+        if self._grid is None:
+            msg = "No grid to predict on, pass one to predict()"
+            raise ValueError(msg)
+        if not self._fitted:
+            self.fit()
         logger.info("Starting prediction on grid %s", self._grid)
+        self._last_predict = {
+            "dtype": dtype,
+            "output_path": output_path,
+            "slab_size": slab_size,
+            "masked": masked,
+            **kwargs,
+        }
+        dtype = self._griddata.dtype if dtype is None else np.dtype(dtype)
+        grid_arrays = self._grid_arrays(self._grid)
+        mask = self._grid.node_mask if masked else None
+
+        if output_path is None:
+            self._result = self._predict_volume(
+                grid_arrays["X"],
+                grid_arrays["Y"],
+                grid_arrays["Z"],
+                mask,
+                dtype,
+                kwargs,
+            )
+        else:
+            self._result = self._predict_out_of_core(
+                self._grid, mask, dtype, Path(output_path), slab_size, kwargs
+            )
+
+        # Also attach to grid
+        self._grid.result = self._result
+
+        logger.info("Prediction complete")
+        return self._result.interpolated
+
+    def iter_predict(
+        self,
+        grid: Grid3D | None = None,
+        tile_shape: int | tuple[int, int, int] | None = None,
+        dtype: npt.DTypeLike | None = None,
+        masked: bool = False,
+        **kwargs: object,
+    ) -> Iterator[tuple[GridTile, InterpolationResult]]:
+        """Predict a grid tile by tile, yielding each tile as it is done.
+
+        Only one tile's result is held at a time, so writers, statistics or
+        plots can stream a grid of any size with bounded memory, and start
+        before the whole volume is predicted. Tiles are predicted lazily, as
+        the iterator is consumed. Neither the Modeler's grid nor its result
+        are changed.
+
+        Args:
+            grid: Grid to predict on. None predicts on the current grid.
+            tile_shape: Number of nodes per tile along (Z, Y, X), see
+                ``Grid3D.iter_tiles``. Defaults to slabs of whole Z levels
+                holding about one million nodes.
+            dtype: Floating point type of the result arrays. Defaults to the
+                dtype of the training data.
+            masked: Predict only the nodes inside the grid's node mask,
+                leaving the others NaN, as in ``predict``.
+            **kwargs: Extra kwargs passed to the model, as in ``predict``.
+
+        Yields:
+            Each GridTile with its InterpolationResult. Result volumes are
+            shaped like ``tile.shape``, and probabilities follow sklearn's
+            (X, Y, Z, C) layout. Tiles with no node inside the mask are
+            all NaN and have no variance or probabilities.
+
+        Raises:
+            ValueError: If no grid is given and the Modeler has none, or
+                tile_shape is invalid.
+        """
+        grid = self._grid if grid is None else grid
+        if grid is None:
+            msg = "No grid to predict on, pass one to iter_predict()"
+            raise ValueError(msg)
+        if tile_shape is None:
+            tile_shape = _slab_shape(grid, None)
+        tiles = grid.iter_tiles(tile_shape)
+        if not self._fitted:
+            self.fit()
+        dtype = self._griddata.dtype if dtype is None else np.dtype(dtype)
+        mask = grid.node_mask if masked else None
+        yield from self._predict_tiles(grid, tiles, mask, dtype, kwargs)
+
+    def predict_points(
+        self,
+        points: np.ndarray,
+        dtype: npt.DTypeLike | None = None,
+        batch_size: int | None = None,
+        **kwargs: object,
+    ) -> InterpolationResult:
+        """Predict at arbitrary points, e.g. monitoring wells, without a grid.
+
+        Points are given in original units and mapped with the training
+        data's normalization parameters; standardization is reversed on the
+        results, as in ``predict``. The cost is linear in the number of
+        points. Neither the Modeler's grid nor its result are changed.
+
+        Args:
+            points: (M, 3) array of X, Y, Z coordinates.
+            dtype: Floating point type of the result arrays. Defaults to the
+                dtype of the training data.
+            batch_size: Number of points passed to the model at once.
+                Defaults to about one million.
+            **kwargs: Extra kwargs passed to model.predict_points(), e.g.
+                ``compute_variance=False``.
+
+        Returns:
+            InterpolationResult with (M,) arrays, and (M, C) class
+            probabilities for classifiers.
+
+        Raises:
+            ValueError: If points is not an (M, 3) array or batch_size is
+                not a positive integer.
+            NotImplementedError: If the model does not support point
+                predictions.
+        """
+        points = self._model_points(check_points(points))
+        if batch_size is None:
+            batch_size = _SLAB_NODES
+        if batch_size < 1:
+            msg = f"batch_size must be a positive integer, got {batch_size}"
+            raise ValueError(msg)
+        if not self._fitted:
+            self.fit()
+        dtype = self._griddata.dtype if dtype is None else np.dtype(dtype)
+        logger.info("Predicting %d points", len(points))
+
+        batches = [
+            self._postprocess(
+                self._model.predict_points(
+                    points[start : start + batch_size], **kwargs
+                ),
+                dtype,
+            )
+            for start in range(0, max(1, len(points)), batch_size)
+        ]
+        if len(batches) == 1:
+            return batches[0]
+        return InterpolationResult(
+            interpolated=np.concatenate([b.interpolated for b in batches]),
+            variance=_concatenate([b.variance for b in batches]),
+            probability=_concatenate([b.probability for b in batches]),
+        )
+
+    def update(self, griddata: GridData, remove: bool = False) -> np.ndarray | None:
+        """Add or remove training samples and refresh the last prediction.
+
+        The samples are given in original units and are transformed with the
+        preprocessing parameters of the training data; those parameters and
+        the grid are not refitted, and downsampling is not applied. The model
+        is updated through ``partial_fit``, so an IDW model created with
+        ``incremental=True`` only computes the contributions of the changed
+        samples. If a prediction was made before, it is repeated with the
+        same arguments.
+
+        Args:
+            griddata: Samples to add or remove.
+            remove: Remove the samples instead of adding them.
+
+        Returns:
+            The refreshed interpolated array, or None if nothing was
+            predicted yet.
+        """
+        if not self._fitted:
+            self.fit()
+        params = self._griddata.preprocessing_params
+        samples = griddata if params is None else apply_preprocessing(griddata, params)
+        data = samples.numpy_data
+        self._model.partial_fit(
+            data[:, 0], data[:, 1], data[:, 2], data[:, 3], remove=remove
+        )
+
+        current = self._griddata.data
+        merged = (
+            current.drop(index=samples.data.index)
+            if remove
+            else pd.concat([current, samples.data])
+        )
+        self._griddata = GridData(
+            merged.reset_index(),
+            preprocessing_params=params,
+            dtype=self._griddata.dtype,
+        )
+        logger.info(
+            "Model %s updated: %s %d points",
+            self._model.name,
+            "removed" if remove else "added",
+            len(data),
+        )
 
+        if self._last_predict is None:
+            return None
+        return self.predict(**self._last_predict)
+
+    def save(self, path: str | Path) -> None:
+        """Save the fitted model, training data, grid and result to a directory.
+
+        The model is fitted first if needed, then saved with
+        ``BaseModel.save`` in a ``model``
+        subdirectory. Training data, preprocessing parameters, the grid
+        definition, the last prediction's arguments and result are saved
+        next to it, so ``load`` restores the Modeler without refitting.
+
+        Args:
+            path: Directory to write, created if needed.
+
+        Raises:
+            ValueError: If the model or the prediction arguments cannot be
+                saved.
+            NotImplementedError: If the model does not support saving.
+        """
+        if not self._fitted:
+            self.fit()
+        path = Path(path)
+        self._model.save(path / _MODEL_DIR)
+        data = self._griddata.data.reset_index()
+        arrays = {name: data[name].to_numpy() for name in _COLUMNS}
+        if arrays["ID"].dtype == object:
+            arrays["ID"] = arrays["ID"].astype(str)
+        if self._result is not None:
+            for field in _RESULT_FIELDS:
+                value = getattr(self._result, field)
+                if value is not None:
+                    arrays[f"result_{field}"] = value
+
+        params = self._griddata.preprocessing_params
+        last_predict = None
+        if self._last_predict is not None:
+            dtype = self._last_predict["dtype"]
+            output_path = self._last_predict["output_path"]
+            last_predict = {
+                **self._last_predict,
+                "dtype": None if dtype is None else np.dtype(dtype).name,
+                "output_path": None if output_path is None else str(output_path),
+            }
+        meta = {
+            "griddata": {
+                "dtype": self._griddata.dtype.name,
+                "preprocessing_params": None if params is None else asdict(params),
+            },
+            "grid": None,
+            "last_predict": last_predict,
+        }
+        if self._grid is not None:
+            meta["grid"], grid_arrays = _grid_state(self._grid)
+            arrays.update({f"grid_{name}": a for name, a in grid_arrays.items()})
+        save_state(path, meta, arrays, meta_file=_MODELER_FILE)
+        logger.info("Modeler saved to %s", path)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "Modeler":
+        """Load a Modeler saved with ``save``, without refitting its model.
+
+        Args:
+            path: Directory written by ``save``.
+            mmap: Memory-map the saved arrays copy-on-write, see
+                ``BaseModel.load``.
+
+        Returns:
+            The Modeler, ready to predict, with the saved result if any.
+
+        Raises:
+            FileNotFoundError: If the directory holds no saved Modeler.
+        """
+        path = Path(path)
+        meta, arrays = load_state(path, mmap, meta_file=_MODELER_FILE)
+        model = BaseModel.load(path / _MODEL_DIR, mmap)
+        params = meta["griddata"]["preprocessing_params"]
+        griddata = GridData(
+            pd.DataFrame({name: arrays[name] for name in _COLUMNS}),
+            preprocessing_params=None if params is None else _preprocessing(params),
+            dtype=meta["griddata"]["dtype"],
+        )
+
+        grid = (
+            None
+            if meta["grid"] is None
+            else _grid_from_state(meta["grid"], prefixed(arrays, "grid_"))
+        )
+        modeler = cls.from_fitted(model, griddata, grid)
+        modeler._last_predict = meta["last_predict"]
+        if "result_interpolated" in arrays:
+            result = InterpolationResult(
+                interpolated=arrays["result_interpolated"],
+                variance=arrays.get("result_variance"),
+                probability=arrays.get("result_probability"),
+            )
+            modeler._result = result
+            if grid is not None:
+                grid.result = result
+        logger.info("Modeler loaded from %s, model %s", path, model.name)
+        return modeler
+
+    def _model_points(self, points: np.ndarray) -> np.ndarray:
+        """(M, 3) points mapped into the coordinate space of the model."""
+        params = self._griddata.preprocessing_params
+        if params is None or params.normalization is None:
+            return points
+        mapped = np.empty_like(points)
+        for i, axis in enumerate((Axis.X, Axis.Y, Axis.Z)):
+            norm = params.normalization[axis]
+            value_range = norm.max - norm.min
+            mapped[:, i] = (
+                0.0 if value_range == 0.0 else (points[:, i] - norm.min) / value_range
+            )
+        return mapped
+
+    def _grid_arrays(self, grid: Grid3D) -> dict[str, np.ndarray]:
+        """1D grid arrays in the coordinate space the model was fitted in."""
         # Use normalized grid if normalization was applied
         params = self._griddata.preprocessing_params
         if params is not None and params.normalization is not None:
-            grid_arrays = self._grid.normalized_grid
-        else:
-            grid_arrays = self._grid.grid
+            return grid.normalized_grid
+        return grid.grid
 
-        # Predict
-        result = self._model.predict(
-            grid_arrays["X"],
-            grid_arrays["Y"],
-            grid_arrays["Z"],
-            **kwargs,
+    def _postprocess(
+        self, result: InterpolationResult, dtype: np.dtype
+    ) -> InterpolationResult:
+        """Cast a raw model result to dtype and reverse standardization."""
+        interpolated = result.interpolated.astype(dtype, copy=False)
+        variance = (
+            None
+            if result.variance is None
+            else result.variance.astype(dtype, copy=False)
         )
 
-        interpolated = result.interpolated
-        variance = result.variance
-
         # Reverse standardization if it was applied
+        params = self._griddata.preprocessing_params
         if params is not None and params.standardization is not None:
             std_params = params.standardization
-            interpolated = interpolated * std_params.std + std_params.mean
+            # Typed scalars keep (masked) results from being upcast
+            std = np.asarray(std_params.std, dtype=dtype)
+            mean = np.asarray(std_params.mean, dtype=dtype)
+            interpolated = interpolated * std + mean
             if variance is not None:
                 # Variance scales with the square of the standard deviation
                 # and is not shifted by the mean
-                variance = variance * (std_params.std**2)
+                variance = variance * (std**2)
 
-        self._result = InterpolationResult(
+        return InterpolationResult(
             interpolated=interpolated,
             variance=variance,
             probability=result.probability,
         )
 
-        # Also attach to grid
-        self._grid.result = self._result
+    def _predict_volume(
+        self,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        grid_z: np.ndarray,
+        mask: np.ndarray | None,
+        dtype: np.dtype,
+        kwargs: dict[str, object],
+    ) -> InterpolationResult:
+        """Predict the nodes of a grid, or only those inside a node mask.
 
-        logger.info("Prediction complete")
-        return interpolated
+        The mask is handed to the model's ``predict``, which only evaluates
+        the nodes inside it; the others are NaN in the returned volumes.
+        """
+        if mask is not None:
+            n_nodes = int(np.count_nonzero(mask))
+            logger.info("Masked prediction: %d of %d nodes", n_nodes, mask.size)
+            if not n_nodes:
+                return InterpolationResult(
+                    interpolated=np.full(mask.shape, np.nan, dtype=dtype)
+                )
+            kwargs = {**kwargs, "mask": mask}
+        return self._postprocess(
+            self._model.predict(grid_x, grid_y, grid_z, **kwargs), dtype
+        )
+
+    def _predict_tiles(
+        self,
+        grid: Grid3D,
+        tiles: Iterator[GridTile],
+        mask: np.ndarray | None,
+        dtype: np.dtype,
+        kwargs: dict[str, object],
+    ) -> Iterator[tuple[GridTile, InterpolationResult]]:
+        """Predict tiles of a grid one at a time."""
+        grid_arrays = self._grid_arrays(grid)
+        for tile in tiles:
+            yield (
+                tile,
+                self._predict_volume(
+                    grid_arrays["X"][tile.x],
+                    grid_arrays["Y"][tile.y],
+                    grid_arrays["Z"][tile.z],
+                    None if mask is None else mask[tile.index],
+                    dtype,
+                    kwargs,
+                ),
+            )
+
+    def _predict_out_of_core(
+        self,
+        grid: Grid3D,
+        mask: np.ndarray | None,
+        dtype: np.dtype,
+        output_path: Path,
+        slab_size: int | None,
+        kwargs: dict[str, object],
+    ) -> InterpolationResult:
+        """Predict slab by slab into disk-backed ``.npy`` files."""
+        slab_shape = _slab_shape(grid, slab_size)
+        nx, ny, nz = len(grid.X.grid), len(grid.Y.grid), len(grid.Z.grid)
+
+        output_path.mkdir(parents=True, exist_ok=True)
+        logger.info(
+            "Out-of-core prediction into %s: %d slabs of %d Z levels",
+            output_path,
+            -(-nz // slab_shape[0]),
+            slab_shape[0],
+        )
+
+        stores: dict[str, np.memmap] = {}
+
+        def store(
+            name: str, shape: tuple[int, ...], store_dtype: np.dtype, z0: int
+        ) -> np.memmap:
+            if name not in stores:
+                stores[name] = np.lib.format.open_memmap(
+                    output_path / f"{name}.npy",
+                    mode="w+",
+                    dtype=store_dtype,
+                    shape=shape,
+                )
+                # Earlier slabs may have been masked out entirely
+                if z0 > 0 and name == "probability":
+                    stores[name][:, :, :z0] = np.nan
+                elif z0 > 0:
+                    stores[name][:z0] = np.nan
+            return stores[name]
+
+        tiles = grid.iter_tiles(slab_shape)
+        for tile, slab in self._predict_tiles(grid, tiles, mask, dtype, kwargs):
+            z0, z1 = tile.z.start, tile.z.stop
+            # Results are (Z, Y, X); probabilities follow sklearn's (X, Y, Z, C)
+            store("interpolated", (nz, ny, nx), dtype, z0)[z0:z1] = slab.interpolated
+            if slab.variance is not None:
+                store("variance", (nz, ny, nx), dtype, z0)[z0:z1] = slab.variance
+            elif "variance" in stores:
+                # A slab masked out entirely, after earlier predicted ones
+                stores["variance"][z0:z1] = np.nan
+            if slab.probability is not None:
+                shape = (nx, ny, nz, slab.probability.shape[-1])
+                probability = store("probability", shape, slab.probability.dtype, z0)
+                probability[:, :, z0:z1] = slab.probability
+            elif "probability" in stores:
+                stores["probability"][:, :, z0:z1] = np.nan
+
+        # Flush and hand back read-only maps of the completed files
+        arrays: dict[str, np.ndarray] = {}
+        for name, memmap in stores.items():
+            memmap.flush()
+            arrays[name] = np.load(output_path / f"{name}.npy", mmap_mode="r")
+
+        return InterpolationResult(
+            interpolated=arrays["interpolated"],
+            variance=arrays.get("variance"),
+            probability=arrays.get("probability"),
+        )
+
+
+def _slab_shape(grid: Grid3D, slab_size: int | None) -> tuple[int, int, int]:
+    """Tile shape of slabs of whole Z levels, about one million nodes by default.
+
+    Raises:
+        ValueError: If slab_size is not a positive integer.
+    """
+    nx, ny = len(grid.X.grid), len(grid.Y.grid)
+    if slab_size is None:
+        slab_size = max(1, _SLAB_NODES // max(1, nx * ny))
+    if slab_size < 1:
+        msg = f"slab_size must be a positive integer, got {slab_size}"
+        raise ValueError(msg)
+    return (slab_size, max(1, ny), max(1, nx))
+
+
+def _concatenate(parts: list[np.ndarray | None]) -> np.ndarray | None:
+    """Concatenate per-batch result arrays; None if the model returned none."""
+    arrays = [part for part in parts if part is not None]
+    return np.concatenate(arrays) if arrays else None
+
+
+def _grid_state(grid: Grid3D) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """JSON-serialisable definition and arrays of a grid."""
+    hull = grid.hull if isinstance(grid, IrregularGrid3D) else None
+    meta = {
+        "type": type(grid).__name__,
+        "axes": {
+            axis.name.value: [axis.min, axis.max, axis.res]
+            for axis in (grid.X, grid.Y, grid.Z)
+        },
+        "dtype": grid.dtype.name,
+        "hull": None if hull is None else shapely.to_wkt(hull),
+        "max_extrapolation_distance": grid.max_extrapolation_distance,
+    }
+    arrays = {} if grid.samples is None else {"samples": grid.samples}
+    return meta, arrays
+
+
+def _grid_from_state(state: dict[str, Any], arrays: dict[str, np.ndarray]) -> Grid3D:
+    """Rebuild a grid saved by ``_grid_state``."""
+    (x_min, x_max, x_res), (y_min, y_max, y_res), (z_min, z_max, z_res) = (
+        state["axes"][axis] for axis in ("X", "Y", "Z")
+    )
+    samples = arrays.get("samples")
+    distance = state.get("max_extrapolation_distance")
+    if state["type"] == RegularGrid3D.__name__:
+        return RegularGrid3D(
+            x_min,
+            x_max,
+            y_min,
+            y_max,
+            z_min,
+            z_max,
+            x_res,
+            dtype=state["dtype"],
+            samples=samples,
+            max_extrapolation_distance=distance,
+        )
+    if state["type"] == IrregularGrid3D.__name__:
+        return IrregularGrid3D(
+            x_min,
+            x_max,
+            x_res,
+            y_min,
+            y_max,
+            y_res,
+            z_min,
+            z_max,
+            z_res,
+            hull=None if state["hull"] is None else shapely.from_wkt(state["hull"]),
+            dtype=state["dtype"],
+            samples=samples,
+            max_extrapolation_distance=distance,
+        )
+    msg = f"Cannot restore grid of type {state['type']!r}"
+    raise ValueError(msg)
+
+
+def _preprocessing(params: dict[str, Any]) -> PreprocessingParams:
+    """Rebuild preprocessing parameters saved with ``dataclasses.asdict``."""
+    downsampling = params["downsampling"]
+    normalization = params["normalization"]
+    standardization = params["standardization"]
+    return PreprocessingParams(
+        downsampling=None
+        if downsampling is None
+        else DownsamplingParams(**downsampling),
+        normalization=(
+            None
+            if normalization is None
+            else {
+                Axis(axis): NormalizationParams(**values)
+                for axis, values in normalization.items()
+            }
+        ),
+        standardization=(
+            None
+            if standardization is None
+            else StandardizationParams(**standardization)
+        ),
+    )
@@ -4,7 +4,13 @@ from ...core.types import ModelType
 from .base import BaseModel
 from .idw import IDWModel
 from .kriging import KrigingModel
+from .search import SearchEllipsoid
 from .sklearn_model import SklearnModel
+from .variogram import (
+    ExperimentalVariogram,
+    VariogramKwargs,
+    experimental_variogram,
+)
 
 MODEL_REGISTRY: dict[ModelType, type[BaseModel]] = {
     ModelType.ORDINARY_KRIGING: KrigingModel,
@@ -14,9 +20,13 @@ MODEL_REGISTRY: dict[ModelType, type[BaseModel]] = {
 __all__ = [
     "MODEL_REGISTRY",
     "BaseModel",
+    "ExperimentalVariogram",
     "IDWModel",
     "KrigingModel",
+    "SearchEllipsoid",
     "SklearnModel",
+    "VariogramKwargs",
+    "experimental_variogram",
     "get_model",
 ]
 
@@ -1,16 +1,21 @@
 """Abstract base class for all interpolation models."""
 
 from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
 
 import numpy as np
 
 from ...core.types import InterpolationResult
+from .persistence import load_state, save_state
 
 
 class BaseModel(ABC):
     """Interface for interpolation models.
 
     All models must implement fit() and predict() with consistent signatures.
+    Models that implement ``_get_state`` and ``_from_state`` can be saved
+    once fitted and loaded again without refitting.
     """
 
     @abstractmethod
@@ -25,6 +30,114 @@ class BaseModel(ABC):
         """
         ...
 
+    def partial_fit(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: np.ndarray,
+        v: np.ndarray,
+        remove: bool = False,
+    ) -> None:
+        """Add or remove training samples of an already fitted model.
+
+        Args:
+            x: X coordinates of the samples.
+            y: Y coordinates of the samples.
+            z: Z coordinates of the samples.
+            v: Values of the samples.
+            remove: Remove the samples instead of adding them.
+
+        Raises:
+            NotImplementedError: If the model does not support updates.
+        """
+        msg = f"Model {self.name} does not support incremental updates"
+        raise NotImplementedError(msg)
+
+    def predict_points(
+        self, points: np.ndarray, **kwargs: object
+    ) -> InterpolationResult:
+        """Predict at arbitrary points instead of the nodes of a grid.
+
+        Costs O(M) in the number of points, unlike ``predict``, which
+        evaluates the full tensor product of its axes.
+
+        Args:
+            points: (M, 3) array of X, Y, Z coordinates.
+            **kwargs: Model-specific options, as for ``predict``.
+
+        Returns:
+            InterpolationResult with (M,) arrays, and (M, C) class
+            probabilities for classifiers.
+
+        Raises:
+            NotImplementedError: If the model does not support point queries.
+        """
+        msg = f"Model {self.name} does not support point predictions"
+        raise NotImplementedError(msg)
+
+    def save(self, path: str | Path) -> None:
+        """Save the fitted model to a directory.
+
+        The directory holds ``model.json`` with the model parameters and one
+        ``.npy`` file per array: training data, fitted variogram,
+        factorisations and spatial index, whatever the model needs to
+        predict without refitting.
+
+        Args:
+            path: Directory to write, created if needed. Existing files of
+                the same names are overwritten.
+
+        Raises:
+            ValueError: If the model is not fitted or its parameters cannot
+                be saved.
+            NotImplementedError: If the model does not support saving.
+        """
+        meta, arrays = self._get_state()
+        save_state(path, {"model": type(self).__name__, **meta}, arrays)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "BaseModel":
+        """Load a model saved with ``save``, ready to predict.
+
+        Args:
+            path: Directory written by ``save``.
+            mmap: Memory-map the saved arrays copy-on-write instead of
+                reading them into memory, so that loading is near-instant
+                and only the pages a prediction touches are read.
+
+        Returns:
+            The fitted model, of the class it was saved from.
+
+        Raises:
+            FileNotFoundError: If the directory holds no saved model.
+            ValueError: If the saved class is unknown or not a subclass of
+                the class ``load`` was called on.
+        """
+        meta, arrays = load_state(path, mmap)
+        name = meta.pop("model")
+        model_cls = next((c for c in _subclasses(cls) if c.__name__ == name), None)
+        if model_cls is None:
+            msg = f"Saved model {name!r} is not a {cls.__name__}"
+            raise ValueError(msg)
+        return model_cls._from_state(meta, arrays)
+
+    def _get_state(self) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+        """JSON-serialisable metadata and arrays of the fitted model.
+
+        Raises:
+            NotImplementedError: If the model does not support saving.
+        """
+        msg = f"Model {self.name} does not support saving"
+        raise NotImplementedError(msg)
+
+    @classmethod
+    def _from_state(
+        cls, meta: dict[str, Any], arrays: dict[str, np.ndarray]
+    ) -> "BaseModel":
+        """Restore a fitted model from the output of ``_get_state``."""
+        msg = f"Model {cls.__name__} does not support loading"
+        raise NotImplementedError(msg)
+
     @abstractmethod
     def predict(
         self,
@@ -39,6 +152,9 @@ class BaseModel(ABC):
             grid_x: 1D array of X grid coordinates.
             grid_y: 1D array of Y grid coordinates.
             grid_z: 1D array of Z grid coordinates.
+            **kwargs: Model-specific options. ``mask``, a (Z, Y, X) boolean
+                array, restricts the prediction to the nodes where it is
+                True; the other nodes are NaN and not evaluated.
 
         Returns:
             Interpolation result with at least the interpolated field.
@@ -50,3 +166,39 @@ class BaseModel(ABC):
     def name(self) -> str:
         """Human-readable model name."""
         ...
+
+
+def _subclasses(cls: type[BaseModel]) -> list[type[BaseModel]]:
+    """A model class and all its subclasses, recursively."""
+    found = [cls]
+    for subclass in cls.__subclasses__():
+        found += _subclasses(subclass)
+    return found
+
+
+def check_points(points: np.ndarray) -> np.ndarray:
+    """Validate query points as an (M, 3) float array.
+
+    Raises:
+        ValueError: If points is not an (M, 3) array.
+    """
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[1] != 3:
+        msg = f"points must be an (M, 3) array, got shape {points.shape}"
+        raise ValueError(msg)
+    return points
+
+
+def check_mask(mask: object, shape: tuple[int, int, int]) -> np.ndarray | None:
+    """Validate an optional (Z, Y, X) node mask of a grid.
+
+    Raises:
+        ValueError: If the mask does not match the grid shape.
+    """
+    if mask is None:
+        return None
+    mask = np.asarray(mask, dtype=bool)
+    if mask.shape != shape:
+        msg = f"mask must have the grid shape {shape}, got {mask.shape}"
+        raise ValueError(msg)
+    return mask
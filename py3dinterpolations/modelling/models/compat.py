@@ -0,0 +1,80 @@
+"""Wrappers around the pykrige internals the kriging code builds on.
+
+pykrige does not expose its anisotropy transform or its variogram fitting
+publicly. Every use goes through this module, so a pykrige release that
+changes them only needs changes here.
+"""
+
+from collections.abc import Callable, Sequence
+
+import numpy as np
+from pykrige.core import (
+    _adjust_for_anisotropy,
+    _calculate_variogram_model,
+    _make_variogram_parameter_list,
+)
+
+
+def adjust_for_anisotropy(
+    points: np.ndarray,
+    center: Sequence[float],
+    scaling: Sequence[float],
+    angles: Sequence[float],
+) -> np.ndarray:
+    """Map points into pykrige's anisotropy-adjusted space.
+
+    Args:
+        points: (N, 3) coordinates, left unchanged.
+        center: Center of the data the rotation turns around.
+        scaling: pykrige's (y, z) anisotropy scaling.
+        angles: pykrige's (x, y, z) anisotropy angles in degrees.
+
+    Returns:
+        (N, 3) adjusted coordinates.
+    """
+    # pykrige shifts its input in place
+    adjusted: np.ndarray = _adjust_for_anisotropy(
+        np.array(points, dtype=float), list(center), list(scaling), list(angles)
+    )
+    return adjusted
+
+
+def variogram_parameter_list(
+    variogram_model: str, parameters: object
+) -> list[float] | None:
+    """Variogram parameters in pykrige's order, as OrdinaryKriging3D takes them.
+
+    Args:
+        variogram_model: Name of the variogram model.
+        parameters: Parameters as a list or a dict, or None.
+
+    Returns:
+        The ordered parameters, or None if they must be fitted.
+    """
+    ordered = _make_variogram_parameter_list(variogram_model, parameters)
+    return None if ordered is None else [float(p) for p in ordered]
+
+
+def fit_variogram_model(
+    lags: np.ndarray,
+    semivariance: np.ndarray,
+    variogram_model: str,
+    function: Callable[[list[float], np.ndarray], np.ndarray],
+    weight: bool,
+) -> list[float]:
+    """Fit variogram parameters to binned lags, as OrdinaryKriging3D does.
+
+    Args:
+        lags: Mean lag distance of each bin.
+        semivariance: Mean semivariance of each bin.
+        variogram_model: Name of the variogram model.
+        function: The variogram function to fit.
+        weight: Whether to weight short lags more, as pykrige's ``weight``.
+
+    Returns:
+        Fitted parameters in pykrige's order.
+    """
+    parameters = _calculate_variogram_model(
+        lags, semivariance, variogram_model, function, weight
+    )
+    return [float(p) for p in parameters]
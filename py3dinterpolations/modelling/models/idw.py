@@ -1,13 +1,35 @@
 """Vectorized Inverse Distance Weighting (IDW) model."""
 
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
 import numpy as np
+import numpy.typing as npt
 
 from ...core.types import InterpolationResult
-from .base import BaseModel
+from .base import BaseModel, check_mask, check_points
+from .parallel import (
+    parse_memory_limit,
+    plan_batch_size,
+    resolve_n_jobs,
+    run_batches,
+)
+from .persistence import prefixed
+from .search import Neighbourhood, NeighbourSearch, SearchEllipsoid
+
+logger = logging.getLogger(__name__)
 
-# Maximum number of prediction points per batch to avoid OOM
+# Default number of prediction points per batch when no memory_limit is set
 _BATCH_SIZE = 50_000
 
+# Maps a grid tile (start, end, x0, x1) and an optional mask of its nodes to
+# the squared distances and values of its (masked) nodes
+_TileDistances = Callable[
+    [int, int, int, int, np.ndarray | None], tuple[np.ndarray, np.ndarray]
+]
+
 
 class IDWModel(BaseModel):
     """Vectorized IDW interpolation.
@@ -15,63 +37,484 @@ class IDWModel(BaseModel):
     Uses numpy broadcasting instead of Python loops for ~1000x speedup
     on typical workloads. Batches computation for memory safety.
 
+    By default every grid node is weighted against every training point.
+    Setting ``n_neighbors``, ``max_distance`` or ``search_ellipsoid``
+    switches to a neighbourhood mode backed by a KD-tree built once in
+    ``fit()``, so each node is only weighted against its closest training
+    points.
+
     Args:
         power: Power parameter controlling distance decay. Higher values
             give more weight to nearby points.
         threshold: Distance below which a point is treated as coincident
             with a training point (exact interpolation).
+        n_neighbors: Number of closest training points used per grid node.
+            None uses all training points.
+        max_distance: Search radius. Training points further away are
+            ignored; nodes without any training point in range are NaN.
+            Without ``n_neighbors``, every training point in range is
+            weighted. None means unlimited.
+        search_ellipsoid: Anisotropic search volume, as a SearchEllipsoid or
+            a dict of its fields. Selects which training points a node
+            considers; weights still use Euclidean distances. Cannot be
+            combined with ``max_distance``.
+        n_jobs: Number of worker threads used to predict batches in
+            parallel. -1 uses all CPUs. Results are identical to the
+            serial path; peak memory grows with the number of workers.
+        memory_limit: Memory budget for prediction temporaries, shared by
+            all workers, in bytes or as a string such as ``"2GB"``. The
+            batch size is derived from it and the number of training
+            points. None uses a fixed batch size.
+        dtype: Floating point type used by the distance kernels and the
+            result, e.g. ``"float32"`` to halve memory and bandwidth.
+            Coordinates are shifted to the training centroid in float64
+            before casting, so large projected coordinates keep their
+            precision.
+        incremental: Keep the per-node sums of the last prediction so that
+            ``partial_fit`` can update them with the contributions of new or
+            removed samples only, and predicting again on the same grid
+            returns the updated field without recomputing it. Costs three
+            grid-sized arrays. Only applies without a neighbourhood.
     """
 
-    def __init__(self, power: float = 1.0, threshold: float = 1e-10):
+    def __init__(
+        self,
+        power: float = 1.0,
+        threshold: float = 1e-10,
+        n_neighbors: int | None = None,
+        max_distance: float | None = None,
+        search_ellipsoid: SearchEllipsoid | Mapping[str, float] | None = None,
+        n_jobs: int = 1,
+        memory_limit: int | str | None = None,
+        dtype: npt.DTypeLike = np.float64,
+        incremental: bool = False,
+    ):
+        resolve_n_jobs(n_jobs)
         self._power = power
         self._threshold = threshold
+        self._neighbourhood = Neighbourhood.from_input(
+            n_neighbors, max_distance, search_ellipsoid
+        )
+        self._n_jobs = n_jobs
+        self._memory_limit = parse_memory_limit(memory_limit)
+        self._dtype = np.dtype(dtype)
         self._points: np.ndarray | None = None
+        self._origin = np.zeros(3)
+        self._local_points: np.ndarray | None = None
         self._values: np.ndarray | None = None
+        self._search: NeighbourSearch | None = None
+        self._incremental = incremental
+        self._sums: _IDWSums | None = None
+
+    @property
+    def uses_neighbourhood(self) -> bool:
+        """Whether predictions are restricted to a local neighbourhood."""
+        return self._neighbourhood.is_local
 
     def fit(self, x: np.ndarray, y: np.ndarray, z: np.ndarray, v: np.ndarray) -> None:
-        """Store training data."""
-        self._points = np.column_stack([x, y, z])
-        self._values = v
+        """Store training data and build the spatial index if needed."""
+        self._points = np.column_stack([x, y, z]).astype(float)
+        self._origin = self._points.mean(axis=0)
+        self._local_points = self._to_local(self._points)
+        self._values = np.asarray(v, dtype=self._dtype)
+        self._search = self._build_search() if self.uses_neighbourhood else None
+        self._sums = None
 
-    def _predict_batch(self, query_points: np.ndarray) -> np.ndarray:
-        """Predict values for a batch of query points.
+    def _build_search(self) -> NeighbourSearch:
+        """Build the KD-tree over the current training points."""
+        assert self._points is not None
+        return NeighbourSearch(
+            self._points,
+            n_neighbors=self._neighbourhood.n_neighbors,
+            max_distance=self._neighbourhood.max_distance,
+            ellipsoid=self._neighbourhood.ellipsoid,
+        )
+
+    def _to_local(self, coords: np.ndarray, axis: int | None = None) -> np.ndarray:
+        """Shift coordinates to the training centroid and cast to the model dtype.
 
         Args:
-            query_points: (M, 3) array of prediction coordinates.
+            coords: (M, 3) points, or 1D coordinates along ``axis``.
+            axis: Axis index of 1D coordinates. None for (M, 3) points.
+        """
+        origin = self._origin if axis is None else self._origin[axis]
+        return (coords - origin).astype(self._dtype)
 
-        Returns:
-            (M,) array of interpolated values.
+    def _bytes_per_query_point(self, n_samples: int | None = None) -> int:
+        """Peak temporary memory needed to predict a single query point.
+
+        Args:
+            n_samples: Number of training points weighted in the dense
+                kernel. None uses the whole training set.
         """
-        assert self._points is not None
         assert self._values is not None
+        itemsize = self._dtype.itemsize
+        if self._search is None:
+            # Squared distances, exact mask and four weight temporaries
+            n_samples = len(self._values) if n_samples is None else n_samples
+            return n_samples * itemsize * 6
+        # Distances, indices, values, weights and products per neighbour,
+        # plus the (k, 3) differences when weights are recomputed
+        per_neighbour = 9 if self._search.is_anisotropic else 6
+        return self._search.k * itemsize * per_neighbour
+
+    def _accumulate(
+        self,
+        squared_distances: np.ndarray,
+        values: np.ndarray,
+        power: float | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Reduce squared distances and training values to IDW sums.
 
-        # (M, N) distance matrix
-        diff = query_points[:, np.newaxis, :] - self._points[np.newaxis, :, :]
-        distances = np.linalg.norm(diff, axis=2)
+        Working on squared distances avoids a square root per pair, since
+        ``1 / d^p == (d^2)^(-p/2)``.
 
+        Args:
+            squared_distances: (M, K) squared distances from query points to
+                training points. Infinite distances are ignored.
+            values: (K,) training values shared by all query points, or
+                (M, K) per-query neighbour values.
+            power: Power parameter. None uses the model's ``power``.
+
+        Returns:
+            Tuple of (M,) weighted value sums, (M,) weight sums and (M,)
+            values of the first coincident training point (NaN if none).
+        """
         # Handle exact interpolation: if any query point coincides with a
-        # training point, return that training value directly
-        exact_mask = distances < self._threshold
-        has_exact = exact_mask.any(axis=1)
+        # training point, that training value is used directly
+        exact_mask = squared_distances < self._threshold**2
 
         # Compute IDW weights: w_i = 1 / d_i^p
         # Avoid division by zero at exact matches (we handle those separately)
-        safe_distances = np.where(exact_mask, 1.0, distances)
-        weights = 1.0 / np.power(safe_distances, self._power)
-        weights = np.where(exact_mask, 0.0, weights)
+        power = self._power if power is None else power
+        weights = np.power(np.where(exact_mask, 1.0, squared_distances), -power / 2)
+        return self._reduce(weights, exact_mask, values)
+
+    @staticmethod
+    def _reduce(
+        weights: np.ndarray, exact_mask: np.ndarray, values: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Reduce (M, K) weights to the sums of ``_accumulate``.
+
+        ``weights`` is overwritten.
+        """
+        has_exact = exact_mask.any(axis=1)
+        weights[exact_mask] = 0.0
 
         denominator = weights.sum(axis=1)
-        # Guard against all-zero denominator
-        safe_denominator = np.where(denominator == 0, 1.0, denominator)
-        result = (weights * self._values[np.newaxis, :]).sum(axis=1) / safe_denominator
-        result = np.where(denominator == 0, np.nan, result)
+        # Row-wise reductions (rather than BLAS products) keep every row
+        # independent of how the nodes were batched
+        weights *= values
+        numerator = weights.sum(axis=1)
 
-        # For exact matches, use the first coincident training point value
+        exact = np.full(len(weights), np.nan, dtype=numerator.dtype)
         if has_exact.any():
             exact_indices = exact_mask[has_exact].argmax(axis=1)
-            result[has_exact] = self._values[exact_indices]
+            if values.ndim == 1:
+                exact[has_exact] = values[exact_indices]
+            else:
+                exact[has_exact] = np.take_along_axis(
+                    values[has_exact], exact_indices[:, np.newaxis], axis=1
+                )[:, 0]
+
+        return numerator, denominator, exact
+
+    @staticmethod
+    def _combine(
+        numerator: np.ndarray, denominator: np.ndarray, exact: np.ndarray
+    ) -> np.ndarray:
+        """Turn IDW sums into estimates, preferring coincident values."""
+        # Guard against all-zero denominator
+        safe_denominator = np.where(denominator == 0, 1.0, denominator)
+        result = np.where(denominator == 0, np.nan, numerator / safe_denominator)
+        return np.where(np.isnan(exact), result, exact)
+
+    def _weighted_average(
+        self,
+        squared_distances: np.ndarray,
+        values: np.ndarray,
+        power: float | None = None,
+    ) -> np.ndarray:
+        """Combine squared distances and training values into IDW estimates.
+
+        Args:
+            squared_distances: (M, K) squared distances, see ``_accumulate``.
+            values: (K,) or (M, K) training values, see ``_accumulate``.
+            power: Power parameter. None uses the model's ``power``.
+
+        Returns:
+            (M,) array of interpolated values.
+        """
+        return self._combine(*self._accumulate(squared_distances, values, power))
+
+    def _power_sweep(
+        self,
+        squared_distances: np.ndarray,
+        values: np.ndarray,
+        powers: Sequence[float],
+    ) -> list[np.ndarray]:
+        """IDW estimates for several powers from the same squared distances.
+
+        Args:
+            squared_distances: (M, K) squared distances, see ``_accumulate``.
+            values: (K,) or (M, K) training values, see ``_accumulate``.
+            powers: Power parameters to evaluate.
+
+        Returns:
+            One (M,) array of interpolated values per power.
+        """
+        # Shared by all powers: d^-p == exp(-p / 2 * log(d^2)), and exp is
+        # about twice as fast as a general power
+        exact_mask = squared_distances < self._threshold**2
+        log_squared = np.log(np.where(exact_mask, 1.0, squared_distances))
+        return [
+            self._combine(
+                *self._reduce(np.exp(log_squared * (-power / 2)), exact_mask, values)
+            )
+            for power in powers
+        ]
+
+    def _squared_distances(self, query_points: np.ndarray) -> np.ndarray:
+        """(M, N) squared distances from query points to all training points."""
+        assert self._local_points is not None
+        # Accumulated axis by axis so that the (M, N, 3) difference tensor is
+        # never materialised
+        local_query = self._to_local(query_points)
+        squared = np.zeros(
+            (len(query_points), len(self._local_points)), dtype=self._dtype
+        )
+        for axis in range(3):
+            squared += (
+                np.subtract.outer(local_query[:, axis], self._local_points[:, axis])
+                ** 2
+            )
+        return squared
+
+    def _predict_batch(self, query_points: np.ndarray) -> np.ndarray:
+        """Predict values for a batch of query points.
+
+        Args:
+            query_points: (M, 3) array of prediction coordinates.
+
+        Returns:
+            (M,) array of interpolated values.
+        """
+        assert self._values is not None
+
+        if self._search is not None:
+            return self._predict_batch_neighbours(query_points)
+        return self._weighted_average(
+            self._squared_distances(query_points), self._values
+        )
+
+    def _predict_batch_neighbours(self, query_points: np.ndarray) -> np.ndarray:
+        """Predict a batch of query points from their nearest training points.
+
+        Args:
+            query_points: (M, 3) array of prediction coordinates.
+
+        Returns:
+            (M,) array of interpolated values.
+        """
+        return self._weighted_average(*self._neighbour_distances(query_points))
+
+    def _neighbour_distances(
+        self,
+        query_points: np.ndarray,
+        exclude: np.ndarray | None = None,
+        search: NeighbourSearch | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Squared distances to, and values of, each query point's neighbours.
+
+        Args:
+            query_points: (M, 3) array of prediction coordinates.
+            exclude: (M,) index of a training point to leave out of each
+                query point's neighbourhood.
+            search: Neighbour search to query instead of the fitted one.
+                Must return at least one neighbour more than it when
+                ``exclude`` is given.
+
+        Returns:
+            Tuple of (M, k) squared distances (infinite for missing
+            neighbours) and (M, k) neighbour values.
+        """
+        assert self._search is not None
+        assert self._points is not None
+        assert self._values is not None
+
+        # Missing neighbours come back with infinite distance and index N
+        distances, indices = (search or self._search).query(query_points)
+        if exclude is not None:
+            distances[indices == exclude[:, np.newaxis]] = np.inf
+            # Keep the n_neighbors closest remaining neighbours
+            order = np.argsort(distances, axis=1, kind="stable")
+            order = order[:, : self._search.n_neighbors]
+            distances = np.take_along_axis(distances, order, axis=1)
+            indices = np.take_along_axis(indices, order, axis=1)
+        found = np.isfinite(distances)
+        indices = np.where(found, indices, 0)
+        values = self._values[indices]
+
+        if self._search.is_anisotropic:
+            # Ellipsoid distances only select neighbours, weights are Euclidean
+            diff = query_points[:, np.newaxis, :] - self._points[indices]
+            squared = np.where(found, (diff**2).sum(axis=2), np.inf)
+        else:
+            squared = distances**2
+
+        return squared.astype(self._dtype), values
+
+    def _grid_distances(
+        self,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        grid_z: np.ndarray,
+        local_points: np.ndarray,
+        values: np.ndarray,
+    ) -> _TileDistances:
+        """Separable distance kernel over grid tiles.
+
+        Per-axis squared offsets between grid lines and training points are
+        precomputed once and summed by broadcasting.
+
+        Returns:
+            Callable mapping a tile of (Z, Y) rows ``[start, end)`` and
+            columns ``[x0, x1)`` to its (T, N) squared distances and the (N,)
+            training values, with nodes in row-major tile order. Given a
+            (end - start, x1 - x0) node mask, only the masked nodes are
+            returned.
+        """
+        ny = len(grid_y)
+        # (n_axis, N) squared offsets between grid lines and training points
+        dx2 = np.subtract.outer(self._to_local(grid_x, 0), local_points[:, 0]) ** 2
+        dy2 = np.subtract.outer(self._to_local(grid_y, 1), local_points[:, 1]) ** 2
+        dz2 = np.subtract.outer(self._to_local(grid_z, 2), local_points[:, 2]) ** 2
+
+        def distances(
+            start: int, end: int, x0: int, x1: int, mask: np.ndarray | None
+        ) -> tuple[np.ndarray, np.ndarray]:
+            iz, iy = np.divmod(np.arange(start, end), ny)
+            yz2 = dz2[iz] + dy2[iy]
+            if mask is not None:
+                rows, cols = np.nonzero(mask)
+                return yz2[rows] + dx2[x0 + cols], values
+            squared = yz2[:, np.newaxis, :] + dx2[np.newaxis, x0:x1, :]
+            return squared.reshape(-1, len(values)), values
+
+        return distances
+
+    def _grid_neighbour_distances(
+        self, grid_x: np.ndarray, grid_y: np.ndarray, grid_z: np.ndarray
+    ) -> _TileDistances:
+        """Neighbourhood counterpart of ``_grid_distances``.
+
+        Returns:
+            Callable mapping a grid tile to the (T, k) squared distances and
+            (T, k) values of each node's neighbours.
+        """
+        ny = len(grid_y)
+
+        def distances(
+            start: int, end: int, x0: int, x1: int, mask: np.ndarray | None
+        ) -> tuple[np.ndarray, np.ndarray]:
+            iz, iy = np.divmod(np.arange(start, end), ny)
+            if mask is not None:
+                rows, cols = np.nonzero(mask)
+                query_points = np.column_stack(
+                    [grid_x[x0 + cols], grid_y[iy[rows]], grid_z[iz[rows]]]
+                )
+                return self._neighbour_distances(query_points)
+            query_points = np.column_stack(
+                [
+                    np.tile(grid_x[x0:x1], end - start),
+                    np.repeat(grid_y[iy], x1 - x0),
+                    np.repeat(grid_z[iz], x1 - x0),
+                ]
+            )
+            return self._neighbour_distances(query_points)
+
+        return distances
+
+    def _tile_distances(
+        self, grid_x: np.ndarray, grid_y: np.ndarray, grid_z: np.ndarray
+    ) -> _TileDistances:
+        """Distance kernel over grid tiles for the fitted training set."""
+        if self._search is not None:
+            return self._grid_neighbour_distances(grid_x, grid_y, grid_z)
+        assert self._local_points is not None
+        assert self._values is not None
+        return self._grid_distances(
+            grid_x, grid_y, grid_z, self._local_points, self._values
+        )
+
+    def _tile_sums(
+        self,
+        distances: _TileDistances,
+        start: int,
+        end: int,
+        x0: int,
+        x1: int,
+        mask: np.ndarray | None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """IDW sums of a grid tile, each shaped (end - start, x1 - x0).
 
-        return result
+        Args:
+            distances: Distance kernel over grid tiles.
+            start: First (Z, Y) row of the tile.
+            end: End of the tile's (Z, Y) rows.
+            x0: First column of the tile.
+            x1: End of the tile's columns.
+            mask: (nz * ny, nx) node mask of the grid, or None. Nodes outside
+                it are not evaluated: their sums are zero and they have no
+                coincident value, so they combine to NaN.
+        """
+        shape = (end - start, x1 - x0)
+        if mask is None:
+            numerator, denominator, exact = (
+                part.reshape(shape)
+                for part in self._accumulate(*distances(start, end, x0, x1, None))
+            )
+            return numerator, denominator, exact
+        selected = mask[start:end, x0:x1]
+        numerator = np.zeros(shape, dtype=self._dtype)
+        denominator = np.zeros_like(numerator)
+        exact = np.full(shape, np.nan, dtype=self._dtype)
+        if selected.any():
+            parts = self._accumulate(*distances(start, end, x0, x1, selected))
+            for full, part in zip((numerator, denominator, exact), parts, strict=True):
+                full[selected] = part
+        return numerator, denominator, exact
+
+    def _run_tiles(
+        self,
+        shape: tuple[int, int, int],
+        bytes_per_node: int,
+        tile: Callable[[int, int, int, int], None],
+    ) -> None:
+        """Call ``tile(start, end, x0, x1)`` over a (Z, Y, X) grid in batches.
+
+        Nodes are processed in ZYX order, a batch of (Z, Y) rows at a time;
+        rows wider than a batch are split along X.
+        """
+        nz, ny, nx = shape
+        batch_size = plan_batch_size(
+            self._memory_limit, bytes_per_node, _BATCH_SIZE, self._n_jobs
+        )
+        logger.info(
+            "IDW plan: %d nodes, %d training points, batches of %d on %d worker(s)",
+            nz * ny * nx,
+            0 if self._values is None else len(self._values),
+            batch_size,
+            resolve_n_jobs(self._n_jobs),
+        )
+        x_chunk = max(1, min(nx, batch_size))
+        rows_per_batch = max(1, batch_size // nx)
+
+        def fill(start: int, end: int) -> None:
+            for x0 in range(0, nx, x_chunk):
+                tile(start, end, x0, min(x0 + x_chunk, nx))
+
+        run_batches(fill, nz * ny, rows_per_batch, self._n_jobs)
 
     def predict(
         self,
@@ -82,6 +525,22 @@ class IDWModel(BaseModel):
     ) -> InterpolationResult:
         """Predict on a regular grid defined by 1D arrays.
 
+        Nodes are processed in ZYX order, a batch of (Z, Y) rows at a time,
+        so the full (M, 3) array of grid nodes is never built. Without a
+        neighbourhood, distances use a separable kernel: per-axis squared
+        offsets are precomputed once and summed by broadcasting.
+
+        With ``incremental=True``, predicting again on the grid and mask of
+        the last prediction reuses its accumulated sums instead of
+        recomputing them.
+
+        Args:
+            grid_x: 1D array of X grid coordinates.
+            grid_y: 1D array of Y grid coordinates.
+            grid_z: 1D array of Z grid coordinates.
+            **kwargs: ``mask``, a (Z, Y, X) boolean array: only the nodes
+                where it is True are evaluated, the others are NaN.
+
         Returns:
             InterpolationResult with shape (len(grid_z), len(grid_y), len(grid_x))
             to match pykrige's output convention.
@@ -90,23 +549,466 @@ class IDWModel(BaseModel):
             msg = "Model must be fit before predicting"
             raise RuntimeError(msg)
 
-        # Build meshgrid in ij (XYZ) indexing for computation
-        mx, my, mz = np.meshgrid(grid_x, grid_y, grid_z, indexing="ij")
-        query_points = np.column_stack([mx.ravel(), my.ravel(), mz.ravel()])
+        nz, ny, nx = len(grid_z), len(grid_y), len(grid_x)
+        mask = check_mask(kwargs.get("mask"), (nz, ny, nx))
+        node_mask = None if mask is None else mask.reshape(nz * ny, nx)
+        sums = self._sums
+        if sums is not None and sums.matches(grid_x, grid_y, grid_z, node_mask):
+            logger.info("IDW: reusing accumulated sums for %d nodes", nz * ny * nx)
+            result = self._combine(sums.numerator, sums.denominator, sums.exact)
+            return InterpolationResult(
+                interpolated=result.reshape(nz, ny, nx), variance=None
+            )
+
+        distances = self._tile_distances(grid_x, grid_y, grid_z)
+        result = np.empty((nz * ny, nx), dtype=self._dtype)
+        sums = (
+            _IDWSums.empty(grid_x, grid_y, grid_z, node_mask, self._dtype)
+            if self._incremental and self._search is None
+            else None
+        )
+        self._sums = sums
+
+        def tile(start: int, end: int, x0: int, x1: int) -> None:
+            numerator, denominator, exact = self._tile_sums(
+                distances, start, end, x0, x1, node_mask
+            )
+            if sums is not None:
+                sums.numerator[start:end, x0:x1] = numerator
+                sums.denominator[start:end, x0:x1] = denominator
+                sums.exact[start:end, x0:x1] = exact
+            result[start:end, x0:x1] = self._combine(numerator, denominator, exact)
+
+        self._run_tiles((nz, ny, nx), self._bytes_per_query_point(), tile)
+
+        return InterpolationResult(
+            interpolated=result.reshape(nz, ny, nx), variance=None
+        )
+
+    def predict_many(
+        self,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        grid_z: np.ndarray,
+        powers: Sequence[float],
+    ) -> list[InterpolationResult]:
+        """Predict on a grid for several power parameters in one pass.
+
+        Distances (or neighbour lookups) are computed once per batch and
+        every power derives its weights from their logarithms, so a power
+        sweep costs little more than a single prediction. Each result
+        matches ``predict`` with ``power`` set to the same value, up to
+        floating point rounding.
+
+        Args:
+            grid_x: 1D array of X grid coordinates.
+            grid_y: 1D array of Y grid coordinates.
+            grid_z: 1D array of Z grid coordinates.
+            powers: Power parameters to evaluate.
+
+        Returns:
+            One InterpolationResult per power, in the order given, each with
+            shape (len(grid_z), len(grid_y), len(grid_x)).
+
+        Raises:
+            RuntimeError: If the model has not been fitted.
+            ValueError: If no powers are given.
+        """
+        if self._points is None:
+            msg = "Model must be fit before predicting"
+            raise RuntimeError(msg)
+        if len(powers) == 0:
+            msg = "powers must contain at least one value"
+            raise ValueError(msg)
+
+        nz, ny, nx = len(grid_z), len(grid_y), len(grid_x)
+        distances = self._tile_distances(grid_x, grid_y, grid_z)
+        results = [np.empty((nz * ny, nx), dtype=self._dtype) for _ in powers]
+
+        def tile(start: int, end: int, x0: int, x1: int) -> None:
+            estimates = self._power_sweep(*distances(start, end, x0, x1, None), powers)
+            for result, estimate in zip(results, estimates, strict=True):
+                result[start:end, x0:x1] = estimate.reshape(end - start, x1 - x0)
+
+        # One more (T, N) temporary than predict() for the shared logarithms
+        bytes_per_node = self._bytes_per_query_point() * 7 // 6
+        self._run_tiles((nz, ny, nx), bytes_per_node, tile)
+
+        return [
+            InterpolationResult(interpolated=result.reshape(nz, ny, nx), variance=None)
+            for result in results
+        ]
+
+    def predict_leave_one_out(
+        self, powers: Sequence[float] | None = None
+    ) -> np.ndarray:
+        """Leave-one-out estimates of every training value.
+
+        IDW has no fitted state beyond the training set, so the estimate at
+        a training point without that point is the weighted average over
+        the others: its own distance is dropped from the weights instead of
+        refitting the model N times. Distances are computed once per batch
+        and shared by all powers, as in ``predict_many``.
+
+        In neighbourhood mode each point is weighted against its
+        ``n_neighbors`` closest other points within the search volume.
+
+        Args:
+            powers: Power parameters to evaluate. None uses the model's
+                ``power``.
+
+        Returns:
+            (len(powers), N) array of estimates, NaN where a training point
+            has no other training point in its search volume.
+
+        Raises:
+            RuntimeError: If the model has not been fitted.
+            ValueError: If powers is empty.
+        """
+        if self._points is None:
+            msg = "Model must be fit before predicting"
+            raise RuntimeError(msg)
+        if powers is None:
+            powers = [self._power]
+        if len(powers) == 0:
+            msg = "powers must contain at least one value"
+            raise ValueError(msg)
+
+        points = self._points
+        values = self._values
+        assert values is not None
+        n_points = len(points)
+        estimates = np.empty((len(powers), n_points), dtype=self._dtype)
+        search = (
+            None
+            if self._search is None
+            else NeighbourSearch(
+                points,
+                n_neighbors=None
+                if self._neighbourhood.n_neighbors is None
+                else self._neighbourhood.n_neighbors + 1,
+                max_distance=self._neighbourhood.max_distance,
+                ellipsoid=self._neighbourhood.ellipsoid,
+            )
+        )
 
-        # Batch processing for memory safety
-        n_points = len(query_points)
-        result = np.empty(n_points)
-        for start in range(0, n_points, _BATCH_SIZE):
-            end = min(start + _BATCH_SIZE, n_points)
-            result[start:end] = self._predict_batch(query_points[start:end])
+        def batch(start: int, end: int) -> None:
+            indices = np.arange(start, end)
+            if search is None:
+                squared = self._squared_distances(points[start:end])
+                squared[np.arange(end - start), indices] = np.inf
+                batch_values = values
+            else:
+                squared, batch_values = self._neighbour_distances(
+                    points[start:end], exclude=indices, search=search
+                )
+            sweep = self._power_sweep(squared, batch_values, powers)
+            for row, estimate in zip(estimates, sweep, strict=True):
+                row[start:end] = estimate
 
-        # Reshape to (X, Y, Z) then transpose to (Z, Y, X) to match pykrige
-        interpolated = result.reshape(mx.shape)
-        interpolated = np.einsum("xyz->zyx", interpolated)
+        bytes_per_point = self._bytes_per_query_point() * 7 // 6
+        batch_size = plan_batch_size(
+            self._memory_limit, bytes_per_point, _BATCH_SIZE, self._n_jobs
+        )
+        run_batches(batch, n_points, batch_size, self._n_jobs)
+        return estimates
 
-        return InterpolationResult(interpolated=interpolated, variance=None)
+    def predict_points(
+        self, points: np.ndarray, **kwargs: object
+    ) -> InterpolationResult:
+        """Predict at arbitrary points, a batch at a time.
+
+        Batches are sized from ``memory_limit`` and run on ``n_jobs``
+        worker threads, as in ``predict``.
+
+        Args:
+            points: (M, 3) query coordinates.
+
+        Returns:
+            InterpolationResult with an (M,) interpolated array.
+
+        Raises:
+            RuntimeError: If the model has not been fitted.
+            ValueError: If points is not an (M, 3) array.
+        """
+        if self._points is None:
+            msg = "Model must be fit before predicting"
+            raise RuntimeError(msg)
+        points = check_points(points)
+        result = np.empty(len(points), dtype=self._dtype)
+        batch_size = plan_batch_size(
+            self._memory_limit,
+            self._bytes_per_query_point(),
+            _BATCH_SIZE,
+            self._n_jobs,
+        )
+
+        def batch(start: int, end: int) -> None:
+            result[start:end] = self._predict_batch(points[start:end])
+
+        run_batches(batch, len(points), batch_size, self._n_jobs)
+        return InterpolationResult(interpolated=result, variance=None)
+
+    def partial_fit(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: np.ndarray,
+        v: np.ndarray,
+        remove: bool = False,
+    ) -> None:
+        """Add or remove training samples without refitting from scratch.
+
+        IDW is a ratio of two sums over the training points, so with
+        ``incremental=True`` the sums kept from the last prediction are
+        updated with the contributions of the changed samples only: an
+        update costs O(M x dN) instead of O(M x N). Nodes coinciding with a
+        removed sample are recomputed from the remaining ones. In
+        neighbourhood mode the KD-tree is rebuilt instead.
+
+        Args:
+            x: X coordinates of the samples.
+            y: Y coordinates of the samples.
+            z: Z coordinates of the samples.
+            v: Values of the samples.
+            remove: Remove the samples instead of adding them. Each one must
+                match a training point exactly, in coordinates and value.
+
+        Raises:
+            RuntimeError: If the model has not been fitted.
+            ValueError: If a sample to remove is not in the training data,
+                or if removing would leave no training points.
+        """
+        if self._points is None:
+            msg = "Model must be fit before updating"
+            raise RuntimeError(msg)
+        assert self._local_points is not None
+        assert self._values is not None
+
+        points = np.column_stack([x, y, z]).astype(float)
+        values = np.asarray(v, dtype=self._dtype)
+        if remove:
+            indices = self._find_samples(points, values)
+            keep = np.ones(len(self._points), dtype=bool)
+            keep[indices] = False
+            if not keep.any():
+                msg = "Cannot remove every training point"
+                raise ValueError(msg)
+            # Subtract exactly the contributions that were added
+            delta_points = self._local_points[indices]
+            delta_values = self._values[indices]
+            self._points = self._points[keep]
+            self._local_points = self._local_points[keep]
+            self._values = self._values[keep]
+        else:
+            # The origin stays fixed so that existing sums remain valid
+            delta_points = self._to_local(points)
+            delta_values = values
+            self._points = np.concatenate([self._points, points])
+            self._local_points = np.concatenate([self._local_points, delta_points])
+            self._values = np.concatenate([self._values, delta_values])
+
+        logger.info(
+            "IDW: %s %d training points, %d remaining",
+            "removed" if remove else "added",
+            len(delta_values),
+            len(self._values),
+        )
+        if self.uses_neighbourhood:
+            self._search = self._build_search()
+        elif self._sums is not None:
+            self._update_sums(delta_points, delta_values, remove)
+
+    def _find_samples(self, points: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Indices of the training points matching each given sample."""
+        assert self._points is not None
+        assert self._values is not None
+        available = np.ones(len(self._points), dtype=bool)
+        indices = np.empty(len(points), dtype=int)
+        for i, (point, value) in enumerate(zip(points, values, strict=True)):
+            matches = np.flatnonzero(
+                available
+                & (self._points == point).all(axis=1)
+                & (self._values == value)
+            )
+            if len(matches) == 0:
+                msg = f"Sample {point.tolist()} = {value} is not in the training data"
+                raise ValueError(msg)
+            indices[i] = matches[0]
+            available[matches[0]] = False
+        return indices
+
+    def _update_sums(
+        self, delta_points: np.ndarray, delta_values: np.ndarray, remove: bool
+    ) -> None:
+        """Apply the contributions of added or removed samples to the sums."""
+        sums = self._sums
+        assert sums is not None
+        assert self._values is not None
+        grid_x, grid_y, grid_z = sums.grid
+        nz, ny, nx = len(grid_z), len(grid_y), len(grid_x)
+        distances = self._grid_distances(
+            grid_x, grid_y, grid_z, delta_points, delta_values
+        )
+        coincident: list[tuple[np.ndarray, np.ndarray]] = []
+
+        def tile(start: int, end: int, x0: int, x1: int) -> None:
+            # Masked-out nodes receive no contributions and stay NaN
+            numerator, denominator, exact = self._tile_sums(
+                distances, start, end, x0, x1, sums.mask
+            )
+            block = np.s_[start:end, x0:x1]
+            hit = ~np.isnan(exact)
+            if remove:
+                sums.numerator[block] -= numerator
+                sums.denominator[block] -= denominator
+                if hit.any():
+                    rows, cols = np.nonzero(hit)
+                    coincident.append((rows + start, cols + x0))
+            else:
+                sums.numerator[block] += numerator
+                sums.denominator[block] += denominator
+                # Earlier training points keep precedence at coincident nodes
+                current = sums.exact[block]
+                np.copyto(current, exact, where=hit & np.isnan(current))
+
+        self._run_tiles(
+            (nz, ny, nx), self._bytes_per_query_point(len(delta_values)), tile
+        )
+
+        if coincident:
+            # Nodes that took a removed sample's value are rebuilt in full
+            rows = np.concatenate([r for r, _ in coincident])
+            cols = np.concatenate([c for _, c in coincident])
+            iz, iy = np.divmod(rows, ny)
+            nodes = np.column_stack([grid_x[cols], grid_y[iy], grid_z[iz]])
+            numerator, denominator, exact = self._accumulate(
+                self._squared_distances(nodes), self._values
+            )
+            sums.numerator[rows, cols] = numerator
+            sums.denominator[rows, cols] = denominator
+            sums.exact[rows, cols] = exact
+
+    def _get_state(self) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+        """Parameters, training points, KD-tree and incremental sums."""
+        if self._points is None:
+            msg = "Model must be fit before saving"
+            raise ValueError(msg)
+        assert self._values is not None
+        meta: dict[str, Any] = {
+            "params": {
+                "power": self._power,
+                "threshold": self._threshold,
+                "n_neighbors": self._neighbourhood.n_neighbors,
+                "max_distance": self._neighbourhood.max_distance,
+                "search_ellipsoid": (
+                    None
+                    if self._neighbourhood.ellipsoid is None
+                    else asdict(self._neighbourhood.ellipsoid)
+                ),
+                "n_jobs": self._n_jobs,
+                "memory_limit": self._memory_limit,
+                "dtype": self._dtype.name,
+                "incremental": self._incremental,
+            }
+        }
+        arrays = {
+            "points": self._points,
+            "origin": self._origin,
+            "values": self._values,
+        }
+        if self._search is not None:
+            meta["search"], search_arrays = self._search.state()
+            arrays.update({f"search_{k}": a for k, a in search_arrays.items()})
+        if self._sums is not None:
+            arrays.update(
+                {
+                    "sums_x": self._sums.grid[0],
+                    "sums_y": self._sums.grid[1],
+                    "sums_z": self._sums.grid[2],
+                    "sums_numerator": self._sums.numerator,
+                    "sums_denominator": self._sums.denominator,
+                    "sums_exact": self._sums.exact,
+                }
+            )
+            if self._sums.mask is not None:
+                arrays["sums_mask"] = self._sums.mask
+        return meta, arrays
+
+    @classmethod
+    def _from_state(
+        cls, meta: dict[str, Any], arrays: dict[str, np.ndarray]
+    ) -> "IDWModel":
+        model = cls(**meta["params"])
+        model._points = arrays["points"]
+        model._origin = arrays["origin"]
+        model._local_points = model._to_local(model._points)
+        model._values = arrays["values"]
+        if "search" in meta:
+            model._search = NeighbourSearch.from_state(
+                meta["search"], prefixed(arrays, "search_")
+            )
+        if "sums_numerator" in arrays:
+            model._sums = _IDWSums(
+                grid=(arrays["sums_x"], arrays["sums_y"], arrays["sums_z"]),
+                numerator=arrays["sums_numerator"],
+                denominator=arrays["sums_denominator"],
+                exact=arrays["sums_exact"],
+                mask=arrays.get("sums_mask"),
+            )
+        return model
 
     @property
     def name(self) -> str:
         return "idw"
+
+
+@dataclass
+class _IDWSums:
+    """Per-node IDW sums kept from the last prediction for incremental updates.
+
+    Arrays are shaped (nz * ny, nx), matching the prediction layout. Nodes
+    outside ``mask`` keep zero sums and are never updated.
+    """
+
+    grid: tuple[np.ndarray, np.ndarray, np.ndarray]
+    numerator: np.ndarray
+    denominator: np.ndarray
+    exact: np.ndarray
+    mask: np.ndarray | None = None
+
+    @classmethod
+    def empty(
+        cls,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        grid_z: np.ndarray,
+        mask: np.ndarray | None,
+        dtype: np.dtype,
+    ) -> "_IDWSums":
+        """Allocate sums for a grid and node mask, copying both."""
+        shape = (len(grid_z) * len(grid_y), len(grid_x))
+        return cls(
+            grid=(np.array(grid_x), np.array(grid_y), np.array(grid_z)),
+            numerator=np.empty(shape, dtype=dtype),
+            denominator=np.empty(shape, dtype=dtype),
+            exact=np.empty(shape, dtype=dtype),
+            mask=None if mask is None else np.array(mask),
+        )
+
+    def matches(
+        self,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        grid_z: np.ndarray,
+        mask: np.ndarray | None,
+    ) -> bool:
+        """Whether the sums were accumulated on this grid and node mask."""
+        if self.mask is None or mask is None:
+            same_mask = self.mask is None and mask is None
+        else:
+            same_mask = np.array_equal(self.mask, mask)
+        return same_mask and all(
+            np.array_equal(own, other)
+            for own, other in zip(self.grid, (grid_x, grid_y, grid_z), strict=True)
+        )
@@ -1,10 +1,74 @@
 """Ordinary Kriging 3D model via pykrige."""
 
+import logging
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any, cast
+
 import numpy as np
+import numpy.typing as npt
 from pykrige.ok3d import OrdinaryKriging3D
+from scipy.linalg import lu_factor, lu_solve
+from scipy.spatial.distance import cdist
+
+from ...core.types import InterpolationResult, KrigingSolver
+from .base import BaseModel, check_mask, check_points
+from .compat import adjust_for_anisotropy, variogram_parameter_list
+from .parallel import (
+    parse_memory_limit,
+    plan_batch_size,
+    resolve_n_jobs,
+    run_batches,
+)
+from .persistence import prefixed
+from .search import Neighbourhood, NeighbourSearch, SearchEllipsoid
+from .variogram import ExperimentalVariogram, VariogramKwargs, experimental_variogram
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of kriging matrix entries solved at once in local mode,
+# and of right-hand side entries with the native solver, when no
+# memory_limit is set
+_LOCAL_SYSTEM_SIZE = 4_000_000
+
+# Largest number of samples per node in local kriging without n_neighbors:
+# each node solves a dense (k + 1) x (k + 1) system, so a radius-only search
+# around dense data would otherwise approach a global system per node
+_MAX_LOCAL_NEIGHBOURS = 64
+
+# Maps a block of (M, 3) query points and an (M,) mask of the points that
+# need a variance to (M,) kriged values and the variances of masked points
+_BlockSolver = Callable[[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]
+
+
+@dataclass(frozen=True)
+class _FittedVariogram:
+    """What the in-package solvers need from a fit: the sample values,
+    pykrige's anisotropy transform and the variogram model."""
+
+    values: np.ndarray
+    center: list[float]
+    scaling: list[float]
+    angles: list[float]
+    function: Callable[[list[float], np.ndarray], np.ndarray]
+    parameters: list[float]
+    exact_values: bool
 
-from ...core.types import InterpolationResult
-from .base import BaseModel
+    @classmethod
+    def from_pykrige(cls, model: OrdinaryKriging3D) -> "_FittedVariogram":
+        return cls(
+            values=model.VALUES,
+            center=[model.XCENTER, model.YCENTER, model.ZCENTER],
+            scaling=[model.anisotropy_scaling_y, model.anisotropy_scaling_z],
+            angles=[
+                model.anisotropy_angle_x,
+                model.anisotropy_angle_y,
+                model.anisotropy_angle_z,
+            ],
+            function=model.variogram_function,
+            parameters=list(model.variogram_model_parameters),
+            exact_values=model.exact_values,
+        )
 
 
 class KrigingModel(BaseModel):
@@ -13,17 +77,213 @@ class KrigingModel(BaseModel):
     pykrige fits at construction time, so fit() constructs the
     OrdinaryKriging3D instance.
 
+    Setting ``n_neighbors``, ``max_distance`` or ``search_ellipsoid``
+    switches to local (moving-neighbourhood) kriging: the variogram is
+    still fitted by pykrige on all the data, but each grid node solves a
+    small kriging system built only from its closest samples, looked up in
+    a KD-tree built once in ``fit()``. Blocks of nodes can be solved on a
+    thread pool.
+
+    With ``variogram_binning``, the variogram is instead fitted to an
+    experimental variogram binned in-package (see
+    ``experimental_variogram``), which never holds all N²/2 sample pairs in
+    memory and can subsample them. Local kriging and the native solver then
+    skip pykrige entirely; the pykrige solver still receives the fitted
+    parameters, but computes its own pair distances.
+
+    With ``solver="native"``, global kriging is solved in-package instead:
+    ``fit()`` assembles the (N+1) x (N+1) kriging matrix once and keeps its
+    LU factorisation, so each prediction only builds right-hand sides and
+    runs triangular solves over blocks of nodes. pykrige still fits the
+    variogram.
+
     Args:
+        search_ellipsoid: Anisotropic search volume in world coordinates, as
+            a SearchEllipsoid or a dict of its fields. Cannot be combined
+            with ``max_distance``.
+        n_neighbors: Maximum number of samples used per grid node, closest
+            first. Without a search ellipsoid, closeness is measured in the
+            variogram's anisotropy-adjusted space, as pykrige's
+            ``n_closest_points`` does. None uses up to the
+            ``_MAX_LOCAL_NEIGHBOURS`` (64) closest samples in the search
+            volume.
+        max_distance: Isotropic search radius in the variogram's
+            anisotropy-adjusted space, which matches world coordinates
+            without ``anisotropy_*`` parameters. None means unlimited.
+        solver: Solver for global kriging, ``"pykrige"`` or ``"native"``.
+            Ignored in local mode.
+        n_jobs: Number of worker threads solving blocks of nodes in
+            parallel, in local mode or with the native solver. -1 uses all
+            CPUs.
+        memory_limit: Memory budget for prediction temporaries, in bytes or
+            as a string such as ``"2GB"``. Local kriging and the native
+            solver size their blocks from it, shared by all workers; the
+            pykrige solver falls back to its ``"loop"`` backend when the
+            vectorized one would exceed it.
+        dtype: Floating point type of the returned arrays. Kriging systems
+            are always solved in float64 for numerical stability.
+        variogram_binning: Keyword args for ``experimental_variogram``,
+            e.g. ``max_lag`` or ``max_pairs``, to fit the variogram from
+            in-package lag bins. ``nlags`` and ``weight`` default to the
+            kriging parameters of the same name. None lets pykrige fit it.
         **kriging_params: Parameters passed to OrdinaryKriging3D constructor.
     """
 
-    def __init__(self, **kriging_params: object):
+    def __init__(
+        self,
+        search_ellipsoid: SearchEllipsoid | Mapping[str, float] | None = None,
+        n_neighbors: int | None = None,
+        max_distance: float | None = None,
+        solver: KrigingSolver | str = KrigingSolver.PYKRIGE,
+        n_jobs: int = 1,
+        memory_limit: int | str | None = None,
+        dtype: npt.DTypeLike = np.float64,
+        variogram_binning: VariogramKwargs | None = None,
+        **kriging_params: object,
+    ):
+        solver = KrigingSolver(solver)
+        if solver == KrigingSolver.NATIVE and kriging_params.get("pseudo_inv"):
+            msg = "pseudo_inv is only supported by the pykrige solver"
+            raise ValueError(msg)
+        resolve_n_jobs(n_jobs)
         self._params = kriging_params
+        self._solver = solver
+        self._neighbourhood = Neighbourhood.from_input(
+            n_neighbors, max_distance, search_ellipsoid
+        )
+        self._n_jobs = n_jobs
+        self._memory_limit = parse_memory_limit(memory_limit)
+        self._dtype = np.dtype(dtype)
+        self._variogram_binning = variogram_binning
         self._model: OrdinaryKriging3D | None = None
+        self._fitted: _FittedVariogram | None = None
+        self._experimental: ExperimentalVariogram | None = None
+        self._search: NeighbourSearch | None = None
+        self._adjusted_points: np.ndarray | None = None
+        self._lu: tuple[np.ndarray, np.ndarray] | None = None
+        self._dual_weights: np.ndarray | None = None
+
+    @property
+    def uses_neighbourhood(self) -> bool:
+        """Whether predictions are restricted to a local neighbourhood."""
+        return self._neighbourhood.is_local
+
+    @property
+    def experimental_variogram(self) -> ExperimentalVariogram | None:
+        """Lag bins the variogram was fitted to with ``variogram_binning``."""
+        return self._experimental
 
     def fit(self, x: np.ndarray, y: np.ndarray, z: np.ndarray, v: np.ndarray) -> None:
-        """Fit by constructing the OrdinaryKriging3D model."""
-        self._model = OrdinaryKriging3D(x, y, z, v, **self._params)
+        """Fit by constructing the OrdinaryKriging3D model.
+
+        With ``variogram_binning``, the variogram is fitted in-package and
+        OrdinaryKriging3D is only constructed for the pykrige solver.
+        """
+        self._model = None
+        self._search = None
+        self._adjusted_points = None
+        self._lu = None
+        self._dual_weights = None
+        self._experimental = None
+        uses_pykrige = (
+            not self.uses_neighbourhood and self._solver == KrigingSolver.PYKRIGE
+        )
+        points = np.column_stack([x, y, z]).astype(float)
+        if self._variogram_binning is None:
+            self._model = OrdinaryKriging3D(x, y, z, v, **self._params)
+            self._fitted = _FittedVariogram.from_pykrige(self._model)
+        else:
+            self._fitted = self._fit_binned(points, np.asarray(v, dtype=float))
+            if uses_pykrige:
+                params = {
+                    **self._params,
+                    "variogram_parameters": self._fitted.parameters,
+                }
+                self._model = OrdinaryKriging3D(x, y, z, v, **params)
+        if uses_pykrige:
+            return
+
+        # Samples in pykrige's anisotropy-adjusted space, reused by every block
+        self._adjusted_points = self._adjust(points)
+        if self.uses_neighbourhood:
+            uncapped = self._neighbourhood.n_neighbors is None
+            if uncapped and len(points) > _MAX_LOCAL_NEIGHBOURS:
+                logger.info(
+                    "Local kriging without n_neighbors: using at most the %d "
+                    "closest samples per node",
+                    _MAX_LOCAL_NEIGHBOURS,
+                )
+            # Closest samples as the variogram sees them, unless a search
+            # ellipsoid sets the search volume in world coordinates
+            self._search = NeighbourSearch(
+                points
+                if self._neighbourhood.ellipsoid is not None
+                else self._adjusted_points,
+                n_neighbors=(
+                    _MAX_LOCAL_NEIGHBOURS
+                    if self._neighbourhood.n_neighbors is None
+                    else self._neighbourhood.n_neighbors
+                ),
+                max_distance=self._neighbourhood.max_distance,
+                ellipsoid=self._neighbourhood.ellipsoid,
+            )
+        else:
+            self._lu = lu_factor(self._kriging_matrix(), check_finite=False)
+            self._dual_weights = self._solve_dual_weights()
+
+    def _fit_binned(self, points: np.ndarray, values: np.ndarray) -> _FittedVariogram:
+        """Fit the variogram to in-package lag bins, as OrdinaryKriging3D would."""
+        assert self._variogram_binning is not None
+        params = self._params
+        variogram_model = str(params.get("variogram_model", "linear"))
+        if variogram_model == "custom":
+            function = cast(
+                Callable[[list[float], np.ndarray], np.ndarray],
+                params["variogram_function"],
+            )
+        elif variogram_model in OrdinaryKriging3D.variogram_dict:
+            function = OrdinaryKriging3D.variogram_dict[variogram_model]
+        else:
+            msg = f"Specified variogram model {variogram_model!r} is not supported"
+            raise ValueError(msg)
+
+        center = (points.max(axis=0) + points.min(axis=0)) / 2.0
+        scaling = [
+            float(cast(float, params.get(f"anisotropy_scaling_{axis}", 1.0)))
+            for axis in "yz"
+        ]
+        angles = [
+            float(cast(float, params.get(f"anisotropy_angle_{axis}", 0.0)))
+            for axis in "xyz"
+        ]
+        parameters = variogram_parameter_list(
+            variogram_model, params.get("variogram_parameters")
+        )
+        if parameters is None:
+            adjusted = adjust_for_anisotropy(points, center, scaling, angles)
+            binning: VariogramKwargs = {
+                "nlags": int(cast(int, params.get("nlags", 6))),
+                **self._variogram_binning,
+            }
+            self._experimental = experimental_variogram(adjusted, values, **binning)
+            parameters = self._experimental.fit(
+                variogram_model, weight=bool(params.get("weight", False))
+            )
+            logger.info(
+                "Variogram %s fitted to %d binned pairs: %s",
+                variogram_model,
+                int(self._experimental.counts.sum()),
+                parameters,
+            )
+        return _FittedVariogram(
+            values=values,
+            center=list(center),
+            scaling=scaling,
+            angles=angles,
+            function=function,
+            parameters=list(parameters),
+            exact_values=bool(params.get("exact_values", True)),
+        )
 
     def predict(
         self,
@@ -34,25 +294,645 @@ class KrigingModel(BaseModel):
     ) -> InterpolationResult:
         """Execute kriging on the given grid arrays.
 
+        Args:
+            grid_x: 1D array of X grid coordinates.
+            grid_y: 1D array of Y grid coordinates.
+            grid_z: 1D array of Z grid coordinates.
+            **kwargs: ``compute_variance`` (bool, default True) set to False
+                returns no variance. Local kriging and the native solver
+                then skip it entirely; the pykrige solver still computes it
+                and only drops it from the result. ``variance_stride`` (int,
+                default 1) computes the variance on every ``n``-th grid node
+                along each axis only and fills the other nodes from the
+                closest preceding sub-grid node. Only local kriging and the
+                native solver support strides above 1; the native solver
+                then only solves its system for the sub-grid nodes.
+                ``mask``, a (Z, Y, X) boolean array, only kriges the nodes
+                where it is True, the others being NaN; the variance is then
+                computed at every kriged node. Other kwargs are passed to
+                pykrige's ``execute``.
+
         Returns:
             InterpolationResult with interpolated and variance arrays.
             Shape is (len(grid_z), len(grid_y), len(grid_x)) per pykrige convention.
+
+        Raises:
+            RuntimeError: If the model has not been fitted.
+            ValueError: If variance_stride is not a positive integer or is
+                above 1 with the pykrige solver, or if the mask does not
+                match the grid.
         """
-        if self._model is None:
+        if self._fitted is None:
             msg = "Model must be fit before predicting"
             raise RuntimeError(msg)
-        interpolated, variance = self._model.execute(
-            style="grid",
-            xpoints=grid_x,
-            ypoints=grid_y,
-            zpoints=grid_z,
-            **kwargs,
+        compute_variance = bool(kwargs.pop("compute_variance", True))
+        variance_stride = cast(int, kwargs.pop("variance_stride", 1))
+        if variance_stride < 1:
+            msg = f"variance_stride must be a positive integer, got {variance_stride}"
+            raise ValueError(msg)
+        uses_pykrige = self._search is None and self._lu is None
+        if variance_stride > 1 and uses_pykrige:
+            msg = (
+                "variance_stride is only supported by local kriging and the "
+                "native solver"
+            )
+            raise ValueError(msg)
+        shape = (len(grid_z), len(grid_y), len(grid_x))
+        mask = check_mask(kwargs.pop("mask", None), shape)
+        if mask is not None:
+            return self._predict_masked(
+                grid_x, grid_y, grid_z, mask, compute_variance, kwargs
+            )
+        if not uses_pykrige:
+            stride = variance_stride if compute_variance else None
+            return self._predict_blocks(grid_x, grid_y, grid_z, stride)
+        return self._predict_pykrige(grid_x, grid_y, grid_z, compute_variance, kwargs)
+
+    def _predict_pykrige(
+        self,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        grid_z: np.ndarray,
+        compute_variance: bool,
+        kwargs: dict[str, object],
+    ) -> InterpolationResult:
+        """Run pykrige on the grid, in tiles that fit the memory budget.
+
+        Tiles span whole rows along X and are stitched into preallocated
+        arrays. Every tile re-solves the same system and each node's
+        estimate only depends on its own right-hand side, so the result
+        matches a single call up to BLAS rounding, which can vary with the
+        tile width.
+        """
+        assert self._model is not None
+        shape = (len(grid_z), len(grid_y), len(grid_x))
+        if "backend" in kwargs:
+            z_step, y_step = shape[0], shape[1]
+        else:
+            kwargs["backend"], z_step, y_step = self._plan_backend(shape)
+
+        if (z_step, y_step) == shape[:2]:
+            interpolated, variance = self._model.execute(
+                style="grid",
+                xpoints=grid_x,
+                ypoints=grid_y,
+                zpoints=grid_z,
+                **kwargs,
+            )
+            return InterpolationResult(
+                interpolated=interpolated.astype(self._dtype, copy=False),
+                variance=variance.astype(self._dtype, copy=False)
+                if compute_variance
+                else None,
+            )
+
+        interpolated = np.empty(shape, dtype=self._dtype)
+        variance = np.empty_like(interpolated) if compute_variance else None
+        for z0 in range(0, shape[0], z_step):
+            z1 = min(z0 + z_step, shape[0])
+            for y0 in range(0, shape[1], y_step):
+                y1 = min(y0 + y_step, shape[1])
+                tile = np.s_[z0:z1, y0:y1]
+                interpolated[tile], tile_variance = self._model.execute(
+                    style="grid",
+                    xpoints=grid_x,
+                    ypoints=grid_y[y0:y1],
+                    zpoints=grid_z[z0:z1],
+                    **kwargs,
+                )
+                if variance is not None:
+                    variance[tile] = tile_variance
+        return InterpolationResult(interpolated=interpolated, variance=variance)
+
+    def _plan_backend(self, shape: tuple[int, int, int]) -> tuple[str, int, int]:
+        """Pick the pykrige backend and tiling that fit within the memory budget.
+
+        The vectorized backend is kept whenever a single row of nodes fits;
+        larger grids are split into slabs of Z levels, or into bands of Y
+        rows when one Z level does not fit. Otherwise the whole grid runs on
+        the ``"loop"`` backend.
+
+        Args:
+            shape: (Z, Y, X) grid shape.
+
+        Returns:
+            Tuple of the backend, the number of Z levels per tile and the
+            number of Y rows per tile.
+        """
+        assert self._model is not None
+        nz, ny, nx = shape
+        n_nodes = nz * ny * nx
+        n_samples = len(self._model.VALUES)
+        itemsize = np.dtype(float).itemsize
+        # The kriging matrix and its inverse, plus four (M, N + 1) blocks
+        # (distances, right-hand sides, weights and their products)
+        fixed = itemsize * 2 * (n_samples + 1) ** 2
+        per_node = itemsize * 4 * (n_samples + 1)
+        needed = fixed + per_node * n_nodes
+        backend, z_step, y_step = "vectorized", nz, ny
+        if self._memory_limit is not None and needed > self._memory_limit:
+            fitting = max(0, self._memory_limit - fixed) // per_node
+            if fitting >= ny * nx:
+                z_step = fitting // (ny * nx)
+            elif fitting >= nx:
+                z_step, y_step = 1, fitting // nx
+            else:
+                backend = "loop"
+        logger.info(
+            "Kriging plan: %d nodes, %d samples, %s backend (~%d MB vectorized), "
+            "tiles of %d x %d x %d",
+            n_nodes,
+            n_samples,
+            backend,
+            needed // 1024**2,
+            z_step,
+            y_step,
+            nx,
+        )
+        return backend, z_step, y_step
+
+    def _block_solver(self) -> tuple[_BlockSolver, int, int]:
+        """Block solver of local or native kriging.
+
+        Returns:
+            Tuple of the solver, the temporary memory it needs per node and
+            its default number of nodes per block.
+        """
+        itemsize = np.dtype(float).itemsize
+        if self._search is not None:
+            system_size = (self._search.k + 1) ** 2
+            logger.info("Local kriging: up to %d neighbours", self._search.k)
+            # Distances, masks, variograms, the system and its solver copy
+            return (
+                self._krige_block,
+                8 * system_size * itemsize,
+                max(1, _LOCAL_SYSTEM_SIZE // system_size),
+            )
+        assert self._adjusted_points is not None
+        n_rows = len(self._adjusted_points) + 1
+        logger.info("Native kriging: %d samples, factorised system", n_rows - 1)
+        # Distances, right-hand sides, their transpose and the solutions of
+        # the nodes that need a variance
+        return (
+            self._krige_global_block,
+            4 * n_rows * itemsize,
+            max(1, _LOCAL_SYSTEM_SIZE // n_rows),
+        )
+
+    def _solve_blocks(
+        self,
+        n_points: int,
+        nodes: Callable[[int, int], tuple[np.ndarray, np.ndarray]],
+        with_variance: bool,
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """Krige ``n_points`` nodes with the block solver, a block at a time.
+
+        Blocks run on ``n_jobs`` worker threads.
+
+        Args:
+            n_points: Number of nodes.
+            nodes: Maps a block ``[start, end)`` to its (M, 3) coordinates
+                and the (M,) mask of the nodes whose variance is needed.
+            with_variance: Whether any variance is needed at all.
+
+        Returns:
+            Tuple of (n_points,) kriged values and variances, or None
+            without variance. Variances of unmasked nodes are left unset.
+        """
+        krige, bytes_per_node, default_block_size = self._block_solver()
+        interpolated = np.empty(n_points, dtype=self._dtype)
+        variance = np.empty_like(interpolated) if with_variance else None
+        block_size = plan_batch_size(
+            self._memory_limit, bytes_per_node, default_block_size, self._n_jobs
+        )
+        logger.info(
+            "Kriging plan: %d nodes, blocks of %d on %d worker(s)",
+            n_points,
+            block_size,
+            resolve_n_jobs(self._n_jobs),
+        )
+
+        def block(start: int, end: int) -> None:
+            query_points, mask = nodes(start, end)
+            interpolated[start:end], sigmasq = krige(query_points, mask)
+            if variance is not None:
+                variance[start:end][mask] = sigmasq
+
+        run_batches(block, n_points, block_size, self._n_jobs)
+        return interpolated, variance
+
+    def _predict_blocks(
+        self,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        grid_z: np.ndarray,
+        variance_stride: int | None,
+    ) -> InterpolationResult:
+        """Krige every grid node with the block solver.
+
+        Nodes are processed in ZYX order to match pykrige's output, so the
+        full (M, 3) array of grid nodes is never built. Variances are only
+        solved for on the sub-grid of every ``variance_stride``-th node, or
+        not at all when it is None.
+        """
+        shape = (len(grid_z), len(grid_y), len(grid_x))
+
+        def nodes(start: int, end: int) -> tuple[np.ndarray, np.ndarray]:
+            iz, iy, ix = np.unravel_index(np.arange(start, end), shape)
+            query_points = np.column_stack([grid_x[ix], grid_y[iy], grid_z[iz]])
+            if variance_stride is None:
+                return query_points, np.zeros(end - start, dtype=bool)
+            on_subgrid = (iz % variance_stride == 0) & (iy % variance_stride == 0)
+            on_subgrid &= ix % variance_stride == 0
+            return query_points, on_subgrid
+
+        interpolated, variance = self._solve_blocks(
+            int(np.prod(shape)), nodes, variance_stride is not None
         )
+        return InterpolationResult(
+            interpolated=interpolated.reshape(shape),
+            variance=None
+            if variance is None or variance_stride is None
+            else _fill_from_subgrid(variance.reshape(shape), variance_stride),
+        )
+
+    def _predict_masked(
+        self,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        grid_z: np.ndarray,
+        mask: np.ndarray,
+        compute_variance: bool,
+        kwargs: dict[str, object],
+    ) -> InterpolationResult:
+        """Krige the grid nodes inside a (Z, Y, X) node mask; others are NaN.
+
+        The masked nodes are scattered, so they are kriged as points: by the
+        block solver a block at a time, or by pykrige's ``"points"`` style.
+        """
+        flat = np.flatnonzero(mask)
+
+        def coordinates(index: np.ndarray) -> np.ndarray:
+            iz, iy, ix = np.unravel_index(index, mask.shape)
+            return np.column_stack([grid_x[ix], grid_y[iy], grid_z[iz]])
+
+        if self._search is None and self._lu is None:
+            result = self._predict_points_pykrige(
+                coordinates(flat), compute_variance, kwargs
+            )
+            values, variances = result.interpolated, result.variance
+        else:
+
+            def nodes(start: int, end: int) -> tuple[np.ndarray, np.ndarray]:
+                with_variance = np.full(end - start, compute_variance)
+                return coordinates(flat[start:end]), with_variance
+
+            values, variances = self._solve_blocks(len(flat), nodes, compute_variance)
+
+        interpolated = np.full(mask.shape, np.nan, dtype=self._dtype)
+        interpolated.flat[flat] = values
+        variance = None
+        if variances is not None:
+            variance = np.full(mask.shape, np.nan, dtype=self._dtype)
+            variance.flat[flat] = variances
+        return InterpolationResult(interpolated=interpolated, variance=variance)
+
+    def predict_points(
+        self, points: np.ndarray, **kwargs: object
+    ) -> InterpolationResult:
+        """Krige arbitrary points, at a cost linear in their number.
+
+        Local kriging and the native solver run their block solvers on the
+        points directly; the pykrige solver uses its ``"points"`` style, in
+        batches that fit the memory budget.
+
+        Args:
+            points: (M, 3) query coordinates.
+            **kwargs: ``compute_variance`` (bool, default True) set to False
+                returns no variance. Other kwargs are passed to pykrige's
+                ``execute``.
+
+        Returns:
+            InterpolationResult with (M,) interpolated and variance arrays.
+
+        Raises:
+            RuntimeError: If the model has not been fitted.
+            ValueError: If points is not an (M, 3) array.
+        """
+        if self._fitted is None:
+            msg = "Model must be fit before predicting"
+            raise RuntimeError(msg)
+        points = check_points(points)
+        compute_variance = bool(kwargs.pop("compute_variance", True))
+        if self._search is None and self._lu is None:
+            return self._predict_points_pykrige(points, compute_variance, kwargs)
+
+        def nodes(start: int, end: int) -> tuple[np.ndarray, np.ndarray]:
+            return points[start:end], np.full(end - start, compute_variance)
+
+        interpolated, variance = self._solve_blocks(
+            len(points), nodes, compute_variance
+        )
+        return InterpolationResult(interpolated=interpolated, variance=variance)
+
+    def _predict_points_pykrige(
+        self, points: np.ndarray, compute_variance: bool, kwargs: dict[str, object]
+    ) -> InterpolationResult:
+        """Run pykrige's ``"points"`` style in batches within the budget."""
+        assert self._model is not None
+        n_points = len(points)
+        interpolated = np.empty(n_points, dtype=self._dtype)
+        variance = np.empty_like(interpolated)
+        # Points laid out as a single column of Y rows, so that the plan
+        # splits them into batches of whole "rows"
+        if "backend" in kwargs:
+            batch = n_points
+        else:
+            kwargs["backend"], _, batch = self._plan_backend((1, n_points, 1))
+        for start in range(0, n_points, max(1, batch)):
+            end = min(start + batch, n_points)
+            interpolated[start:end], variance[start:end] = self._model.execute(
+                style="points",
+                xpoints=points[start:end, 0],
+                ypoints=points[start:end, 1],
+                zpoints=points[start:end, 2],
+                **kwargs,
+            )
         return InterpolationResult(
             interpolated=interpolated,
-            variance=variance,
+            variance=variance if compute_variance else None,
+        )
+
+    def _adjust(self, query_points: np.ndarray) -> np.ndarray:
+        """Map (M, 3) points into pykrige's anisotropy-adjusted space."""
+        assert self._fitted is not None
+        fitted = self._fitted
+        return adjust_for_anisotropy(
+            query_points, fitted.center, fitted.scaling, fitted.angles
+        )
+
+    def _variogram(self, distances: np.ndarray) -> np.ndarray:
+        """Fitted variogram evaluated at distances in the adjusted space."""
+        assert self._fitted is not None
+        gamma: np.ndarray = self._fitted.function(self._fitted.parameters, distances)
+        return gamma
+
+    def _kriging_matrix(self) -> np.ndarray:
+        """(N + 1, N + 1) ordinary kriging matrix, as assembled by pykrige."""
+        assert self._adjusted_points is not None
+        n = len(self._adjusted_points)
+        a = np.zeros((n + 1, n + 1))
+        a[:n, :n] = -self._variogram(
+            cdist(self._adjusted_points, self._adjusted_points)
         )
+        np.fill_diagonal(a, 0.0)
+        a[n, :n] = 1.0
+        a[:n, n] = 1.0
+        return a
+
+    def _solve_dual_weights(self) -> np.ndarray:
+        """(N + 1,) dual kriging weights, solving the system for the values.
+
+        The kriging matrix is symmetric, so a node's estimate is the dot
+        product of its right-hand side with these weights, without solving
+        the system for the node itself.
+        """
+        assert self._fitted is not None
+        assert self._lu is not None
+        values = np.append(np.asarray(self._fitted.values, dtype=float), 0.0)
+        weights: np.ndarray = lu_solve(self._lu, values, check_finite=False)
+        return weights
+
+    def _krige_global_block(
+        self, query_points: np.ndarray, with_variance: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Krige a batch of query points with the factorised global system.
+
+        Estimates come from the dual weights; the system is only solved for
+        the points whose variance is needed.
+
+        Args:
+            query_points: (M, 3) array of prediction coordinates.
+            with_variance: (M,) mask of the points whose variance is needed.
+
+        Returns:
+            Tuple of (M,) kriged values and the kriging variances of the
+            masked points.
+        """
+        assert self._fitted is not None
+        assert self._adjusted_points is not None
+        assert self._lu is not None
+        assert self._dual_weights is not None
+        n = len(self._adjusted_points)
+
+        # Right-hand sides as columns: (N + 1, M)
+        sample_distances = cdist(self._adjusted_points, self._adjust(query_points))
+        b = np.empty((n + 1, len(query_points)))
+        b[:n] = -self._variogram(sample_distances)
+        if self._fitted.exact_values:
+            b[:n][sample_distances <= OrdinaryKriging3D.eps] = 0.0
+        b[n] = 1.0
+
+        kvalues = self._dual_weights @ b
+        b = b[:, with_variance]
+        if not b.size:
+            return kvalues, np.empty(0)
+        # LAPACK's getrs wrapper shifts the pivots in place while solving, so
+        # concurrent blocks must not share them
+        lu, pivots = self._lu
+        x = lu_solve((lu, pivots.copy()), b, check_finite=False)
+        sigmasq = (x * -b).sum(axis=0)
+        return kvalues, sigmasq
+
+    def _krige_block(
+        self, query_points: np.ndarray, with_variance: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Solve one small kriging system per query point in a batch.
+
+        Neighbour sets are padded to a fixed width; padded slots get an
+        identity row so that their weight solves to zero.
+
+        Args:
+            query_points: (M, 3) array of prediction coordinates.
+            with_variance: (M,) mask of the points whose variance is needed.
+
+        Returns:
+            Tuple of (M,) kriged values and the kriging variances of the
+            masked points. Points without any sample in their neighbourhood
+            are NaN.
+        """
+        assert self._fitted is not None
+        assert self._search is not None
+        assert self._adjusted_points is not None
+        fitted = self._fitted
+
+        # Variogram distances live in pykrige's anisotropy-adjusted space
+        adjusted_query = self._adjust(query_points)
+        distances, indices = self._search.query(
+            query_points if self._search.is_anisotropic else adjusted_query
+        )
+        found = np.isfinite(distances)
+        indices = np.where(found, indices, 0)
+        n_query, k = indices.shape
+        diag = np.arange(k)
+        neighbours = self._adjusted_points[indices]
+
+        # Left-hand side: (M, k + 1, k + 1) kriging matrices
+        pair_distances = np.linalg.norm(
+            neighbours[:, :, np.newaxis, :] - neighbours[:, np.newaxis, :, :], axis=3
+        )
+        pair_found = found[:, :, np.newaxis] & found[:, np.newaxis, :]
+        a = np.zeros((n_query, k + 1, k + 1))
+        a[:, :k, :k] = np.where(
+            pair_found,
+            -self._variogram(pair_distances),
+            0.0,
+        )
+        a[:, diag, diag] = np.where(found, 0.0, 1.0)
+        a[:, :k, k] = found
+        a[:, k, :k] = found
+
+        # Right-hand side: (M, k + 1) point-to-sample variograms
+        point_distances = np.linalg.norm(
+            adjusted_query[:, np.newaxis, :] - neighbours, axis=2
+        )
+        b = np.zeros((n_query, k + 1))
+        b[:, :k] = np.where(
+            found,
+            -self._variogram(point_distances),
+            0.0,
+        )
+        if fitted.exact_values:
+            b[:, :k] = np.where(point_distances <= OrdinaryKriging3D.eps, 0.0, b[:, :k])
+        b[:, k] = 1.0
+
+        # Nodes with an empty neighbourhood get a trivially solvable system
+        empty = ~found.any(axis=1)
+        a[empty, k, k] = 1.0
+        b[empty, k] = 0.0
+
+        x = np.linalg.solve(a, b[:, :, np.newaxis])[:, :, 0]
+        kvalues = (x[:, :k] * fitted.values[indices]).sum(axis=1)
+        sigmasq = (x[with_variance] * -b[with_variance]).sum(axis=1)
+        kvalues[empty] = np.nan
+        sigmasq[empty[with_variance]] = np.nan
+        return kvalues, sigmasq
+
+    def _get_state(self) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+        """Parameters, fitted variogram, LU factorisation, KD-tree and the
+        fitted pykrige model, whichever the solver needs."""
+        if self._fitted is None:
+            msg = "Model must be fit before saving"
+            raise ValueError(msg)
+        if self._params.get("variogram_model") == "custom":
+            msg = "Models with a custom variogram function cannot be saved"
+            raise ValueError(msg)
+        fitted = self._fitted
+        meta: dict[str, Any] = {
+            "params": {
+                "search_ellipsoid": (
+                    None
+                    if self._neighbourhood.ellipsoid is None
+                    else asdict(self._neighbourhood.ellipsoid)
+                ),
+                "n_neighbors": self._neighbourhood.n_neighbors,
+                "max_distance": self._neighbourhood.max_distance,
+                "solver": str(self._solver),
+                "n_jobs": self._n_jobs,
+                "memory_limit": self._memory_limit,
+                "dtype": self._dtype.name,
+                "variogram_binning": self._variogram_binning,
+            },
+            "kriging_params": self._params,
+            "variogram": {
+                "center": [float(c) for c in fitted.center],
+                "scaling": [float(s) for s in fitted.scaling],
+                "angles": [float(a) for a in fitted.angles],
+                "parameters": [float(p) for p in fitted.parameters],
+                "exact_values": bool(fitted.exact_values),
+            },
+        }
+        arrays = {"values": np.asarray(fitted.values)}
+        if self._experimental is not None:
+            arrays.update(
+                {
+                    "experimental_lags": self._experimental.lags,
+                    "experimental_semivariance": self._experimental.semivariance,
+                    "experimental_counts": self._experimental.counts,
+                }
+            )
+        if self._adjusted_points is not None:
+            arrays["adjusted_points"] = self._adjusted_points
+        if self._lu is not None:
+            arrays["lu"], arrays["lu_pivots"] = self._lu
+        if self._search is not None:
+            meta["search"], search_arrays = self._search.state()
+            arrays.update({f"search_{k}": a for k, a in search_arrays.items()})
+        if self._model is not None:
+            # pykrige keeps arrays and scalars only, besides the variogram
+            # function, which is looked up again by name
+            meta["pykrige"] = {}
+            for key, value in vars(self._model).items():
+                if isinstance(value, np.ndarray):
+                    arrays[f"pykrige_{key}"] = value
+                elif key != "variogram_function":
+                    meta["pykrige"][key] = value
+        return meta, arrays
+
+    @classmethod
+    def _from_state(
+        cls, meta: dict[str, Any], arrays: dict[str, np.ndarray]
+    ) -> "KrigingModel":
+        params = meta["kriging_params"]
+        model = cls(**meta["params"], **params)
+        function = OrdinaryKriging3D.variogram_dict[
+            params.get("variogram_model", "linear")
+        ]
+        variogram = meta["variogram"]
+        model._fitted = _FittedVariogram(
+            values=arrays["values"],
+            center=variogram["center"],
+            scaling=variogram["scaling"],
+            angles=variogram["angles"],
+            function=function,
+            parameters=variogram["parameters"],
+            exact_values=variogram["exact_values"],
+        )
+        if "experimental_lags" in arrays:
+            model._experimental = ExperimentalVariogram(
+                lags=arrays["experimental_lags"],
+                semivariance=arrays["experimental_semivariance"],
+                counts=arrays["experimental_counts"],
+            )
+        model._adjusted_points = arrays.get("adjusted_points")
+        if "lu" in arrays:
+            model._lu = (arrays["lu"], arrays["lu_pivots"])
+            model._dual_weights = model._solve_dual_weights()
+        if "search" in meta:
+            model._search = NeighbourSearch.from_state(
+                meta["search"], prefixed(arrays, "search_")
+            )
+        if "pykrige" in meta:
+            # Restored without OrdinaryKriging3D.__init__, which would refit
+            pykrige_model = OrdinaryKriging3D.__new__(OrdinaryKriging3D)
+            vars(pykrige_model).update(meta["pykrige"])
+            vars(pykrige_model).update(prefixed(arrays, "pykrige_"))
+            pykrige_model.variogram_function = function
+            model._model = pykrige_model
+        return model
 
     @property
     def name(self) -> str:
         return "ordinary_kriging"
+
+
+def _fill_from_subgrid(values: np.ndarray, stride: int) -> np.ndarray:
+    """Fill a (Z, Y, X) array from its every ``stride``-th node along each axis.
+
+    Each node takes the value of the closest preceding sub-grid node.
+    """
+    if stride == 1:
+        return values
+    index = [np.arange(n) // stride * stride for n in values.shape]
+    filled: np.ndarray = values[np.ix_(*index)]
+    return filled
@@ -0,0 +1,124 @@
+"""Batch planning and execution helpers shared by the models."""
+
+import os
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+_MEMORY_UNITS = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+
+def parse_memory_limit(memory_limit: int | str | None) -> int | None:
+    """Convert a memory budget to bytes.
+
+    Args:
+        memory_limit: Number of bytes, a string such as ``"512MB"`` or
+            ``"4 GB"`` (binary units), or None for no limit.
+
+    Returns:
+        Budget in bytes, or None.
+
+    Raises:
+        ValueError: If the budget is not positive or cannot be parsed.
+    """
+    if memory_limit is None:
+        return None
+    if isinstance(memory_limit, str):
+        match = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?B?)\s*", memory_limit.upper())
+        if match is None:
+            msg = f"Cannot parse memory_limit {memory_limit!r}"
+            raise ValueError(msg)
+        number, unit = match.groups()
+        memory_limit = int(float(number) * _MEMORY_UNITS[unit.rstrip("B") + "B"])
+    if memory_limit <= 0:
+        msg = f"memory_limit must be positive, got {memory_limit}"
+        raise ValueError(msg)
+    return memory_limit
+
+
+def plan_batch_size(
+    memory_limit: int | None,
+    bytes_per_item: int,
+    default: int,
+    n_jobs: int = 1,
+) -> int:
+    """Number of items per batch that keeps all workers within a memory budget.
+
+    Args:
+        memory_limit: Budget in bytes shared by all workers. None keeps
+            ``default``.
+        bytes_per_item: Peak temporary memory needed per item.
+        default: Batch size used when no budget is set.
+        n_jobs: Number of workers, see ``resolve_n_jobs``.
+
+    Returns:
+        Batch size, at least 1.
+    """
+    if memory_limit is None:
+        return default
+    workers = resolve_n_jobs(n_jobs)
+    return max(1, memory_limit // (workers * max(1, bytes_per_item)))
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Turn an sklearn-style ``n_jobs`` value into a worker count.
+
+    Args:
+        n_jobs: Number of workers. Negative values count back from the
+            number of CPUs, so -1 uses all of them.
+
+    Returns:
+        Number of workers, at least 1.
+
+    Raises:
+        ValueError: If n_jobs is 0.
+    """
+    if n_jobs == 0:
+        msg = "n_jobs must be a non-zero integer"
+        raise ValueError(msg)
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def run_batches(
+    func: Callable[[int, int], None],
+    n_items: int,
+    batch_size: int,
+    n_jobs: int = 1,
+) -> None:
+    """Call ``func(start, end)`` for consecutive batches of ``n_items``.
+
+    Batches run on a thread pool when more than one worker is requested.
+    NumPy and the KD-tree release the GIL in their heavy loops, so threads
+    scale without copying the training data into other processes. ``func``
+    is expected to write its output into a preallocated slice, which keeps
+    results identical to serial execution.
+
+    Args:
+        func: Callable processing items in ``[start, end)``.
+        n_items: Total number of items.
+        batch_size: Maximum number of items per call. With several workers,
+            batches are made smaller if needed to keep every worker busy.
+        n_jobs: Number of worker threads, see ``resolve_n_jobs``.
+    """
+    workers = resolve_n_jobs(n_jobs)
+    if workers > 1:
+        # Split small workloads so that every worker gets a batch
+        batch_size = min(batch_size, -(-n_items // workers))
+    batch_size = max(1, batch_size)
+    bounds = [
+        (start, min(start + batch_size, n_items))
+        for start in range(0, n_items, batch_size)
+    ]
+    workers = min(workers, len(bounds))
+    if workers <= 1:
+        for start, end in bounds:
+            func(start, end)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(func, start, end) for start, end in bounds]
+        for future in futures:
+            # Re-raise any exception from the worker
+            future.result()
@@ -0,0 +1,156 @@
+"""Directory format for saving fitted models without refitting on load.
+
+A saved object is a directory holding a JSON file with its parameters and
+scalar state, and one ``.npy`` file per array. Arrays are loaded as
+copy-on-write memory maps by default: loading costs little more than
+reading the JSON file, pages are only read from disk when used, and
+in-place updates of a loaded model never modify the files.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import scipy
+from scipy.spatial import cKDTree
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the layout of saved state changes incompatibly
+FORMAT_VERSION = 1
+
+MODEL_FILE = "model.json"
+
+
+def save_state(
+    path: str | Path,
+    meta: dict[str, Any],
+    arrays: dict[str, np.ndarray],
+    meta_file: str = MODEL_FILE,
+) -> None:
+    """Write metadata and arrays to a directory.
+
+    Args:
+        path: Directory to write, created if needed.
+        meta: JSON-serialisable metadata. numpy values are converted to
+            Python scalars and lists.
+        arrays: Arrays written to ``<name>.npy``. Object arrays are not
+            supported.
+        meta_file: Name of the metadata file within the directory.
+
+    Raises:
+        ValueError: If the metadata is not JSON-serialisable.
+    """
+    path = Path(path)
+    try:
+        text = json.dumps(
+            {"format_version": FORMAT_VERSION, "arrays": sorted(arrays), **meta},
+            indent=2,
+            default=_to_json,
+        )
+    except TypeError as e:
+        msg = f"Cannot save state to {path}: {e}"
+        raise ValueError(msg) from e
+    path.mkdir(parents=True, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(path / f"{name}.npy", np.asarray(array), allow_pickle=False)
+    (path / meta_file).write_text(text)
+
+
+def load_state(
+    path: str | Path, mmap: bool = True, meta_file: str = MODEL_FILE
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Read metadata and arrays written by ``save_state``.
+
+    Args:
+        path: Directory to read.
+        mmap: Memory-map the arrays copy-on-write instead of reading them.
+        meta_file: Name of the metadata file within the directory.
+
+    Returns:
+        The metadata and the arrays by name.
+
+    Raises:
+        FileNotFoundError: If the directory holds no saved state.
+        ValueError: If the state was written in another format version.
+    """
+    path = Path(path)
+    if not (path / meta_file).is_file():
+        msg = f"No saved state found in {path}"
+        raise FileNotFoundError(msg)
+    meta: dict[str, Any] = json.loads((path / meta_file).read_text())
+    version = meta.pop("format_version", None)
+    if version != FORMAT_VERSION:
+        msg = f"Unsupported format version {version!r} in {path}"
+        raise ValueError(msg)
+    arrays = {
+        name: np.load(
+            path / f"{name}.npy", mmap_mode="c" if mmap else None, allow_pickle=False
+        )
+        for name in meta.pop("arrays")
+    }
+    return meta, arrays
+
+
+def prefixed(arrays: dict[str, np.ndarray], prefix: str) -> dict[str, np.ndarray]:
+    """Arrays whose names start with ``prefix``, with the prefix removed."""
+    return {
+        name[len(prefix) :]: array
+        for name, array in arrays.items()
+        if name.startswith(prefix)
+    }
+
+
+def tree_state(tree: cKDTree) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Metadata and arrays of a KD-tree, including its built nodes."""
+    (buffer, data, n, m, leafsize, maxes, mins, indices, *_) = tree.__getstate__()
+    meta = {"scipy": scipy.__version__, "n": n, "m": m, "leafsize": leafsize}
+    arrays = {
+        "buffer": buffer,
+        "data": data,
+        "maxes": maxes,
+        "mins": mins,
+        "indices": indices,
+    }
+    return meta, arrays
+
+
+def restore_tree(meta: dict[str, Any], arrays: dict[str, np.ndarray]) -> cKDTree:
+    """Restore a KD-tree saved by ``tree_state``.
+
+    The built nodes are reused when the tree was saved by the same scipy
+    version; otherwise, or if they cannot be restored, the tree is rebuilt
+    from its points.
+    """
+    data = arrays["data"]
+    if meta["scipy"] == scipy.__version__:
+        tree = cKDTree.__new__(cKDTree)
+        try:
+            tree.__setstate__(
+                (
+                    arrays["buffer"],
+                    data,
+                    meta["n"],
+                    meta["m"],
+                    meta["leafsize"],
+                    arrays["maxes"],
+                    arrays["mins"],
+                    arrays["indices"],
+                    None,
+                    None,
+                )
+            )
+            return tree
+        except (TypeError, ValueError):
+            logger.warning("Saved KD-tree could not be restored, rebuilding it")
+    return cKDTree(np.array(data), leafsize=meta["leafsize"])
+
+
+def _to_json(value: object) -> object:
+    """Convert numpy values, which json cannot encode, to Python ones."""
+    if isinstance(value, np.generic | np.ndarray):
+        return value.tolist()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
@@ -0,0 +1,293 @@
+"""Neighbourhood search for locally restricted interpolation."""
+
+import itertools
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .persistence import restore_tree, tree_state
+
+
+@dataclass(frozen=True)
+class SearchEllipsoid:
+    """Rotatable search ellipsoid limiting which samples a grid node considers.
+
+    Angles follow the GSLIB convention: ``azimuth`` turns the major axis
+    clockwise from north (+Y), ``dip`` tilts it down from the horizontal and
+    ``rake`` rotates the ellipsoid around the major axis.
+
+    Args:
+        major: Range along the major axis.
+        semi: Range along the semi-major axis.
+        minor: Range along the minor axis.
+        azimuth: Azimuth of the major axis in degrees.
+        dip: Dip of the major axis in degrees.
+        rake: Rotation around the major axis in degrees.
+    """
+
+    major: float
+    semi: float
+    minor: float
+    azimuth: float = 0.0
+    dip: float = 0.0
+    rake: float = 0.0
+
+    def __post_init__(self) -> None:
+        if min(self.major, self.semi, self.minor) <= 0:
+            msg = f"Search ellipsoid ranges must be positive, got {self.ranges}"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_input(
+        cls, value: "SearchEllipsoid | Mapping[str, float]"
+    ) -> "SearchEllipsoid":
+        """Create from either a SearchEllipsoid or a mapping of its fields."""
+        if isinstance(value, SearchEllipsoid):
+            return value
+        if isinstance(value, Mapping):
+            return cls(**value)
+        msg = f"search_ellipsoid must be SearchEllipsoid or dict, got {type(value)}"
+        raise TypeError(msg)
+
+    @property
+    def ranges(self) -> tuple[float, float, float]:
+        """Ranges along the (major, semi, minor) axes."""
+        return (self.major, self.semi, self.minor)
+
+    @property
+    def rotation(self) -> np.ndarray:
+        """3x3 matrix rotating XYZ coordinates onto the ellipsoid axes."""
+        alpha = np.radians(90.0 - self.azimuth)
+        beta = -np.radians(self.dip)
+        theta = np.radians(self.rake)
+        sina, cosa = np.sin(alpha), np.cos(alpha)
+        sinb, cosb = np.sin(beta), np.cos(beta)
+        sint, cost = np.sin(theta), np.cos(theta)
+        return np.array(
+            [
+                [cosb * cosa, cosb * sina, -sinb],
+                [
+                    -cost * sina + sint * sinb * cosa,
+                    cost * cosa + sint * sinb * sina,
+                    sint * cosb,
+                ],
+                [
+                    sint * sina + cost * sinb * cosa,
+                    -sint * cosa + cost * sinb * sina,
+                    cost * cosb,
+                ],
+            ]
+        )
+
+    def transform(self, points: np.ndarray) -> np.ndarray:
+        """Map (N, 3) points into the space where the ellipsoid is a unit sphere.
+
+        Points inside the ellipsoid (relative to the origin) end up within
+        distance 1 of the origin.
+        """
+        rotated = points @ self.rotation.T
+        scaled: np.ndarray = rotated / np.asarray(self.ranges)
+        return scaled
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchEllipsoid(ranges={self.ranges}, azimuth={self.azimuth}, "
+            f"dip={self.dip}, rake={self.rake})"
+        )
+
+
+@dataclass(frozen=True)
+class Neighbourhood:
+    """Validated neighbourhood options of a locally restricted model.
+
+    Args:
+        n_neighbors: Maximum number of neighbours per query point.
+        max_distance: Isotropic search radius. None means unlimited.
+        ellipsoid: Anisotropic search volume. Cannot be combined with
+            ``max_distance``.
+    """
+
+    n_neighbors: int | None = None
+    max_distance: float | None = None
+    ellipsoid: SearchEllipsoid | None = None
+
+    def __post_init__(self) -> None:
+        if self.n_neighbors is not None and self.n_neighbors < 1:
+            msg = f"n_neighbors must be a positive integer, got {self.n_neighbors}"
+            raise ValueError(msg)
+        if self.max_distance is not None and self.max_distance <= 0:
+            msg = f"max_distance must be positive, got {self.max_distance}"
+            raise ValueError(msg)
+        if self.max_distance is not None and self.ellipsoid is not None:
+            msg = "Cannot combine max_distance with a search ellipsoid"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_input(
+        cls,
+        n_neighbors: int | None = None,
+        max_distance: float | None = None,
+        search_ellipsoid: SearchEllipsoid | Mapping[str, float] | None = None,
+    ) -> "Neighbourhood":
+        """Create from model arguments, taking the ellipsoid as a mapping too."""
+        ellipsoid = (
+            None
+            if search_ellipsoid is None
+            else SearchEllipsoid.from_input(search_ellipsoid)
+        )
+        return cls(n_neighbors, max_distance, ellipsoid)
+
+    @property
+    def is_local(self) -> bool:
+        """Whether any option restricts predictions to a neighbourhood."""
+        return (
+            self.n_neighbors is not None
+            or self.max_distance is not None
+            or self.ellipsoid is not None
+        )
+
+
+class NeighbourSearch:
+    """KD-tree neighbour lookup, optionally in search-ellipsoid space.
+
+    The tree is built once at construction; queries return rectangular
+    arrays so callers can stay fully vectorized. With ``n_neighbors`` they
+    are ``n_neighbors`` wide; radius-only searches are padded to the largest
+    neighbourhood of each batch of query points instead of to N.
+
+    Args:
+        points: (N, 3) training coordinates.
+        n_neighbors: Maximum number of neighbours per query point.
+            None returns every point within the search volume, which then
+            must be bounded by ``max_distance`` or ``ellipsoid``.
+        max_distance: Isotropic search radius. None means unlimited.
+        ellipsoid: Anisotropic search volume. Mutually exclusive with
+            ``max_distance``.
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        n_neighbors: int | None = None,
+        max_distance: float | None = None,
+        ellipsoid: SearchEllipsoid | None = None,
+    ):
+        if not Neighbourhood(n_neighbors, max_distance, ellipsoid).is_local:
+            msg = "An unbounded search needs n_neighbors"
+            raise ValueError(msg)
+        self._n_points = len(points)
+        self._ellipsoid = ellipsoid
+        self.n_neighbors = (
+            None if n_neighbors is None else min(n_neighbors, self._n_points)
+        )
+        if ellipsoid is not None:
+            self._upper_bound = 1.0
+            self._tree = cKDTree(ellipsoid.transform(points))
+        else:
+            self._upper_bound = np.inf if max_distance is None else max_distance
+            self._tree = cKDTree(points)
+
+    def state(self) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+        """Metadata and arrays to save the search with, KD-tree included."""
+        tree_meta, arrays = tree_state(self._tree)
+        meta = {
+            "n_points": self._n_points,
+            "n_neighbors": self.n_neighbors,
+            "upper_bound": float(self._upper_bound),
+            "ellipsoid": None if self._ellipsoid is None else asdict(self._ellipsoid),
+            "tree": tree_meta,
+        }
+        return meta, arrays
+
+    @classmethod
+    def from_state(
+        cls, meta: dict[str, Any], arrays: dict[str, np.ndarray]
+    ) -> "NeighbourSearch":
+        """Restore a search saved with ``state`` without rebuilding its tree."""
+        search = cls.__new__(cls)
+        search._n_points = meta["n_points"]
+        search._ellipsoid = (
+            None if meta["ellipsoid"] is None else SearchEllipsoid(**meta["ellipsoid"])
+        )
+        search.n_neighbors = meta["n_neighbors"]
+        search._upper_bound = meta["upper_bound"]
+        search._tree = restore_tree(meta["tree"], arrays)
+        return search
+
+    @property
+    def is_anisotropic(self) -> bool:
+        """Whether distances returned by ``query`` are in ellipsoid space."""
+        return self._ellipsoid is not None
+
+    @cached_property
+    def k(self) -> int:
+        """Expected number of neighbours per query point, to size batches.
+
+        ``n_neighbors`` when set. For radius-only searches, the largest
+        neighbourhood of up to 1024 training points, which lie where the
+        samples are densest.
+        """
+        if self.n_neighbors is not None:
+            return self.n_neighbors
+        data = self._tree.data
+        sample = data[:: max(1, len(data) // 1024)]
+        counts = self._tree.query_ball_point(
+            sample, r=self._upper_bound, return_length=True
+        )
+        return int(max(1, np.max(counts, initial=0)))
+
+    def query(self, query_points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Find the neighbours of each query point.
+
+        Args:
+            query_points: (M, 3) array of query coordinates.
+
+        Returns:
+            Tuple of (distances, indices), both of shape (M, k), sorted by
+            distance, with k ``n_neighbors`` or, for radius-only searches,
+            the largest number of neighbours of any query point. Missing
+            neighbours have infinite distance and index N.
+        """
+        if self._ellipsoid is not None:
+            query_points = self._ellipsoid.transform(query_points)
+        if self.n_neighbors is None:
+            return self._query_radius(query_points)
+        distances, indices = self._tree.query(
+            query_points,
+            k=self.n_neighbors,
+            distance_upper_bound=self._upper_bound,
+        )
+        shape = (len(query_points), self.n_neighbors)
+        return distances.reshape(shape), indices.reshape(shape)
+
+    def _query_radius(self, query_points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Every neighbour within the search radius, padded per batch."""
+        found = self._tree.query_ball_point(query_points, r=self._upper_bound)
+        counts = np.fromiter((len(f) for f in found), dtype=int, count=len(found))
+        flat = np.fromiter(
+            itertools.chain.from_iterable(found), dtype=int, count=int(counts.sum())
+        )
+        rows = np.repeat(np.arange(len(query_points)), counts)
+        distances_flat = np.linalg.norm(
+            self._tree.data[flat] - query_points[rows], axis=1
+        )
+        # Match query(): neighbours exactly on the radius are excluded
+        inside = distances_flat < self._upper_bound
+        rows, flat, distances_flat = rows[inside], flat[inside], distances_flat[inside]
+        counts = np.bincount(rows, minlength=len(query_points))
+        columns = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        shape = (len(query_points), max(1, int(counts.max(initial=0))))
+        distances = np.full(shape, np.inf)
+        indices = np.full(shape, self._n_points)
+        distances[rows, columns] = distances_flat
+        indices[rows, columns] = flat
+        order = np.argsort(distances, axis=1, kind="stable")
+        return (
+            np.take_along_axis(distances, order, axis=1),
+            np.take_along_axis(indices, order, axis=1),
+        )
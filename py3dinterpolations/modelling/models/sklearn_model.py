@@ -1,9 +1,12 @@
 """Sklearn-compatible model wrapper."""
 
+import pickle
+from typing import Any
+
 import numpy as np
 
 from ...core.types import InterpolationResult, SklearnClassifier, SklearnEstimator
-from .base import BaseModel
+from .base import BaseModel, check_mask, check_points
 
 
 class SklearnModel(BaseModel):
@@ -11,6 +14,9 @@ class SklearnModel(BaseModel):
 
     Handles classifiers (predict_proba) and regressors (predict).
 
+    Saving pickles the estimator, so only load saved models from trusted
+    sources: unpickling can run arbitrary code.
+
     Args:
         estimator: A sklearn estimator instance.
         model_name: Human-readable name for this model.
@@ -34,10 +40,22 @@ class SklearnModel(BaseModel):
     ) -> InterpolationResult:
         """Predict on a regular grid.
 
+        Args:
+            grid_x: 1D array of X grid coordinates.
+            grid_y: 1D array of Y grid coordinates.
+            grid_z: 1D array of Z grid coordinates.
+            **kwargs: ``mask``, a (Z, Y, X) boolean array: only the nodes
+                where it is True are predicted, the others are NaN.
+
         Returns:
             InterpolationResult with shape (len(grid_z), len(grid_y), len(grid_x))
             to match the convention of other models.
         """
+        shape = (len(grid_z), len(grid_y), len(grid_x))
+        mask = check_mask(kwargs.get("mask"), shape)
+        if mask is not None:
+            return self._predict_masked(grid_x, grid_y, grid_z, mask)
+
         mx, my, mz = np.meshgrid(grid_x, grid_y, grid_z, indexing="ij")
         X = np.column_stack([mx.ravel(), my.ravel(), mz.ravel()])
 
@@ -56,6 +74,65 @@ class SklearnModel(BaseModel):
             probability=probability,
         )
 
+    def _predict_masked(
+        self,
+        grid_x: np.ndarray,
+        grid_y: np.ndarray,
+        grid_z: np.ndarray,
+        mask: np.ndarray,
+    ) -> InterpolationResult:
+        """Predict the grid nodes inside a (Z, Y, X) node mask; others are NaN."""
+        interpolated = np.full(mask.shape, np.nan)
+        iz, iy, ix = np.nonzero(mask)
+        if not len(iz):
+            return InterpolationResult(interpolated=interpolated)
+        result = self.predict_points(
+            np.column_stack([grid_x[ix], grid_y[iy], grid_z[iz]])
+        )
+        interpolated[iz, iy, ix] = result.interpolated
+        probability = None
+        if result.probability is not None:
+            # Probabilities follow sklearn's (X, Y, Z, C) layout
+            probability = np.full(
+                (*mask.shape[::-1], result.probability.shape[-1]), np.nan
+            )
+            probability[ix, iy, iz] = result.probability
+        return InterpolationResult(
+            interpolated=interpolated,
+            probability=probability,
+        )
+
+    def predict_points(
+        self, points: np.ndarray, **kwargs: object
+    ) -> InterpolationResult:
+        """Predict at arbitrary (M, 3) points.
+
+        Returns:
+            InterpolationResult with (M,) predictions, and (M, C) class
+            probabilities for classifiers.
+        """
+        X = check_points(points)
+        probability = None
+        if isinstance(self._estimator, SklearnClassifier):
+            probability = self._estimator.predict_proba(X)
+        return InterpolationResult(
+            interpolated=self._estimator.predict(X),
+            probability=probability,
+        )
+
+    def _get_state(self) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+        """Name and pickled estimator, stored as a byte array."""
+        pickled = pickle.dumps(self._estimator, protocol=pickle.HIGHEST_PROTOCOL)
+        meta = {"params": {"model_name": self._model_name}}
+        return meta, {"estimator": np.frombuffer(pickled, dtype=np.uint8)}
+
+    @classmethod
+    def _from_state(
+        cls, meta: dict[str, Any], arrays: dict[str, np.ndarray]
+    ) -> "SklearnModel":
+        estimator = pickle.loads(arrays["estimator"].tobytes())
+        return cls(estimator, **meta["params"])
+
     @property
     def name(self) -> str:
         return self._model_name
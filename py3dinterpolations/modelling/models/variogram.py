@@ -0,0 +1,339 @@
+"""Experimental variograms binned without materialising all sample pairs."""
+
+import logging
+from dataclasses import dataclass
+from typing import TypedDict
+
+import numpy as np
+from pykrige.ok3d import OrdinaryKriging3D
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
+
+from .compat import fit_variogram_model
+from .parallel import parse_memory_limit, plan_batch_size, run_batches
+from .search import SearchEllipsoid
+
+logger = logging.getLogger(__name__)
+
+# Number of pair entries evaluated at once when no memory_limit is set
+_PAIR_CHUNK = 4_000_000
+
+# Subsampled pairs are drawn at random, rejecting those beyond max_lag, as
+# long as at least this share of all pairs is within range; below it, the
+# KD-tree pairs are thinned instead
+_RANDOM_PAIR_SHARE = 0.05
+
+
+class VariogramKwargs(TypedDict, total=False):
+    """Type-safe kwargs for experimental_variogram."""
+
+    nlags: int
+    max_lag: float | None
+    azimuth: float | None
+    dip: float
+    angle_tolerance: float
+    bandwidth: float | None
+    max_pairs: int | None
+    random_state: int | None
+    memory_limit: int | str | None
+    n_jobs: int
+
+
+@dataclass(frozen=True)
+class ExperimentalVariogram:
+    """Semivariances of sample pairs, averaged per lag bin.
+
+    Only bins holding at least one pair are kept, as in pykrige.
+
+    Args:
+        lags: (B,) mean pair distance of each bin.
+        semivariance: (B,) mean of ``0.5 * (v_i - v_j) ** 2`` of each bin.
+        counts: (B,) number of pairs in each bin.
+    """
+
+    lags: np.ndarray
+    semivariance: np.ndarray
+    counts: np.ndarray
+
+    def fit(self, variogram_model: str, weight: bool = False) -> list[float]:
+        """Fit a variogram model to the bins with pykrige's least squares.
+
+        Args:
+            variogram_model: One of pykrige's built-in models, e.g.
+                ``"spherical"``.
+            weight: Weight the bins at smaller lags more heavily.
+
+        Returns:
+            Variogram parameters in pykrige's order, ready to be passed as
+            ``variogram_parameters``.
+
+        Raises:
+            ValueError: If the model is not one of pykrige's built-in ones.
+        """
+        if variogram_model not in OrdinaryKriging3D.variogram_dict:
+            msg = f"Cannot fit variogram model {variogram_model!r}"
+            raise ValueError(msg)
+        return fit_variogram_model(
+            self.lags,
+            self.semivariance,
+            variogram_model,
+            OrdinaryKriging3D.variogram_dict[variogram_model],
+            weight,
+        )
+
+
+def experimental_variogram(
+    points: np.ndarray,
+    values: np.ndarray,
+    nlags: int = 6,
+    max_lag: float | None = None,
+    azimuth: float | None = None,
+    dip: float = 0.0,
+    angle_tolerance: float = 22.5,
+    bandwidth: float | None = None,
+    max_pairs: int | None = None,
+    random_state: int | None = None,
+    memory_limit: int | str | None = None,
+    n_jobs: int = 1,
+) -> ExperimentalVariogram:
+    """Bin the semivariances of sample pairs by lag.
+
+    Pairs are accumulated in blocks of rows into per-bin counts and sums,
+    so memory stays bounded by the block size instead of growing with the
+    N²/2 pairs. With ``max_lag``, pairs are found with a KD-tree and only
+    pairs below that range are visited. With ``max_pairs``, about that many
+    randomly chosen pairs are binned instead: uniformly drawn pairs, of
+    which those beyond ``max_lag`` are rejected, or a random fraction of the
+    KD-tree pairs when only a small share of all pairs is within range.
+
+    Bins have equal widths from 0 to ``max_lag``. Unlike pykrige, whose
+    bins span the smallest to the largest pair distance, bin edges do not
+    depend on the data, so subsampled and chunked passes bin alike.
+
+    Args:
+        points: (N, 3) sample coordinates.
+        values: (N,) sample values.
+        nlags: Number of lag bins.
+        max_lag: Largest lag binned. None bins every pair, up to the
+            diagonal of the samples' bounding box.
+        azimuth: Azimuth in degrees of a directional variogram, see
+            SearchEllipsoid. None bins pairs in all directions.
+        dip: Dip in degrees of the directional variogram.
+        angle_tolerance: Largest angle in degrees between a pair and the
+            direction.
+        bandwidth: Largest distance of a pair's second sample from the line
+            through its first sample along the direction. None is unlimited.
+        max_pairs: Approximate number of pairs to bin. None bins them all.
+        random_state: Seed of the pair subsampling.
+        memory_limit: Memory budget for the pair blocks, in bytes or as a
+            string such as ``"2GB"``.
+        n_jobs: Number of worker threads processing blocks in parallel.
+
+    Returns:
+        The binned ExperimentalVariogram.
+
+    Raises:
+        ValueError: If an argument is out of range or no pair is binned.
+    """
+    points = np.asarray(points, dtype=float)
+    values = np.asarray(values, dtype=float)
+    n = len(points)
+    if n < 2:
+        msg = f"At least two samples are needed, got {n}"
+        raise ValueError(msg)
+    if nlags < 1:
+        msg = f"nlags must be a positive integer, got {nlags}"
+        raise ValueError(msg)
+    if max_lag is not None and max_lag <= 0:
+        msg = f"max_lag must be positive, got {max_lag}"
+        raise ValueError(msg)
+    if not 0 < angle_tolerance <= 90:
+        msg = f"angle_tolerance must be in (0, 90], got {angle_tolerance}"
+        raise ValueError(msg)
+    if bandwidth is not None and bandwidth <= 0:
+        msg = f"bandwidth must be positive, got {bandwidth}"
+        raise ValueError(msg)
+    if max_pairs is not None and max_pairs < 1:
+        msg = f"max_pairs must be a positive integer, got {max_pairs}"
+        raise ValueError(msg)
+
+    tree = None if max_lag is None else cKDTree(points)
+    if max_lag is None:
+        max_lag = float(np.linalg.norm(points.max(axis=0) - points.min(axis=0)))
+        max_lag = max_lag or 1.0
+        n_pairs = n * (n - 1) // 2
+    else:
+        assert tree is not None
+        # Ordered pairs within range, minus each sample paired with itself
+        n_pairs = (int(tree.count_neighbors(tree, max_lag)) - n) // 2
+
+    binner = _PairBinner(
+        points, values, nlags, max_lag, azimuth, dip, angle_tolerance, bandwidth
+    )
+    budget = parse_memory_limit(memory_limit)
+    subsample = max_pairs is not None and max_pairs < n_pairs
+    share = n_pairs / (n * (n - 1) // 2)
+    partial: dict[int, np.ndarray] = {}
+
+    if subsample and share >= _RANDOM_PAIR_SHARE:
+        assert max_pairs is not None
+        # Enough draws for about max_pairs of them to fall within range
+        n_draws = int(np.ceil(max_pairs / share))
+        logger.info("Experimental variogram: %d random pairs", n_draws)
+
+        def random_block(start: int, end: int) -> None:
+            rng = _block_rng(random_state, start)
+            first = rng.integers(0, n, end - start)
+            second = rng.integers(0, n - 1, end - start)
+            # Skip over the first sample, so that no sample pairs with itself
+            second += second >= first
+            partial[start] = binner.bin_pairs(first, second)
+
+        size = plan_batch_size(budget, 12 * 8, _PAIR_CHUNK, n_jobs)
+        run_batches(random_block, n_draws, size, n_jobs)
+    else:
+        fraction = max_pairs / n_pairs if subsample and max_pairs else 1.0
+        logger.info(
+            "Experimental variogram: %d pairs%s, %s search",
+            n_pairs,
+            f" thinned to {fraction:.1%}" if fraction < 1 else "",
+            "brute-force" if tree is None else "KD-tree",
+        )
+
+        def row_block(start: int, end: int) -> None:
+            if tree is None:
+                partial[start] = binner.bin_rows(start, end)
+                return
+            found = cKDTree(points[start:end]).sparse_distance_matrix(
+                tree, max_lag, output_type="ndarray"
+            )
+            first = found["i"] + start
+            keep = found["j"] > first
+            first, second, lags = first[keep], found["j"][keep], found["v"][keep]
+            if fraction < 1:
+                keep = _block_rng(random_state, start).random(len(first)) < fraction
+                first, second, lags = first[keep], second[keep], lags[keep]
+            partial[start] = binner.bin_pairs(first, second, lags)
+
+        # Distances, semivariances, projections, bins and masks per entry
+        size = plan_batch_size(budget, 6 * 8 * n, max(1, _PAIR_CHUNK // n), n_jobs)
+        run_batches(row_block, n, size, n_jobs)
+
+    # Summing in block order keeps results independent of thread timing
+    totals = np.sum([partial[start] for start in sorted(partial)], axis=0)
+    counts, lag_sums, semivariance_sums = totals
+    binned = counts > 0
+    if not binned.any():
+        msg = "No sample pair falls within the lag bins"
+        raise ValueError(msg)
+    return ExperimentalVariogram(
+        lags=lag_sums[binned] / counts[binned],
+        semivariance=semivariance_sums[binned] / counts[binned],
+        counts=counts[binned].astype(int),
+    )
+
+
+class _PairBinner:
+    """Accumulates per-bin pair counts, lag sums and semivariance sums."""
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        values: np.ndarray,
+        nlags: int,
+        max_lag: float,
+        azimuth: float | None,
+        dip: float,
+        angle_tolerance: float,
+        bandwidth: float | None,
+    ):
+        self.points = points
+        self.values = values
+        self.nlags = nlags
+        self.max_lag = max_lag
+        self.width = max_lag / nlags
+        self.angle_cosine = float(np.cos(np.radians(angle_tolerance)))
+        self.bandwidth = bandwidth
+        # Projections on the direction, so pair angles need no pair vectors
+        self.projections = (
+            None
+            if azimuth is None
+            else points @ SearchEllipsoid(1.0, 1.0, 1.0, azimuth, dip).rotation[0]
+        )
+
+    def bin_rows(self, start: int, end: int) -> np.ndarray:
+        """Bin every pair of a sample in ``[start, end)`` with a later sample."""
+        rows = slice(start, end)
+        columns = slice(start, None)
+        lags = cdist(self.points[rows], self.points[columns])
+        keep = (
+            np.arange(start, len(self.points))[np.newaxis, :]
+            > np.arange(start, end)[:, np.newaxis]
+        )
+        along = None
+        if self.projections is not None:
+            along = np.abs(
+                self.projections[columns][np.newaxis, :]
+                - self.projections[rows, np.newaxis]
+            )
+        semivariance = (
+            0.5
+            * (self.values[columns][np.newaxis, :] - self.values[rows, np.newaxis]) ** 2
+        )
+        return self._histogram(lags.ravel(), semivariance.ravel(), keep.ravel(), along)
+
+    def bin_pairs(
+        self, first: np.ndarray, second: np.ndarray, lags: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Bin the pairs of samples ``first[i]`` and ``second[i]``."""
+        if lags is None:
+            lags = np.linalg.norm(self.points[second] - self.points[first], axis=1)
+        along = None
+        if self.projections is not None:
+            along = np.abs(self.projections[second] - self.projections[first])
+        semivariance = 0.5 * (self.values[second] - self.values[first]) ** 2
+        return self._histogram(lags, semivariance, np.ones(len(lags), bool), along)
+
+    def _histogram(
+        self,
+        lags: np.ndarray,
+        semivariance: np.ndarray,
+        keep: np.ndarray,
+        along: np.ndarray | None,
+    ) -> np.ndarray:
+        """(3, nlags) pair counts, lag sums and semivariance sums of kept pairs.
+
+        Args:
+            lags: Pair distances.
+            semivariance: Pair semivariances.
+            keep: Mask of the pairs to bin.
+            along: Absolute pair offsets along the direction, if any.
+        """
+        keep &= lags <= self.max_lag
+        if along is not None:
+            along = along.ravel()
+            keep &= along >= lags * self.angle_cosine - 1e-12
+            if self.bandwidth is not None:
+                keep &= lags**2 - along**2 <= self.bandwidth**2
+
+        # Dropped pairs go to an overflow bin instead of being copied out
+        bins = np.where(
+            keep,
+            np.minimum((lags / self.width).astype(int), self.nlags - 1),
+            self.nlags,
+        )
+        size = self.nlags + 1
+        return np.stack(
+            [
+                np.bincount(bins, minlength=size).astype(float),
+                np.bincount(bins, weights=lags, minlength=size),
+                np.bincount(bins, weights=semivariance, minlength=size),
+            ]
+        )[:, : self.nlags]
+
+
+def _block_rng(random_state: int | None, start: int) -> np.random.Generator:
+    """Generator of one block, independent of the order blocks run in."""
+    if random_state is None:
+        return np.random.default_rng()
+    return np.random.default_rng([random_state, start])
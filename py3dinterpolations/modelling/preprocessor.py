@@ -90,7 +90,7 @@ class Preprocessor:
             standardization=standardization_params,
         )
         logger.info("Preprocessing complete: %s", params)
-        return GridData(data, preprocessing_params=params)
+        return GridData(data, preprocessing_params=params, dtype=self.griddata.dtype)
 
     def _normalize_xyz(
         self, data: pd.DataFrame
@@ -198,4 +198,31 @@ def reverse_preprocessing(griddata: GridData) -> GridData:
         std = params.standardization
         data["V"] = data["V"] * std.std + std.mean
 
-    return GridData(data)
+    return GridData(data, dtype=griddata.dtype)
+
+
+def apply_preprocessing(griddata: GridData, params: PreprocessingParams) -> GridData:
+    """Transform new data with the parameters of an earlier preprocessing run.
+
+    Applies normalization of XYZ and standardization of V, so that new samples
+    land in the space a model was fitted in. Downsampling is not applied.
+
+    Args:
+        griddata: GridData in original units.
+        params: Parameters returned by a previous preprocessing run.
+
+    Returns:
+        New GridData with the transformations applied and params attached.
+    """
+    data = griddata.data.copy().reset_index()
+
+    if params.normalization is not None:
+        for axis in [Axis.X, Axis.Y, Axis.Z]:
+            data[axis.value], _ = normalize(
+                data[axis.value], params.normalization[axis]
+            )
+
+    if params.standardization is not None:
+        data["V"], _ = standardize(data["V"], params.standardization)
+
+    return GridData(data, preprocessing_params=params, dtype=griddata.dtype)
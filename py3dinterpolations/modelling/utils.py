@@ -5,17 +5,22 @@ import pandas as pd
 from ..core.types import NormalizationParams, StandardizationParams
 
 
-def normalize(series: pd.Series) -> tuple[pd.Series, NormalizationParams]:
+def normalize(
+    series: pd.Series, params: NormalizationParams | None = None
+) -> tuple[pd.Series, NormalizationParams]:
     """Normalize series to [0, 1] range.
 
     Args:
         series: Series to normalize.
+        params: Parameters of an earlier normalization to apply instead of
+            computing them from the series.
 
     Returns:
         Tuple of (normalized series, normalization params).
     """
     series = series.copy()
-    params = NormalizationParams(min=float(series.min()), max=float(series.max()))
+    if params is None:
+        params = NormalizationParams(min=float(series.min()), max=float(series.max()))
     value_range = params.max - params.min
     if value_range == 0.0:
         series[:] = 0.0
@@ -24,17 +29,24 @@ def normalize(series: pd.Series) -> tuple[pd.Series, NormalizationParams]:
     return series, params
 
 
-def standardize(series: pd.Series) -> tuple[pd.Series, StandardizationParams]:
+def standardize(
+    series: pd.Series, params: StandardizationParams | None = None
+) -> tuple[pd.Series, StandardizationParams]:
     """Standardize series to mean=0, std=1.
 
     Args:
         series: Series to standardize.
+        params: Parameters of an earlier standardization to apply instead of
+            computing them from the series.
 
     Returns:
         Tuple of (standardized series, standardization params).
     """
     series = series.copy()
-    params = StandardizationParams(mean=float(series.mean()), std=float(series.std()))
+    if params is None:
+        params = StandardizationParams(
+            mean=float(series.mean()), std=float(series.std())
+        )
     if params.std == 0.0 or pd.isna(params.std):
         series[:] = 0.0
         return series, params
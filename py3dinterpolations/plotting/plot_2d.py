@@ -31,6 +31,7 @@ def plot_2d_model(
         Matplotlib Figure.
     """
     assert modeler.result is not None
+    assert modeler.grid is not None
     axis_data = modeler.grid.grid[axis]
 
     num_rows, num_cols = number_of_plots(len(axis_data), n_cols=2)
@@ -33,14 +33,17 @@ def plot_3d_model(
         gd_reversed = modeler.griddata
 
     assert modeler.result is not None
+    assert modeler.grid is not None
+    # Dense volumes are needed for plotting, but only built once
+    mesh = modeler.grid.mesh
     # ZYX -> XYZ
     values = np.einsum("ZXY->XYZ", modeler.result.interpolated)
 
     data: list[go.Volume | go.Scatter3d] = [
         go.Volume(
-            x=modeler.grid.mesh["X"].flatten(),
-            y=modeler.grid.mesh["Y"].flatten(),
-            z=modeler.grid.mesh["Z"].flatten(),
+            x=mesh["X"].flatten(),
+            y=mesh["Y"].flatten(),
+            z=mesh["Z"].flatten(),
             value=values.flatten(),
             opacityscale=[(0, 0), (1, 1)],
             cmin=gd_reversed.specs.vmin,
@@ -39,3 +39,17 @@ def random_npdata() -> np.ndarray:
 
     data = np.column_stack((x, y, z, v))
     yield data
+
+
+@pytest.fixture
+def samples() -> tuple[np.ndarray, np.ndarray]:
+    """(80, 3) points scattered in a 10-unit cube and a smooth field over them"""
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 10, (80, 3))
+    return points, np.sin(points[:, 0]) + points[:, 2] / 10
+
+
+@pytest.fixture
+def sample_grid() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """X, Y and Z axes of a small grid over ``samples``"""
+    return np.linspace(0, 10, 7), np.linspace(0, 10, 6), np.linspace(0, 10, 5)
@@ -91,3 +91,66 @@ def test_grid3d_repr():
     r = repr(g3d)
     assert "RegularGrid3D" in r
     assert "X=" in r
+
+
+def test_grid3d_dtype():
+    """coordinate volumes follow dtype, 1D axes stay float64"""
+    g3d = RegularGrid3D(0, 1, 0, 1, 0, 1, 0.25, dtype="float32")
+    assert g3d.dtype == np.float32
+    assert g3d.grid["X"].dtype == np.float64
+    assert g3d.mesh["X"].dtype == np.float32
+    assert g3d.normalized_mesh["Z"].dtype == np.float32
+    assert g3d.prediction_points().dtype == np.float32
+
+
+def test_grid3d_axes_are_cached_and_read_only():
+    """axis arrays are computed once and shared as read-only arrays"""
+    g3d = RegularGrid3D(0, 1, 0, 2, 0, 3, 0.25)
+
+    assert g3d.X.grid is g3d.X.grid
+    assert g3d.grid["Y"] is g3d.Y.grid
+    assert g3d.normalized_grid["Z"] is g3d.normalized_grid["Z"]
+    for array in (g3d.grid["X"], g3d.normalized_grid["X"]):
+        with pytest.raises(ValueError, match="read-only"):
+            array[0] = 1.0
+
+
+def test_grid3d_sparse_meshgrid():
+    """sparse meshes broadcast to the dense ones without allocating them"""
+    g3d = RegularGrid3D(0, 1, 0, 2, 0, 3, 0.25, dtype="float32")
+    shape = g3d.mesh["X"].shape
+
+    for normalized, dense in ((False, g3d.mesh), (True, g3d.normalized_mesh)):
+        sparse = g3d.meshgrid(normalized=normalized)
+        assert sparse["X"].shape == (1, shape[1], 1)
+        assert sparse["Y"].shape == (shape[0], 1, 1)
+        assert sparse["Z"].shape == (1, 1, shape[2])
+        for axis in ("X", "Y", "Z"):
+            assert sparse[axis].dtype == np.float32
+            np.testing.assert_array_equal(
+                np.broadcast_to(sparse[axis], shape), dense[axis]
+            )
+
+
+@pytest.mark.parametrize("tile_shape", [1, 3, (2, 3, 5), (100, 100, 100)])
+def test_grid3d_iter_tiles(tile_shape):
+    """tiles cover every node once, as views of the axes"""
+    g3d = RegularGrid3D(0, 1, 0, 2, 0, 3, 0.25)
+    shape = (len(g3d.Z.grid), len(g3d.Y.grid), len(g3d.X.grid))
+    covered = np.zeros(shape, dtype=int)
+
+    for tile in g3d.iter_tiles(tile_shape):
+        covered[tile.index] += 1
+        assert covered[tile.index].shape == tile.shape
+        for axis, index in (("X", tile.x), ("Y", tile.y), ("Z", tile.z)):
+            np.testing.assert_array_equal(tile.grid[axis], g3d.grid[axis][index])
+            assert np.shares_memory(tile.grid[axis], g3d.grid[axis])
+    assert (covered == 1).all()
+
+
+def test_grid3d_iter_tiles_invalid():
+    g3d = RegularGrid3D(0, 1, 0, 2, 0, 3, 0.25)
+    with pytest.raises(ValueError, match="tile_shape"):
+        next(g3d.iter_tiles(0))
+    with pytest.raises(ValueError, match="tile_shape"):
+        next(g3d.iter_tiles((2, 2)))
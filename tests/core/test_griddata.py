@@ -91,3 +91,14 @@ def test_griddata_repr(test_data):
     r = repr(gd)
     assert "GridData" in r
     assert "points=" in r
+
+
+def test_griddata_dtype(test_data):
+    """values follow dtype, coordinates stay float64"""
+    import numpy as np
+
+    assert GridData(test_data).dtype == np.float64
+    gd = GridData(test_data, dtype="float32")
+    assert gd.dtype == np.float32
+    assert gd.data["V"].dtype == np.float32
+    assert gd.numpy_data.dtype == np.float64
@@ -82,6 +82,118 @@ def test_irregulargrid3d_with_hull(test_data):
     assert len(points_with_hull) <= len(points_no_hull)
 
 
+def test_irregulargrid3d_hull_mask_matches_points(test_data):
+    """vectorised hull mask keeps the same nodes, in the same order, as
+    testing every node against the hull"""
+    from shapely import Point
+
+    gd = GridData(test_data)
+    specs = gd.specs
+    ig3d = IrregularGrid3D(
+        x_min=specs.xmin,
+        x_max=specs.xmax,
+        x_res=3.0,
+        y_min=specs.ymin,
+        y_max=specs.ymax,
+        y_res=4.0,
+        z_min=specs.zmin,
+        z_max=specs.zmax,
+        z_res=5.0,
+        hull=gd.hull,
+    )
+    nodes = ig3d._node_coordinates()
+    inside = np.array([gd.hull.contains(Point(p[0], p[1])) for p in nodes])
+    np.testing.assert_array_equal(ig3d.prediction_points(), nodes[inside])
+
+    mask = ig3d.hull_mask
+    assert mask.shape == (len(ig3d.Y.grid), len(ig3d.X.grid))
+    assert not mask.flags.writeable
+    assert ig3d.hull_mask is mask
+    assert mask.sum() * len(ig3d.Z.grid) == inside.sum()
+
+
+def test_irregulargrid3d_without_hull_has_no_mask():
+    ig3d = IrregularGrid3D(
+        x_min=0.0,
+        x_max=1.0,
+        x_res=0.1,
+        y_min=0.0,
+        y_max=1.0,
+        y_res=0.2,
+        z_min=0.0,
+        z_max=1.0,
+        z_res=0.25,
+    )
+    assert ig3d.hull is None
+    assert ig3d.hull_mask is None
+    n_nodes = len(ig3d.X.grid) * len(ig3d.Y.grid) * len(ig3d.Z.grid)
+    assert len(ig3d.prediction_points()) == n_nodes
+
+
+@pytest.mark.parametrize("resolution", [5.0, {"X": 5.0, "Y": 4.0, "Z": 2.0}])
+def test_grid_distance_mask(test_data, resolution):
+    """nodes are kept when a sample lies within the distance, as a brute
+    force search finds"""
+    from scipy.spatial.distance import cdist
+
+    gd = GridData(test_data)
+    grid = create_grid(gd, resolution, max_extrapolation_distance=6.0)
+    samples = gd.numpy_data[:, :3]
+
+    mask = grid.distance_mask
+    assert mask.shape == (len(grid.Z.grid), len(grid.Y.grid), len(grid.X.grid))
+    assert not mask.flags.writeable
+    assert grid.distance_mask is mask
+    nodes = grid.meshgrid(sparse=False)
+    nodes = np.column_stack([nodes[axis].transpose(2, 0, 1).ravel() for axis in "XYZ"])
+    nearest = cdist(nodes, samples).min(axis=1)
+    np.testing.assert_array_equal(mask.ravel(), nearest <= 6.0)
+    assert 0 < mask.sum() < mask.size
+
+    # node_mask combines it with the hull, and prediction points follow
+    node_mask = grid.node_mask
+    assert not (node_mask & ~mask).any()
+    points = grid.prediction_points()
+    assert len(points) == node_mask.sum()
+    assert (cdist(points, samples).min(axis=1) <= 6.0 + 1e-9).all()
+
+
+def test_grid_distance_mask_skips_far_levels(test_data):
+    """Z levels out of reach of every sample are masked out entirely"""
+    gd = GridData(test_data)
+    samples = gd.numpy_data[:, :3]
+    grid = RegularGrid3D(
+        x_min=0.0,
+        x_max=50.0,
+        y_min=0.0,
+        y_max=50.0,
+        z_min=-20.0,
+        z_max=40.0,
+        gridres=5.0,
+        samples=samples,
+        max_extrapolation_distance=3.0,
+    )
+    z = grid.Z.grid
+    far = (z < samples[:, 2].min() - 3.0) | (z > samples[:, 2].max() + 3.0)
+    assert far.any()
+    assert not grid.node_mask[far].any()
+    assert grid.node_mask[~far].any()
+
+
+def test_grid_distance_mask_invalid():
+    with pytest.raises(ValueError, match="together"):
+        RegularGrid3D(**REGULARGRID3D_PARAMETERS, max_extrapolation_distance=1.0)
+    with pytest.raises(ValueError, match="positive"):
+        RegularGrid3D(
+            **REGULARGRID3D_PARAMETERS,
+            samples=np.zeros((1, 3)),
+            max_extrapolation_distance=0.0,
+        )
+    grid = RegularGrid3D(**REGULARGRID3D_PARAMETERS)
+    assert grid.distance_mask is None
+    assert grid.node_mask is None
+
+
 def test_create_grid_float(test_data):
     gd = GridData(test_data)
     grid = create_grid(gd, 5.0)
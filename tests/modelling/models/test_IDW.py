@@ -78,3 +78,372 @@ def test_idw_power_effect():
 
     # Higher power should produce different (more extreme) values
     assert not np.allclose(result_low.interpolated, result_high.interpolated)
+
+
+def _random_samples(seed, n):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(0, 10, n),
+        rng.uniform(0, 10, n),
+        rng.uniform(0, 10, n),
+        rng.uniform(0, 100, n),
+    )
+
+
+def test_idw_neighbours_all_points_matches_dense():
+    """kNN mode with k = N reproduces the dense computation."""
+    x, y, z, v = _random_samples(7, 30)
+    grid = np.arange(0, 10, 1.5)
+
+    dense = IDWModel(power=2.0)
+    dense.fit(x, y, z, v)
+    knn = IDWModel(power=2.0, n_neighbors=30)
+    knn.fit(x, y, z, v)
+
+    np.testing.assert_allclose(
+        knn.predict(grid, grid, grid).interpolated,
+        dense.predict(grid, grid, grid).interpolated,
+    )
+
+
+def test_idw_neighbours_matches_bruteforce():
+    """Each node only uses its k nearest training points."""
+    x, y, z, v = _random_samples(3, 40)
+    points = np.column_stack([x, y, z])
+    model = IDWModel(power=2.0, n_neighbors=5)
+    model.fit(x, y, z, v)
+
+    query = np.array([2.5, 7.5, 4.0])
+    result = model.predict(query[:1], query[1:2], query[2:])
+    d = np.linalg.norm(points - query, axis=1)
+    nearest = np.argsort(d)[:5]
+    w = 1.0 / d[nearest] ** 2
+    expected = (w * v[nearest]).sum() / w.sum()
+    assert np.isclose(result.interpolated.item(), expected)
+
+
+def test_idw_max_distance_leaves_far_nodes_nan():
+    x = np.array([0.0, 1.0])
+    y = np.array([0.0, 0.0])
+    z = np.array([0.0, 0.0])
+    v = np.array([10.0, 20.0])
+    model = IDWModel(power=2.0, max_distance=2.0)
+    model.fit(x, y, z, v)
+
+    result = model.predict(np.array([0.5, 50.0]), np.array([0.0]), np.array([0.0]))
+    near, far = result.interpolated.ravel()
+    assert np.isclose(near, 15.0)
+    assert np.isnan(far)
+
+
+def test_idw_max_distance_matches_dense_weights():
+    """radius-only searches weight every sample in range, as the dense path"""
+    x, y, z, v = _random_samples(5, 300)
+    model = IDWModel(power=2.0, max_distance=3.0)
+    model.fit(x, y, z, v)
+    grid = np.arange(0.0, 10.0, 2.5)
+    result = model.predict(grid, grid, grid)
+
+    gz, gy, gx = np.meshgrid(grid, grid, grid, indexing="ij")
+    nodes = np.column_stack([gx.ravel(), gy.ravel(), gz.ravel()])
+    d = np.linalg.norm(nodes[:, np.newaxis] - np.column_stack([x, y, z]), axis=2)
+    w = np.where(d < 3.0, 1.0 / np.maximum(d, 1e-12) ** 2, 0.0)
+    with np.errstate(invalid="ignore"):
+        expected = (w @ v) / w.sum(axis=1)
+    np.testing.assert_allclose(result.interpolated.ravel(), expected, rtol=1e-10)
+    assert model._search.k < len(v)
+
+
+def test_idw_neighbours_exact_interpolation():
+    x, y, z, v = _random_samples(11, 25)
+    model = IDWModel(power=2.0, n_neighbors=4)
+    model.fit(x, y, z, v)
+    result = model.predict(x[3:4], y[3:4], z[3:4])
+    assert np.isclose(result.interpolated.item(), v[3])
+
+
+@pytest.mark.parametrize("kwargs", [{"n_neighbors": 0}, {"max_distance": -1.0}])
+def test_idw_invalid_neighbourhood(kwargs):
+    with pytest.raises(ValueError):
+        IDWModel(**kwargs)
+
+
+def test_idw_search_ellipsoid_selects_neighbours():
+    """samples outside the ellipsoid do not contribute"""
+    x = np.array([0.0, 0.0, 3.0])
+    y = np.array([2.0, -2.0, 0.0])
+    z = np.zeros(3)
+    v = np.array([10.0, 20.0, 1000.0])
+    model = IDWModel(
+        power=2.0,
+        search_ellipsoid={"major": 5.0, "semi": 1.0, "minor": 1.0},
+    )
+    model.fit(x, y, z, v)
+    result = model.predict(np.array([0.0]), np.array([0.0]), np.array([0.0]))
+    assert np.isclose(result.interpolated.item(), 15.0)
+
+
+def test_idw_rejects_radius_and_ellipsoid():
+    with pytest.raises(ValueError):
+        IDWModel(max_distance=1.0, search_ellipsoid={"major": 1, "semi": 1, "minor": 1})
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"n_neighbors": 5}])
+def test_idw_parallel_matches_serial(kwargs):
+    x, y, z, v = _random_samples(5, 50)
+    grid = np.arange(0, 10, 0.7)
+
+    serial = IDWModel(power=2.0, **kwargs)
+    serial.fit(x, y, z, v)
+    parallel = IDWModel(power=2.0, n_jobs=4, **kwargs)
+    parallel.fit(x, y, z, v)
+
+    np.testing.assert_array_equal(
+        parallel.predict(grid, grid, grid).interpolated,
+        serial.predict(grid, grid, grid).interpolated,
+    )
+
+
+def test_idw_memory_limit_matches_default(caplog):
+    """a tiny budget only changes batching, not results"""
+    x, y, z, v = _random_samples(13, 40)
+    grid = np.arange(0, 10, 1.0)
+
+    default = IDWModel(power=2.0)
+    default.fit(x, y, z, v)
+    budgeted = IDWModel(power=2.0, memory_limit="64KB")
+    budgeted.fit(x, y, z, v)
+
+    with caplog.at_level("INFO", logger="py3dinterpolations.modelling.models.idw"):
+        result = budgeted.predict(grid, grid, grid)
+    np.testing.assert_array_equal(
+        result.interpolated, default.predict(grid, grid, grid).interpolated
+    )
+    # 64 KiB / (40 points * 8 bytes * 6 temporaries) = 34 nodes per batch
+    assert "batches of 34" in caplog.text
+
+
+def _bruteforce_idw(points, values, grid_x, grid_y, grid_z, power):
+    """reference IDW on a (Z, Y, X) grid"""
+    mz, my, mx = np.meshgrid(grid_z, grid_y, grid_x, indexing="ij")
+    nodes = np.column_stack([mx.ravel(), my.ravel(), mz.ravel()])
+    d = np.linalg.norm(nodes[:, np.newaxis, :] - points[np.newaxis, :, :], axis=2)
+    w = 1.0 / d**power
+    return ((w * values).sum(axis=1) / w.sum(axis=1)).reshape(mx.shape)
+
+
+@pytest.mark.parametrize("memory_limit", [None, "8KB"])
+def test_idw_separable_kernel_matches_bruteforce(memory_limit, monkeypatch):
+    """the regular-grid path never builds a meshgrid and keeps ZYX order"""
+    x, y, z, v = _random_samples(17, 35)
+    grid_x = np.linspace(0.05, 9.95, 7)
+    grid_y = np.linspace(0.05, 9.95, 5)
+    grid_z = np.linspace(0.05, 9.95, 3)
+    expected = _bruteforce_idw(
+        np.column_stack([x, y, z]), v, grid_x, grid_y, grid_z, power=1.5
+    )
+
+    model = IDWModel(power=1.5, memory_limit=memory_limit)
+    model.fit(x, y, z, v)
+    monkeypatch.setattr(np, "meshgrid", None)
+    result = model.predict(grid_x, grid_y, grid_z)
+
+    np.testing.assert_allclose(result.interpolated, expected)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"n_neighbors": 8}])
+def test_idw_float32_accuracy(kwargs):
+    """float32 kernels stay accurate even with large projected coordinates"""
+    x, y, z, v = _random_samples(23, 60)
+    x, y = x + 400_000.0, y + 4_000_000.0
+    grid_x = np.linspace(400_000.0, 400_010.0, 9)
+    grid_y = np.linspace(4_000_000.0, 4_000_010.0, 8)
+    grid_z = np.linspace(0.0, 10.0, 7)
+
+    reference = IDWModel(power=2.0, **kwargs)
+    reference.fit(x, y, z, v)
+    single = IDWModel(power=2.0, dtype="float32", **kwargs)
+    single.fit(x, y, z, v)
+
+    expected = reference.predict(grid_x, grid_y, grid_z).interpolated
+    result = single.predict(grid_x, grid_y, grid_z).interpolated
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, expected, rtol=1e-4)
+
+
+def _incremental_data():
+    rng = np.random.default_rng(8)
+    xyzv = rng.uniform(0, 10, (40, 4))
+    grid = (np.linspace(0, 10, 11), np.linspace(0, 10, 9), np.linspace(0, 10, 7))
+    return xyzv, grid
+
+
+def test_idw_partial_fit_add_matches_refit(caplog):
+    xyzv, grid = _incremental_data()
+    model = IDWModel(power=2.0, incremental=True)
+    model.fit(*xyzv[:30].T)
+    model.predict(*grid)
+    model.partial_fit(*xyzv[30:].T)
+    with caplog.at_level("INFO", logger="py3dinterpolations.modelling.models.idw"):
+        updated = model.predict(*grid).interpolated
+    assert "reusing accumulated sums" in caplog.text
+
+    refit = IDWModel(power=2.0)
+    refit.fit(*xyzv.T)
+    np.testing.assert_allclose(updated, refit.predict(*grid).interpolated)
+
+
+def test_idw_partial_fit_remove_matches_refit():
+    xyzv, grid = _incremental_data()
+    # A sample on a grid node, which the removal must recompute
+    xyzv[0, :3] = [grid[0][5], grid[1][4], grid[2][3]]
+    model = IDWModel(power=2.0, incremental=True)
+    model.fit(*xyzv.T)
+    model.predict(*grid)
+    model.partial_fit(*xyzv[:5].T, remove=True)
+    updated = model.predict(*grid).interpolated
+
+    refit = IDWModel(power=2.0)
+    refit.fit(*xyzv[5:].T)
+    np.testing.assert_allclose(updated, refit.predict(*grid).interpolated)
+
+
+def _node_mask(grid):
+    rng = np.random.default_rng(5)
+    return rng.random((len(grid[2]), len(grid[1]), len(grid[0]))) < 0.4
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"n_neighbors": 6}, {"dtype": "float32", "memory_limit": "4KB"}]
+)
+def test_idw_masked_predict_matches_unmasked(kwargs):
+    xyzv, grid = _incremental_data()
+    mask = _node_mask(grid)
+    model = IDWModel(power=2.0, **kwargs)
+    model.fit(*xyzv.T)
+    expected = model.predict(*grid).interpolated
+    masked = model.predict(*grid, mask=mask).interpolated
+
+    assert masked.dtype == expected.dtype
+    np.testing.assert_allclose(masked[mask], expected[mask], rtol=1e-6)
+    assert np.isnan(masked[~mask]).all()
+    with pytest.raises(ValueError, match="mask"):
+        model.predict(*grid, mask=mask[1:])
+
+
+def test_idw_masked_partial_fit_updates_sums(caplog):
+    xyzv, grid = _incremental_data()
+    # A removed sample on a masked-in node, which the removal must recompute
+    mask = _node_mask(grid)
+    mask[3, 4, 5] = True
+    xyzv[0, :3] = [grid[0][5], grid[1][4], grid[2][3]]
+    model = IDWModel(power=2.0, incremental=True)
+    model.fit(*xyzv[:30].T)
+    model.predict(*grid, mask=mask)
+    model.partial_fit(*xyzv[30:].T)
+    model.partial_fit(*xyzv[:1].T, remove=True)
+    with caplog.at_level("INFO", logger="py3dinterpolations.modelling.models.idw"):
+        updated = model.predict(*grid, mask=mask).interpolated
+    assert "reusing accumulated sums" in caplog.text
+
+    refit = IDWModel(power=2.0)
+    refit.fit(*xyzv[1:].T)
+    np.testing.assert_allclose(
+        updated, refit.predict(*grid, mask=mask).interpolated, equal_nan=True
+    )
+    assert np.isnan(updated[~mask]).all()
+    # Sums of another mask are not reused
+    caplog.clear()
+    with caplog.at_level("INFO", logger="py3dinterpolations.modelling.models.idw"):
+        model.predict(*grid)
+    assert "reusing accumulated sums" not in caplog.text
+
+
+def test_idw_partial_fit_without_sums_and_in_neighbourhood():
+    xyzv, grid = _incremental_data()
+    for kwargs in [{}, {"n_neighbors": 8}]:
+        model = IDWModel(power=2.0, **kwargs)
+        model.fit(*xyzv[:30].T)
+        model.partial_fit(*xyzv[30:].T)
+        expected = IDWModel(power=2.0, **kwargs)
+        expected.fit(*xyzv.T)
+        np.testing.assert_allclose(
+            model.predict(*grid).interpolated, expected.predict(*grid).interpolated
+        )
+
+
+def test_idw_partial_fit_errors():
+    xyzv, _ = _incremental_data()
+    model = IDWModel()
+    with pytest.raises(RuntimeError, match="fit"):
+        model.partial_fit(*xyzv.T)
+    model.fit(*xyzv[:2].T)
+    with pytest.raises(ValueError, match="not in the training data"):
+        model.partial_fit(*xyzv[2:3].T, remove=True)
+    with pytest.raises(ValueError, match="every training point"):
+        model.partial_fit(*xyzv[:2].T, remove=True)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"n_neighbors": 6}])
+def test_idw_predict_many_matches_predict(kwargs):
+    xyzv, grid = _incremental_data()
+    powers = [1.0, 1.5, 2.0, 3.0]
+    model = IDWModel(**kwargs)
+    model.fit(*xyzv.T)
+    results = model.predict_many(*grid, powers=powers)
+
+    assert len(results) == len(powers)
+    for power, result in zip(powers, results, strict=True):
+        single = IDWModel(power=power, **kwargs)
+        single.fit(*xyzv.T)
+        np.testing.assert_allclose(
+            result.interpolated, single.predict(*grid).interpolated, rtol=1e-12
+        )
+
+
+def test_idw_predict_many_errors():
+    xyzv, grid = _incremental_data()
+    model = IDWModel()
+    with pytest.raises(RuntimeError, match="fit"):
+        model.predict_many(*grid, powers=[1.0])
+    model.fit(*xyzv.T)
+    with pytest.raises(ValueError, match="powers"):
+        model.predict_many(*grid, powers=[])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"n_neighbors": 6},
+        {"max_distance": 4.0},
+        {"search_ellipsoid": {"major": 8.0, "semi": 5.0, "minor": 3.0}},
+    ],
+)
+def test_idw_leave_one_out_matches_refit(kwargs):
+    xyzv, _ = _incremental_data()
+    powers = [1.0, 2.0]
+    model = IDWModel(**kwargs)
+    model.fit(*xyzv.T)
+    estimates = model.predict_leave_one_out(powers)
+
+    assert estimates.shape == (len(powers), len(xyzv))
+    for row, power in zip(estimates, powers, strict=True):
+        for i in range(len(xyzv)):
+            refit = IDWModel(power=power, **kwargs)
+            refit.fit(*np.delete(xyzv, i, axis=0).T)
+            expected = refit._predict_batch(xyzv[i : i + 1, :3])
+            np.testing.assert_allclose(row[i], expected[0], rtol=1e-12)
+
+
+def test_idw_leave_one_out_defaults_and_errors():
+    xyzv, _ = _incremental_data()
+    model = IDWModel(power=2.0)
+    with pytest.raises(RuntimeError, match="fit"):
+        model.predict_leave_one_out()
+    model.fit(*xyzv.T)
+    np.testing.assert_array_equal(
+        model.predict_leave_one_out(), model.predict_leave_one_out([2.0])
+    )
+    with pytest.raises(ValueError, match="powers"):
+        model.predict_leave_one_out([])
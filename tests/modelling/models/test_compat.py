@@ -0,0 +1,68 @@
+"""test the wrappers around pykrige internals"""
+
+import numpy as np
+import pytest
+from pykrige.ok3d import OrdinaryKriging3D
+
+from py3dinterpolations.modelling.models.compat import (
+    adjust_for_anisotropy,
+    fit_variogram_model,
+    variogram_parameter_list,
+)
+
+ANISOTROPY = {
+    "anisotropy_scaling_y": 1.5,
+    "anisotropy_scaling_z": 2.0,
+    "anisotropy_angle_x": 10.0,
+    "anisotropy_angle_z": 30.0,
+}
+
+
+@pytest.fixture
+def reference(samples):
+    points, values = samples
+    return OrdinaryKriging3D(
+        *points.T, values, variogram_model="spherical", nlags=8, **ANISOTROPY
+    )
+
+
+def test_adjust_for_anisotropy_matches_pykrige(samples, reference):
+    points, _ = samples
+    original = points.copy()
+    adjusted = adjust_for_anisotropy(
+        points,
+        [reference.XCENTER, reference.YCENTER, reference.ZCENTER],
+        [reference.anisotropy_scaling_y, reference.anisotropy_scaling_z],
+        [
+            reference.anisotropy_angle_x,
+            reference.anisotropy_angle_y,
+            reference.anisotropy_angle_z,
+        ],
+    )
+    expected = np.column_stack(
+        [reference.X_ADJUSTED, reference.Y_ADJUSTED, reference.Z_ADJUSTED]
+    )
+    np.testing.assert_allclose(adjusted, expected)
+    np.testing.assert_array_equal(points, original)
+
+
+def test_fit_variogram_model_matches_pykrige(reference):
+    parameters = fit_variogram_model(
+        reference.lags,
+        reference.semivariance,
+        "spherical",
+        OrdinaryKriging3D.variogram_dict["spherical"],
+        False,
+    )
+    np.testing.assert_allclose(parameters, reference.variogram_model_parameters)
+
+
+def test_variogram_parameter_list():
+    assert variogram_parameter_list("linear", None) is None
+    assert variogram_parameter_list("linear", {"slope": 2.0, "nugget": 0.5}) == [
+        2.0,
+        0.5,
+    ]
+    assert variogram_parameter_list(
+        "spherical", {"sill": 3.0, "range": 4.0, "nugget": 0.5}
+    ) == [2.5, 4.0, 0.5]
@@ -0,0 +1,403 @@
+"""test KrigingModel"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from pykrige.ok3d import OrdinaryKriging3D
+from scipy.linalg import lu_factor, lu_solve
+
+from py3dinterpolations.modelling.models.kriging import (
+    _MAX_LOCAL_NEIGHBOURS,
+    KrigingModel,
+)
+
+
+@pytest.fixture
+def xyzv(samples):
+    """the shared samples as the x, y, z and v arrays fit() takes"""
+    points, values = samples
+    return (*points.T, values)
+
+
+def test_kriging_must_fit_before_predict(sample_grid):
+    with pytest.raises(RuntimeError, match="fit"):
+        KrigingModel().predict(*sample_grid)
+
+
+@pytest.mark.parametrize("variogram_model", ["linear", "spherical"])
+def test_local_kriging_with_all_samples_matches_global(
+    xyzv, variogram_model, sample_grid
+):
+    """an ellipsoid covering every sample reproduces global kriging"""
+    global_model = KrigingModel(variogram_model=variogram_model)
+    global_model.fit(*xyzv)
+    local_model = KrigingModel(
+        variogram_model=variogram_model,
+        search_ellipsoid={"major": 100.0, "semi": 100.0, "minor": 100.0},
+        n_neighbors=len(xyzv[3]),
+    )
+    local_model.fit(*xyzv)
+
+    expected = global_model.predict(*sample_grid)
+    result = local_model.predict(*sample_grid)
+    np.testing.assert_allclose(result.interpolated, expected.interpolated)
+    np.testing.assert_allclose(result.variance, expected.variance, atol=1e-10)
+
+
+def test_local_kriging_empty_neighbourhood_is_nan(xyzv):
+    model = KrigingModel(
+        variogram_model="linear",
+        search_ellipsoid={"major": 2.0, "semi": 2.0, "minor": 0.5},
+        n_neighbors=8,
+    )
+    model.fit(*xyzv)
+    result = model.predict(np.array([5.0, 500.0]), np.array([5.0]), np.array([5.0]))
+    assert result.interpolated.shape == (1, 1, 2)
+    assert np.isnan(result.interpolated[0, 0, 1])
+    assert np.isnan(result.variance[0, 0, 1])
+
+
+def test_local_kriging_exact_at_samples(xyzv):
+    x, y, z, v = xyzv
+    model = KrigingModel(
+        variogram_model="linear",
+        search_ellipsoid={"major": 5.0, "semi": 5.0, "minor": 5.0},
+        n_neighbors=10,
+    )
+    model.fit(x, y, z, v)
+    result = model.predict(x[:1], y[:1], z[:1])
+    assert np.isclose(result.interpolated.item(), v[0])
+
+
+def test_local_kriging_n_neighbors_only(xyzv, sample_grid):
+    """isotropic nearest-neighbour kriging over every sample matches global"""
+    global_model = KrigingModel(variogram_model="spherical")
+    global_model.fit(*xyzv)
+    local_model = KrigingModel(variogram_model="spherical", n_neighbors=len(xyzv[3]))
+    local_model.fit(*xyzv)
+
+    expected = global_model.predict(*sample_grid)
+    result = local_model.predict(*sample_grid)
+    np.testing.assert_allclose(result.interpolated, expected.interpolated)
+    np.testing.assert_allclose(result.variance, expected.variance, atol=1e-10)
+
+
+def test_local_kriging_neighbours_in_anisotropic_space(xyzv, sample_grid):
+    """nearest samples are picked in the variogram's adjusted space, as pykrige"""
+    params = {
+        "variogram_model": "linear",
+        "anisotropy_scaling_z": 2.0,
+        "anisotropy_angle_z": 30.0,
+    }
+    reference = OrdinaryKriging3D(*xyzv, **params)
+    expected, expected_variance = reference.execute(
+        "grid", *sample_grid, backend="loop", n_closest_points=8
+    )
+    model = KrigingModel(n_neighbors=8, **params)
+    model.fit(*xyzv)
+    result = model.predict(*sample_grid)
+    np.testing.assert_allclose(result.interpolated, expected)
+    np.testing.assert_allclose(result.variance, expected_variance, atol=1e-10)
+
+
+def test_local_kriging_max_distance(xyzv):
+    model = KrigingModel(variogram_model="linear", max_distance=3.0)
+    model.fit(*xyzv)
+    result = model.predict(np.array([5.0, 500.0]), np.array([5.0]), np.array([5.0]))
+    assert np.isfinite(result.interpolated[0, 0, 0])
+    assert np.isnan(result.interpolated[0, 0, 1])
+
+
+def test_local_kriging_radius_only_caps_neighbours(caplog, sample_grid):
+    """radius-only local kriging solves bounded systems, not (N + 1)-wide ones"""
+    rng = np.random.default_rng(1)
+    x, y, z = rng.uniform(0, 10, (3, 200))
+    v = np.sin(x) + z
+    model = KrigingModel(variogram_model="linear", max_distance=100.0)
+    with caplog.at_level("INFO", logger="py3dinterpolations.modelling.models.kriging"):
+        model.fit(x, y, z, v)
+    assert model._search.k == _MAX_LOCAL_NEIGHBOURS
+    assert f"at most the {_MAX_LOCAL_NEIGHBOURS} closest" in caplog.text
+    capped = KrigingModel(variogram_model="linear", max_distance=100.0, n_neighbors=64)
+    capped.fit(x, y, z, v)
+    np.testing.assert_allclose(
+        model.predict(*sample_grid).interpolated,
+        capped.predict(*sample_grid).interpolated,
+    )
+
+
+def test_local_kriging_n_jobs(xyzv, sample_grid):
+    params = {"variogram_model": "linear", "n_neighbors": 8, "memory_limit": "64KB"}
+    serial = KrigingModel(**params)
+    serial.fit(*xyzv)
+    threaded = KrigingModel(n_jobs=3, **params)
+    threaded.fit(*xyzv)
+    expected = serial.predict(*sample_grid)
+    result = threaded.predict(*sample_grid)
+    np.testing.assert_allclose(result.interpolated, expected.interpolated, rtol=1e-12)
+    np.testing.assert_allclose(result.variance, expected.variance, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [
+        ({"n_neighbors": 0}, "n_neighbors"),
+        ({"max_distance": -1.0}, "max_distance"),
+        (
+            {
+                "max_distance": 1.0,
+                "search_ellipsoid": {"major": 1.0, "semi": 1.0, "minor": 1.0},
+            },
+            "Cannot combine",
+        ),
+        ({"n_jobs": 0}, "n_jobs"),
+    ],
+)
+def test_kriging_invalid_neighbourhood(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        KrigingModel(**kwargs)
+
+
+def test_kriging_memory_limit_falls_back_to_loop(xyzv, caplog, sample_grid):
+    default = KrigingModel(variogram_model="linear")
+    default.fit(*xyzv)
+    budgeted = KrigingModel(variogram_model="linear", memory_limit=1024)
+    budgeted.fit(*xyzv)
+
+    with caplog.at_level("INFO", logger="py3dinterpolations.modelling.models.kriging"):
+        result = budgeted.predict(*sample_grid)
+    assert "loop backend" in caplog.text
+    expected = default.predict(*sample_grid)
+    np.testing.assert_allclose(result.interpolated, expected.interpolated)
+
+
+def test_local_kriging_memory_limit(xyzv, sample_grid):
+    params = {
+        "variogram_model": "linear",
+        "search_ellipsoid": {"major": 5.0, "semi": 5.0, "minor": 5.0},
+        "n_neighbors": 6,
+    }
+    default = KrigingModel(**params)
+    default.fit(*xyzv)
+    budgeted = KrigingModel(memory_limit="4KB", **params)
+    budgeted.fit(*xyzv)
+    np.testing.assert_allclose(
+        budgeted.predict(*sample_grid).interpolated,
+        default.predict(*sample_grid).interpolated,
+    )
+
+
+def test_kriging_float32_output(xyzv, sample_grid):
+    reference = KrigingModel(variogram_model="linear")
+    reference.fit(*xyzv)
+    single = KrigingModel(variogram_model="linear", dtype="float32")
+    single.fit(*xyzv)
+    expected = reference.predict(*sample_grid)
+    result = single.predict(*sample_grid)
+    assert result.interpolated.dtype == np.float32
+    assert result.variance.dtype == np.float32
+    np.testing.assert_allclose(result.interpolated, expected.interpolated, rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"variogram_model": "linear"},
+        {"variogram_model": "spherical", "exact_values": False},
+        {
+            "variogram_model": "gaussian",
+            "anisotropy_scaling_z": 2.0,
+            "anisotropy_angle_z": 30.0,
+        },
+    ],
+)
+def test_native_solver_matches_pykrige(xyzv, params, sample_grid):
+    reference = KrigingModel(**params)
+    reference.fit(*xyzv)
+    native = KrigingModel(solver="native", **params)
+    native.fit(*xyzv)
+
+    expected = reference.predict(*sample_grid)
+    result = native.predict(*sample_grid)
+    # LU solves and pykrige's explicit inverse round differently on the
+    # ill-conditioned gaussian system
+    np.testing.assert_allclose(result.interpolated, expected.interpolated)
+    np.testing.assert_allclose(result.variance, expected.variance, atol=1e-8)
+
+
+def test_native_solver_exact_at_samples(xyzv):
+    x, y, z, v = xyzv
+    model = KrigingModel(variogram_model="linear", solver="native")
+    model.fit(x, y, z, v)
+    result = model.predict(x[:1], y[:1], z[:1])
+    assert np.isclose(result.interpolated.item(), v[0])
+
+
+def test_native_solver_factorises_once(xyzv, sample_grid):
+    model = KrigingModel(
+        variogram_model="linear", solver="native", memory_limit="8KB", n_jobs=2
+    )
+    with patch(
+        "py3dinterpolations.modelling.models.kriging.lu_factor", wraps=lu_factor
+    ) as mock:
+        model.fit(*xyzv)
+        first = model.predict(*sample_grid)
+        second = model.predict(sample_grid[0][:2], *sample_grid[1:])
+    mock.assert_called_once()
+    np.testing.assert_allclose(second.interpolated, first.interpolated[:, :, :2])
+
+
+def test_native_solver_threads_share_factorisation_safely():
+    """concurrent blocks solving with the shared LU factorisation match the
+    serial result; LAPACK shifts the pivots in place while solving"""
+    rng = np.random.default_rng(3)
+    x, y, z = rng.uniform(0, 10, (3, 300))
+    v = np.sin(x) + z
+    grid = np.linspace(0, 10, 12)
+    params = {"variogram_model": "linear", "solver": "native", "memory_limit": "64KB"}
+    serial = KrigingModel(**params)
+    serial.fit(x, y, z, v)
+    expected = serial.predict(grid, grid, grid)
+    threaded = KrigingModel(n_jobs=8, **params)
+    threaded.fit(x, y, z, v)
+    for _ in range(5):
+        result = threaded.predict(grid, grid, grid)
+        np.testing.assert_allclose(result.interpolated, expected.interpolated)
+        np.testing.assert_allclose(result.variance, expected.variance)
+
+
+def test_native_solver_solves_only_for_variances(xyzv, sample_grid):
+    """estimates use the dual weights; the system is solved per node only
+    for the variances that are asked for"""
+    model = KrigingModel(variogram_model="linear", solver="native")
+    model.fit(*xyzv)
+    expected = model.predict(*sample_grid)
+    with patch(
+        "py3dinterpolations.modelling.models.kriging.lu_solve", wraps=lu_solve
+    ) as mock:
+        estimate = model.predict(*sample_grid, compute_variance=False)
+        mock.assert_not_called()
+        strided = model.predict(*sample_grid, variance_stride=2)
+    solved = sum(call.args[1].shape[1] for call in mock.call_args_list)
+    assert solved == np.prod([len(axis[::2]) for axis in sample_grid])
+    np.testing.assert_allclose(estimate.interpolated, expected.interpolated)
+    np.testing.assert_allclose(strided.interpolated, expected.interpolated)
+
+
+def test_native_solver_rejects_pseudo_inv():
+    with pytest.raises(ValueError, match="pseudo_inv"):
+        KrigingModel(solver="native", pseudo_inv=True)
+    with pytest.raises(ValueError, match="KrigingSolver"):
+        KrigingModel(solver="cholesky")
+
+
+# 80 samples: 104976 bytes for the kriging matrices, 2592 per node
+@pytest.mark.parametrize(
+    "memory_limit, tiles",
+    [(104976 + 2 * 42 * 2592, "2 x 6 x 7"), (104976 + 21 * 2592, "1 x 3 x 7")],
+)
+def test_kriging_memory_limit_tiles_grid(
+    xyzv, caplog, memory_limit, tiles, sample_grid
+):
+    """tiled pykrige execution matches a single call up to BLAS rounding"""
+    default = KrigingModel(variogram_model="spherical")
+    default.fit(*xyzv)
+    budgeted = KrigingModel(variogram_model="spherical", memory_limit=memory_limit)
+    budgeted.fit(*xyzv)
+
+    with caplog.at_level("INFO", logger="py3dinterpolations.modelling.models.kriging"):
+        result = budgeted.predict(*sample_grid)
+    assert f"vectorized backend (~0 MB vectorized), tiles of {tiles}" in caplog.text
+    expected = default.predict(*sample_grid)
+    np.testing.assert_allclose(result.interpolated, expected.interpolated, rtol=1e-12)
+    np.testing.assert_allclose(result.variance, expected.variance, rtol=1e-12)
+
+
+KRIGING_MODES = [
+    {},
+    {"memory_limit": 104976 + 16 * 2592},
+    {"solver": "native"},
+    {"n_neighbors": 12},
+]
+
+
+@pytest.mark.parametrize("params", KRIGING_MODES)
+def test_kriging_without_variance(xyzv, params, sample_grid):
+    model = KrigingModel(variogram_model="linear", **params)
+    model.fit(*xyzv)
+    expected = model.predict(*sample_grid)
+    result = model.predict(*sample_grid, compute_variance=False)
+    assert result.variance is None
+    np.testing.assert_array_equal(result.interpolated, expected.interpolated)
+
+
+@pytest.mark.parametrize("params", KRIGING_MODES[2:])
+def test_kriging_variance_stride(xyzv, params, sample_grid):
+    model = KrigingModel(variogram_model="linear", **params)
+    model.fit(*xyzv)
+    full = model.predict(*sample_grid).variance
+    coarse = model.predict(*sample_grid, variance_stride=3).variance
+
+    assert coarse.shape == full.shape
+    np.testing.assert_allclose(coarse[::3, ::3, ::3], full[::3, ::3, ::3])
+    # Nodes between sub-grid nodes repeat the preceding one
+    np.testing.assert_array_equal(coarse[:3, :3, :3], coarse[0, 0, 0])
+    np.testing.assert_array_equal(coarse[3, 1, 2], coarse[3, 0, 0])
+
+
+@pytest.mark.parametrize("params", KRIGING_MODES)
+def test_kriging_masked_predict_matches_unmasked(xyzv, params, sample_grid):
+    model = KrigingModel(variogram_model="linear", **params)
+    model.fit(*xyzv)
+    shape = tuple(len(axis) for axis in reversed(sample_grid))
+    mask = np.random.default_rng(1).random(shape) < 0.5
+    expected = model.predict(*sample_grid)
+    # pykrige rejects strides; the block solvers ignore them on masked grids
+    stride = 1 if params in KRIGING_MODES[:2] else 2
+    masked = model.predict(*sample_grid, mask=mask, variance_stride=stride)
+
+    np.testing.assert_allclose(masked.interpolated[mask], expected.interpolated[mask])
+    np.testing.assert_allclose(masked.variance[mask], expected.variance[mask])
+    assert np.isnan(masked.interpolated[~mask]).all()
+    assert np.isnan(masked.variance[~mask]).all()
+
+
+def test_kriging_invalid_variance_stride(xyzv, sample_grid):
+    model = KrigingModel(variogram_model="linear")
+    model.fit(*xyzv)
+    with pytest.raises(ValueError, match="variance_stride"):
+        model.predict(*sample_grid, variance_stride=0)
+    # pykrige computes every node's variance, so it cannot honour a stride
+    with pytest.raises(ValueError, match="native solver"):
+        model.predict(*sample_grid, variance_stride=2)
+
+
+@pytest.mark.parametrize("mode", [{"n_neighbors": 8}, {"solver": "native"}])
+def test_kriging_variogram_binning_given_parameters(xyzv, mode, sample_grid):
+    """with fixed variogram parameters, skipping pykrige changes nothing"""
+    params = {"variogram_model": "spherical", "variogram_parameters": [2.0, 6.0, 0.1]}
+    expected = KrigingModel(**params, **mode)
+    expected.fit(*xyzv)
+    model = KrigingModel(**params, **mode, variogram_binning={})
+    with patch.object(OrdinaryKriging3D, "__init__") as mock:
+        model.fit(*xyzv)
+    mock.assert_not_called()
+    assert model.experimental_variogram is None
+
+    result = model.predict(*sample_grid)
+    reference = expected.predict(*sample_grid)
+    np.testing.assert_allclose(result.interpolated, reference.interpolated, rtol=1e-12)
+    np.testing.assert_allclose(result.variance, reference.variance, rtol=1e-12)
+
+
+def test_kriging_variogram_binning_fits_variogram(xyzv, sample_grid):
+    """the variogram is fitted to the in-package bins and fed to pykrige"""
+    binning = {"max_lag": 8.0, "max_pairs": 500, "random_state": 0}
+    model = KrigingModel(variogram_model="linear", nlags=5, variogram_binning=binning)
+    model.fit(*xyzv)
+    experimental = model.experimental_variogram
+    assert experimental is not None
+    assert len(experimental.lags) <= 5
+    assert model._model.variogram_model_parameters == experimental.fit("linear")
+    assert np.isfinite(model.predict(*sample_grid).interpolated).all()
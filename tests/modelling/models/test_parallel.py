@@ -0,0 +1,68 @@
+"""test batch execution helpers"""
+
+import os
+
+import numpy as np
+import pytest
+
+from py3dinterpolations.modelling.models.parallel import (
+    parse_memory_limit,
+    plan_batch_size,
+    resolve_n_jobs,
+    run_batches,
+)
+
+
+def test_resolve_n_jobs():
+    assert resolve_n_jobs(1) == 1
+    assert resolve_n_jobs(4) == 4
+    assert resolve_n_jobs(-1) == (os.cpu_count() or 1)
+    with pytest.raises(ValueError):
+        resolve_n_jobs(0)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 3])
+def test_run_batches_covers_all_items(n_jobs):
+    out = np.zeros(103)
+
+    def fill(start, end):
+        out[start:end] += np.arange(start, end)
+
+    run_batches(fill, len(out), batch_size=10, n_jobs=n_jobs)
+    np.testing.assert_array_equal(out, np.arange(103))
+
+
+def test_run_batches_propagates_errors():
+    def fail(start, end):
+        raise KeyError("boom")
+
+    with pytest.raises(KeyError):
+        run_batches(fail, 10, batch_size=2, n_jobs=2)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, None),
+        (2048, 2048),
+        ("512MB", 512 * 1024**2),
+        ("4 gb", 4 * 1024**3),
+        ("1.5G", int(1.5 * 1024**3)),
+    ],
+)
+def test_parse_memory_limit(value, expected):
+    assert parse_memory_limit(value) == expected
+
+
+@pytest.mark.parametrize("value", ["lots", 0, "-1GB"])
+def test_parse_memory_limit_invalid(value):
+    with pytest.raises(ValueError):
+        parse_memory_limit(value)
+
+
+def test_plan_batch_size():
+    assert plan_batch_size(None, 100, default=7) == 7
+    assert plan_batch_size(10_000, 100, default=7) == 100
+    assert plan_batch_size(10_000, 100, default=7, n_jobs=4) == 25
+    # never below one item per batch
+    assert plan_batch_size(10, 100, default=7) == 1
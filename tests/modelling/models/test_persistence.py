@@ -0,0 +1,109 @@
+"""test saving and loading fitted models"""
+
+import json
+
+import numpy as np
+import pytest
+from sklearn.neighbors import KNeighborsRegressor
+
+from py3dinterpolations.modelling.models import (
+    BaseModel,
+    IDWModel,
+    KrigingModel,
+    SklearnModel,
+)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        lambda: IDWModel(power=2),
+        lambda: IDWModel(n_neighbors=5, dtype="float32"),
+        lambda: IDWModel(search_ellipsoid={"major": 6.0, "semi": 4.0, "minor": 2.0}),
+        lambda: KrigingModel(variogram_model="spherical"),
+        lambda: KrigingModel(variogram_model="linear", solver="native"),
+        lambda: KrigingModel(variogram_model="spherical", n_neighbors=10),
+        lambda: KrigingModel(
+            variogram_model="exponential",
+            max_distance=5.0,
+            variogram_binning={"max_lag": 8.0},
+        ),
+        lambda: SklearnModel(KNeighborsRegressor(3), model_name="knn"),
+    ],
+)
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_round_trip(model, mmap, samples, tmp_path, monkeypatch, sample_grid):
+    """a loaded model predicts exactly like the saved one, without refitting"""
+    points, values = samples
+    fitted = model()
+    fitted.fit(*points.T, values)
+    expected = fitted.predict(*sample_grid)
+    fitted.save(tmp_path)
+
+    def refit(*args, **kwargs):
+        raise AssertionError("loading must not refit")
+
+    monkeypatch.setattr(type(fitted), "fit", refit)
+    monkeypatch.setattr("pykrige.ok3d.OrdinaryKriging3D.__init__", refit)
+    loaded = BaseModel.load(tmp_path, mmap=mmap)
+    result = loaded.predict(*sample_grid)
+
+    assert type(loaded) is type(fitted)
+    assert loaded.name == fitted.name
+    np.testing.assert_array_equal(result.interpolated, expected.interpolated)
+    if expected.variance is not None:
+        np.testing.assert_array_equal(result.variance, expected.variance)
+
+
+@pytest.mark.parametrize("masked", [False, True])
+def test_load_incremental_idw(samples, tmp_path, masked, sample_grid):
+    """incremental sums are restored and can be updated after loading"""
+    points, values = samples
+    mask = None
+    if masked:
+        shape = (len(sample_grid[2]), len(sample_grid[1]), len(sample_grid[0]))
+        mask = np.random.default_rng(2).random(shape) < 0.5
+    model = IDWModel(power=2, incremental=True)
+    model.fit(*points[:70].T, values[:70])
+    model.predict(*sample_grid, mask=mask)
+    model.save(tmp_path)
+
+    loaded = IDWModel.load(tmp_path)
+    loaded.partial_fit(*points[70:].T, values[70:])
+    model.partial_fit(*points[70:].T, values[70:])
+    np.testing.assert_allclose(
+        loaded.predict(*sample_grid, mask=mask).interpolated,
+        model.predict(*sample_grid, mask=mask).interpolated,
+    )
+    assert (loaded._sums.mask is None) is not masked
+    # Copy-on-write maps leave the saved sums untouched
+    reloaded = IDWModel.load(tmp_path)
+    assert len(reloaded._values) == 70
+
+
+def test_save_load_errors(samples, tmp_path):
+    points, values = samples
+    with pytest.raises(ValueError, match="fit before saving"):
+        IDWModel().save(tmp_path)
+    custom = KrigingModel(
+        variogram_model="custom",
+        variogram_parameters=[1.0],
+        variogram_function=lambda params, d: params[0] * d,
+    )
+    custom.fit(*points.T, values)
+    with pytest.raises(ValueError, match="custom variogram"):
+        custom.save(tmp_path)
+    with pytest.raises(FileNotFoundError, match="No saved state"):
+        BaseModel.load(tmp_path / "missing")
+
+    idw = IDWModel()
+    idw.fit(*points.T, values)
+    idw.save(tmp_path)
+    with pytest.raises(ValueError, match="is not a KrigingModel"):
+        KrigingModel.load(tmp_path)
+
+    meta = json.loads((tmp_path / "model.json").read_text())
+    meta["format_version"] = 0
+    (tmp_path / "model.json").write_text(json.dumps(meta))
+    with pytest.raises(ValueError, match="format version"):
+        BaseModel.load(tmp_path)
@@ -0,0 +1,65 @@
+"""test point predictions of every model"""
+
+import numpy as np
+import pytest
+from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
+
+from py3dinterpolations.modelling.models import IDWModel, KrigingModel, SklearnModel
+
+
+def grid_nodes(grid):
+    """grid nodes in the (Z, Y, X) order of predict's output"""
+    mz, my, mx = np.meshgrid(grid[2], grid[1], grid[0], indexing="ij")
+    return np.column_stack([mx.ravel(), my.ravel(), mz.ravel()])
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        lambda: IDWModel(power=2),
+        lambda: IDWModel(n_neighbors=6, memory_limit="4KB", n_jobs=2),
+        lambda: KrigingModel(variogram_model="spherical"),
+        lambda: KrigingModel(variogram_model="spherical", memory_limit="100KB"),
+        lambda: KrigingModel(variogram_model="linear", solver="native", n_jobs=2),
+        lambda: KrigingModel(variogram_model="spherical", n_neighbors=10),
+        lambda: SklearnModel(KNeighborsRegressor(3)),
+    ],
+)
+def test_predict_points_matches_grid(model, samples, sample_grid):
+    """points at the grid nodes get the values of the grid prediction"""
+    points, values = samples
+    fitted = model()
+    fitted.fit(*points.T, values)
+    grid = fitted.predict(*sample_grid)
+    result = fitted.predict_points(grid_nodes(sample_grid))
+
+    assert result.interpolated.shape == (len(grid_nodes(sample_grid)),)
+    np.testing.assert_allclose(
+        result.interpolated, grid.interpolated.ravel(), rtol=1e-10, atol=1e-12
+    )
+    if grid.variance is not None:
+        np.testing.assert_allclose(
+            result.variance, grid.variance.ravel(), rtol=1e-10, atol=1e-12
+        )
+        assert (
+            fitted.predict_points(points[:3], compute_variance=False).variance is None
+        )
+
+
+def test_predict_points_classifier(samples):
+    points, values = samples
+    model = SklearnModel(KNeighborsClassifier(3))
+    model.fit(*points.T, (values > 0).astype(int))
+    result = model.predict_points(points[:5])
+    assert result.interpolated.shape == (5,)
+    assert result.probability.shape == (5, 2)
+
+
+def test_predict_points_errors(samples):
+    points, values = samples
+    with pytest.raises(RuntimeError, match="fit"):
+        IDWModel().predict_points(points)
+    model = KrigingModel(variogram_model="linear")
+    model.fit(*points.T, values)
+    with pytest.raises(ValueError, match=r"\(M, 3\)"):
+        model.predict_points(points[:, :2])
@@ -0,0 +1,127 @@
+"""test search ellipsoid and neighbour search"""
+
+import numpy as np
+import pytest
+
+from py3dinterpolations.modelling.models import IDWModel, KrigingModel
+from py3dinterpolations.modelling.models.search import (
+    Neighbourhood,
+    NeighbourSearch,
+    SearchEllipsoid,
+)
+
+
+def test_search_ellipsoid_default_orientation():
+    """azimuth 0 points the major axis north (+Y)"""
+    ellipsoid = SearchEllipsoid(major=10.0, semi=5.0, minor=1.0)
+    transformed = ellipsoid.transform(
+        np.array([[0.0, 10.0, 0.0], [5.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    )
+    np.testing.assert_allclose(np.linalg.norm(transformed, axis=1), 1.0)
+
+
+def test_search_ellipsoid_azimuth():
+    """azimuth 90 points the major axis east (+X)"""
+    ellipsoid = SearchEllipsoid(major=10.0, semi=5.0, minor=1.0, azimuth=90.0)
+    transformed = ellipsoid.transform(np.array([[10.0, 0.0, 0.0], [0.0, 10.0, 0.0]]))
+    np.testing.assert_allclose(np.linalg.norm(transformed, axis=1), [1.0, 2.0])
+
+
+def test_search_ellipsoid_rotation_is_orthonormal():
+    ellipsoid = SearchEllipsoid(3.0, 2.0, 1.0, azimuth=30.0, dip=20.0, rake=10.0)
+    rot = ellipsoid.rotation
+    np.testing.assert_allclose(rot @ rot.T, np.eye(3), atol=1e-12)
+
+
+def test_search_ellipsoid_from_input():
+    ellipsoid = SearchEllipsoid.from_input({"major": 3.0, "semi": 2.0, "minor": 1.0})
+    assert ellipsoid == SearchEllipsoid(3.0, 2.0, 1.0)
+    assert SearchEllipsoid.from_input(ellipsoid) is ellipsoid
+    with pytest.raises(TypeError):
+        SearchEllipsoid.from_input(3.0)  # type: ignore[arg-type]
+
+
+def test_search_ellipsoid_invalid_range():
+    with pytest.raises(ValueError):
+        SearchEllipsoid(major=1.0, semi=0.0, minor=1.0)
+
+
+def test_neighbour_search_ellipsoid_limits_neighbours():
+    """only samples inside the ellipsoid are returned"""
+    points = np.array([[0.0, 8.0, 0.0], [8.0, 0.0, 0.0], [0.0, 0.0, 0.5]])
+    search = NeighbourSearch(
+        points, ellipsoid=SearchEllipsoid(major=10.0, semi=1.0, minor=1.0)
+    )
+    distances, indices = search.query(np.zeros((1, 3)))
+    assert search.is_anisotropic
+    assert sorted(indices[np.isfinite(distances)].tolist()) == [0, 2]
+
+
+def test_neighbour_search_fixed_width():
+    points = np.arange(30, dtype=float).reshape(10, 3)
+    search = NeighbourSearch(points, n_neighbors=4)
+    distances, indices = search.query(points[:3])
+    assert distances.shape == indices.shape == (3, 4)
+    np.testing.assert_array_equal(indices[:, 0], [0, 1, 2])
+
+
+def test_neighbour_search_rejects_radius_and_ellipsoid():
+    with pytest.raises(ValueError):
+        NeighbourSearch(
+            np.zeros((2, 3)),
+            max_distance=1.0,
+            ellipsoid=SearchEllipsoid(1.0, 1.0, 1.0),
+        )
+
+
+def test_neighbour_search_radius_only():
+    """radius searches return every neighbour in range, padded only to the
+    largest neighbourhood of the batch"""
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 10, (500, 3))
+    query = rng.uniform(0, 10, (50, 3))
+    search = NeighbourSearch(points, max_distance=1.5)
+    distances, indices = search.query(query)
+
+    brute = np.linalg.norm(query[:, np.newaxis] - points[np.newaxis], axis=2)
+    counts = (brute < 1.5).sum(axis=1)
+    assert distances.shape == (50, counts.max())
+    assert distances.shape[1] < len(points)
+    for row in range(len(query)):
+        found = np.isfinite(distances[row])
+        expected = np.flatnonzero(brute[row] < 1.5)
+        assert sorted(indices[row, found].tolist()) == expected.tolist()
+        np.testing.assert_allclose(distances[row, found], np.sort(brute[row, expected]))
+        assert (indices[row, ~found] == len(points)).all()
+    assert 0 < search.k < len(points)
+
+
+def test_neighbour_search_rejects_unbounded():
+    with pytest.raises(ValueError, match="n_neighbors"):
+        NeighbourSearch(np.zeros((2, 3)))
+
+
+def test_neighbourhood_from_input():
+    neighbourhood = Neighbourhood.from_input(
+        n_neighbors=4, search_ellipsoid={"major": 3.0, "semi": 2.0, "minor": 1.0}
+    )
+    assert neighbourhood.ellipsoid == SearchEllipsoid(3.0, 2.0, 1.0)
+    assert neighbourhood.is_local
+    assert not Neighbourhood().is_local
+
+
+@pytest.mark.parametrize("model_class", [IDWModel, KrigingModel])
+@pytest.mark.parametrize(
+    ("params", "match"),
+    [
+        ({"n_neighbors": 0}, "n_neighbors"),
+        ({"max_distance": 0.0}, "max_distance"),
+        (
+            {"max_distance": 1.0, "search_ellipsoid": SearchEllipsoid(3, 2, 1)},
+            "Cannot combine",
+        ),
+    ],
+)
+def test_models_share_neighbourhood_validation(model_class, params, match):
+    with pytest.raises(ValueError, match=match):
+        model_class(**params)
@@ -1,8 +1,7 @@
 """test SklearnModel wrapper"""
 
 import numpy as np
-import pytest
-from sklearn.neighbors import KNeighborsRegressor
+from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
 
 from py3dinterpolations.modelling.models.sklearn_model import SklearnModel
 
@@ -26,3 +25,25 @@ def test_sklearn_model_regressor():
     assert result.interpolated.shape == (len(grid_z), len(grid_y), len(grid_x))
     assert result.probability is None
     assert model.name == "knn"
+
+
+def test_sklearn_model_masked_predict():
+    rng = np.random.default_rng(0)
+    x, y, z = rng.uniform(0, 10, (3, 50))
+    model = SklearnModel(KNeighborsClassifier(n_neighbors=3))
+    model.fit(x, y, z, (x > 5).astype(int))
+    grid_x, grid_y, grid_z = np.arange(0, 10, 2.0), np.arange(0, 10, 2.5), np.ones(2)
+    mask = rng.random((len(grid_z), len(grid_y), len(grid_x))) < 0.5
+
+    expected = model.predict(grid_x, grid_y, grid_z)
+    result = model.predict(grid_x, grid_y, grid_z, mask=mask)
+    np.testing.assert_array_equal(
+        result.interpolated[mask], expected.interpolated[mask]
+    )
+    assert np.isnan(result.interpolated[~mask]).all()
+    # Probabilities follow sklearn's (X, Y, Z, C) layout
+    inside = mask.transpose()
+    np.testing.assert_array_equal(
+        result.probability[inside], expected.probability[inside]
+    )
+    assert np.isnan(result.probability[~inside]).all()
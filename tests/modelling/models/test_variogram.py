@@ -0,0 +1,132 @@
+"""test experimental variogram binning"""
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import pdist
+
+from py3dinterpolations.modelling.models.variogram import (
+    ExperimentalVariogram,
+    experimental_variogram,
+)
+
+
+@pytest.fixture
+def dense_samples():
+    """enough samples for pair subsampling and chunking to matter"""
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 100, (300, 3))
+    values = np.sin(points[:, 0] / 15) + rng.normal(0, 0.1, 300)
+    return points, values
+
+
+def reference(points, values, nlags, max_lag):
+    """bins of all pairs, computed from the full pair list"""
+    lags = pdist(points)
+    semivariance = 0.5 * pdist(values[:, np.newaxis], "sqeuclidean")
+    keep = lags <= max_lag
+    bins = np.minimum((lags[keep] / (max_lag / nlags)).astype(int), nlags - 1)
+    counts = np.bincount(bins, minlength=nlags)
+    binned = counts > 0
+    return (
+        np.bincount(bins, lags[keep], nlags)[binned] / counts[binned],
+        np.bincount(bins, semivariance[keep], nlags)[binned] / counts[binned],
+        counts[binned],
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"memory_limit": "64KB", "n_jobs": 3},
+        {"max_lag": 40.0},
+        {"max_lag": 40.0, "memory_limit": "64KB", "n_jobs": 3},
+    ],
+)
+def test_experimental_variogram_matches_all_pairs(dense_samples, kwargs):
+    """chunked and KD-tree binning match binning the full pair list"""
+    points, values = dense_samples
+    variogram = experimental_variogram(points, values, nlags=8, **kwargs)
+    max_lag = kwargs.get(
+        "max_lag", np.linalg.norm(points.max(axis=0) - points.min(axis=0))
+    )
+    lags, semivariance, counts = reference(points, values, 8, max_lag)
+    np.testing.assert_allclose(variogram.lags, lags, rtol=1e-12)
+    np.testing.assert_allclose(variogram.semivariance, semivariance, rtol=1e-12)
+    np.testing.assert_array_equal(variogram.counts, counts)
+
+
+@pytest.mark.parametrize(
+    "max_lag, max_pairs", [(None, 5000), (40.0, 5000), (15.0, 200)]
+)
+def test_experimental_variogram_subsampling(dense_samples, max_lag, max_pairs):
+    """max_pairs bins a reproducible random subset of about that many pairs"""
+    points, values = dense_samples
+    kwargs = {"max_lag": max_lag, "max_pairs": max_pairs, "random_state": 1}
+    first = experimental_variogram(points, values, **kwargs)
+    second = experimental_variogram(points, values, **kwargs)
+    full = experimental_variogram(points, values, max_lag=max_lag)
+    np.testing.assert_array_equal(first.semivariance, second.semivariance)
+    assert first.counts.sum() < full.counts.sum()
+    assert abs(first.counts.sum() - max_pairs) < 0.2 * max_pairs
+    if max_pairs >= 5000:
+        # The first bins hold enough pairs to stay close to the full estimate
+        np.testing.assert_allclose(
+            first.semivariance[:3], full.semivariance[:3], rtol=0.3
+        )
+
+
+def test_experimental_variogram_directional():
+    """directional bins only hold pairs along the requested direction"""
+    x, y = np.meshgrid(np.arange(5.0), np.arange(5.0))
+    points = np.column_stack([x.ravel(), y.ravel(), np.zeros(25)])
+    values = x.ravel()
+
+    east = experimental_variogram(
+        points, values, nlags=4, max_lag=4.5, azimuth=90.0, angle_tolerance=1.0
+    )
+    north = experimental_variogram(
+        points, values, nlags=4, max_lag=4.5, azimuth=0.0, angle_tolerance=1.0
+    )
+    # Pairs along rows: 5 rows with 4 + 3 + 2 + 1 pairs
+    assert east.counts.sum() == 50
+    np.testing.assert_allclose(east.semivariance, 0.5 * east.lags**2)
+    np.testing.assert_allclose(north.semivariance, 0.0)
+
+    banded = experimental_variogram(
+        points,
+        values,
+        nlags=4,
+        max_lag=4.5,
+        azimuth=90.0,
+        angle_tolerance=90.0,
+        bandwidth=0.5,
+    )
+    assert banded.counts.sum() == 50
+
+
+def test_experimental_variogram_fit():
+    """fitted parameters recover the model the bins were drawn from"""
+    lags = np.linspace(1.0, 10.0, 10)
+    variogram = ExperimentalVariogram(
+        lags=lags, semivariance=2.0 * lags + 0.5, counts=np.ones(10)
+    )
+    np.testing.assert_allclose(variogram.fit("linear"), [2.0, 0.5], atol=1e-6)
+    with pytest.raises(ValueError, match="Cannot fit"):
+        variogram.fit("custom")
+
+
+def test_experimental_variogram_errors(dense_samples):
+    points, values = dense_samples
+    with pytest.raises(ValueError, match="nlags"):
+        experimental_variogram(points, values, nlags=0)
+    with pytest.raises(ValueError, match="max_lag"):
+        experimental_variogram(points, values, max_lag=-1.0)
+    with pytest.raises(ValueError, match="angle_tolerance"):
+        experimental_variogram(points, values, azimuth=0.0, angle_tolerance=120.0)
+    with pytest.raises(ValueError, match="max_pairs"):
+        experimental_variogram(points, values, max_pairs=0)
+    with pytest.raises(ValueError, match="two samples"):
+        experimental_variogram(points[:1], values[:1])
+    with pytest.raises(ValueError, match="No sample pair"):
+        experimental_variogram(points, values, max_lag=1e-9)
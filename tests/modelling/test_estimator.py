@@ -1,10 +1,13 @@
 """test estimator module"""
 
+import numpy as np
+import pandas as pd
 import pytest
 from unittest.mock import patch, MagicMock
 
 from py3dinterpolations.core.griddata import GridData
-from py3dinterpolations.modelling.estimator import Estimator
+from py3dinterpolations.modelling import estimator as estimator_module
+from py3dinterpolations.modelling.estimator import Estimator, IDWEstimator
 
 
 PARAMS = {
@@ -31,3 +34,179 @@ def test_estimator(test_data):
     assert isinstance(estimator.best_score, float)
     assert isinstance(estimator.cv_results, dict)
     mock_cv.fit.assert_called_once()
+
+
+def test_idw_estimator(test_data):
+    """IDWEstimator scores every power and neighbourhood combination"""
+    gd = GridData(test_data)
+    estimator = IDWEstimator(gd, {"power": [1.0, 2.0, 4.0], "n_neighbors": [None, 8]})
+
+    results = estimator.cv_results
+    assert len(results["params"]) == 6
+    assert estimator.best_params in results["params"]
+    assert estimator.best_score == results["mean_test_score"].max()
+    best = results["params"].index(estimator.best_params)
+    assert results["rank_test_score"][best] == 1
+
+
+def test_idw_estimator_nan_scores():
+    """Combinations leaving samples without an estimate are never selected"""
+    df = pd.DataFrame(
+        {
+            "ID": ["A", "A", "B", "C"],
+            "X": [0.0, 0.0, 0.0, 100.0],
+            "Y": [0.0, 1.0, 2.0, 100.0],
+            "Z": [0.0, 0.0, 0.0, 0.0],
+            "V": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    gd = GridData(df)
+    estimator = IDWEstimator(gd, {"max_distance": [5.0, 500.0]})
+    assert np.isnan(estimator.cv_results["mean_test_score"][0])
+    assert estimator.best_params == {"max_distance": 500.0}
+
+    with pytest.raises(ValueError, match="No parameter combination"):
+        IDWEstimator(gd, {"max_distance": [5.0]})
+    with pytest.raises(ValueError, match="scoring"):
+        IDWEstimator(gd, {"power": [1.0]}, scoring="accuracy")
+
+
+@pytest.mark.parametrize("n_closest_points", [4, None])
+def test_estimator_cached_distances_match_pykrige(test_data, n_closest_points):
+    """Cached fold distances reproduce pykrige's cross-validation scores"""
+    gd = GridData(test_data)
+    params = {
+        "method": ["ordinary3d"],
+        "variogram_model": ["linear", "spherical"],
+        "nlags": [6],
+        "n_closest_points": [n_closest_points],
+    }
+    cached = Estimator(gd, params, verbose=0)
+    plain = Estimator(gd, params, verbose=0, cache_distances=False)
+
+    np.testing.assert_allclose(
+        cached.cv_results["mean_test_score"],
+        plain.cv_results["mean_test_score"],
+        rtol=1e-6,
+    )
+    assert cached.best_params == plain.best_params
+
+
+def test_estimator_releases_fold_cache(test_data):
+    """candidates share the search's fold cache, which is cleared after fit"""
+    gd = GridData(test_data)
+    params = {"method": ["ordinary3d"], "variogram_model": ["linear", "spherical"]}
+    caches = []
+    get = estimator_module._FoldCache.get
+
+    def tracked_get(cache, *args):
+        caches.append(cache)
+        return get(cache, *args)
+
+    with (
+        patch.object(estimator_module._FoldCache, "get", tracked_get),
+        patch.object(
+            estimator_module,
+            "_FoldDistances",
+            wraps=estimator_module._FoldDistances,
+        ) as fold_distances,
+    ):
+        Estimator(gd, params, verbose=0)
+    # Five folds plus the refit on all samples, each computed once
+    assert fold_distances.call_count == 6
+    assert len(caches) == 11
+    assert len({id(cache) for cache in caches}) == 1
+    assert not caches[0]._folds
+
+
+def test_fold_cache_memory_bound(monkeypatch):
+    """folds beyond the byte budget are evicted, keeping the newest one"""
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 10, (30, 3))
+    args = ((1.0, 1.0), (0.0, 0.0, 0.0))
+    cache = estimator_module._FoldCache()
+    first = cache.get(points, points[:, 0], *args)
+    monkeypatch.setattr(estimator_module, "_FOLD_CACHE_BYTES", first.nbytes)
+    cache.get(points, points[:, 1], *args)
+    assert len(cache._folds) == 1
+    assert cache.get(points, points[:, 0], *args) is not first
+
+
+def test_estimator_n_jobs(test_data):
+    """n_jobs is handed to GridSearchCV"""
+    gd = GridData(test_data)
+    with patch("py3dinterpolations.modelling.estimator.GridSearchCV") as mock_cv:
+        Estimator(gd, PARAMS, n_jobs=-1)
+    assert mock_cv.call_args.kwargs["n_jobs"] == -1
+
+
+SMALL_PARAMS = {
+    "method": ["ordinary3d"],
+    "variogram_model": ["linear", "spherical"],
+    "nlags": [4, 6, 8],
+}
+
+
+def test_estimator_random_search(test_data):
+    """random search scores n_iter sampled combinations"""
+    gd = GridData(test_data)
+    estimator = Estimator(
+        gd, SMALL_PARAMS, verbose=0, search="random", n_iter=3, random_state=0
+    )
+    assert len(estimator.cv_results["params"]) == 3
+    assert estimator.best_params in estimator.cv_results["params"]
+
+
+def test_estimator_halving_search(test_data):
+    """successive halving ends with the surviving candidates on all samples"""
+    gd = GridData(test_data)
+    estimator = Estimator(gd, SMALL_PARAMS, verbose=0, search="halving", random_state=0)
+    n_resources = estimator.cv_results["n_resources"]
+    assert n_resources.min() >= 50
+    assert n_resources.max() > len(test_data) - 3
+    assert estimator.best_params in estimator.cv_results["params"]
+
+
+def test_estimator_patience(test_data):
+    """search stops once the best score has not improved for patience candidates"""
+    gd = GridData(test_data)
+    scores = iter([-3.0, -1.0, -2.0, -2.0, -0.5, -0.1])
+    with patch(
+        "py3dinterpolations.modelling.estimator.cross_val_score",
+        side_effect=lambda *args, **kwargs: np.array([next(scores)]),
+    ):
+        estimator = Estimator(gd, SMALL_PARAMS, patience=2)
+    assert len(estimator.cv_results["params"]) == 4
+    assert estimator.best_score == -1.0
+    assert estimator.best_params == estimator.cv_results["params"][1]
+    assert estimator.estimator is None
+
+
+def test_estimator_time_budget(test_data):
+    """an exhausted time budget stops the search after the first candidate"""
+    gd = GridData(test_data)
+    clock = iter([0.0, 0.0, 10.0])
+    with (
+        patch(
+            "py3dinterpolations.modelling.estimator.time.perf_counter",
+            side_effect=lambda: next(clock),
+        ),
+        patch(
+            "py3dinterpolations.modelling.estimator.cross_val_score",
+            return_value=np.array([-1.0]),
+        ),
+    ):
+        estimator = Estimator(gd, SMALL_PARAMS, time_budget=5.0)
+    assert len(estimator.cv_results["params"]) == 1
+
+
+def test_estimator_search_errors(test_data):
+    gd = GridData(test_data)
+    with pytest.raises(ValueError, match="only apply to grid and random"):
+        Estimator(gd, SMALL_PARAMS, search="halving", patience=2)
+    with pytest.raises(ValueError, match="patience"):
+        Estimator(gd, SMALL_PARAMS, patience=0)
+    with pytest.raises(ValueError, match="time_budget"):
+        Estimator(gd, SMALL_PARAMS, time_budget=0)
+    with pytest.raises(ValueError):
+        Estimator(gd, SMALL_PARAMS, search="bayesian")
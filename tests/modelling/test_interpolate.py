@@ -7,6 +7,7 @@ from unittest.mock import patch
 from py3dinterpolations.core.griddata import GridData
 from py3dinterpolations.modelling.interpolate import interpolate
 from py3dinterpolations.modelling.modeler import Modeler
+from py3dinterpolations.modelling.models import get_model
 
 
 def test_interpolate_model_params_no_preprocessing(test_data):
@@ -73,6 +74,20 @@ def test_interpolate_both_params_raises(test_data):
         )
 
 
+def test_interpolate_without_variance(test_data):
+    """compute_variance=False is forwarded to the kriging model"""
+    gd = GridData(test_data)
+    modeler = interpolate(
+        griddata=gd,
+        model_type="ordinary_kriging",
+        grid_resolution=5,
+        model_params={"variogram_model": "linear"},
+        compute_variance=False,
+    )
+    assert modeler.result.interpolated is not None
+    assert modeler.result.variance is None
+
+
 def test_interpolate_idw(test_data):
     """test interpolate with IDW model"""
     gd = GridData(test_data)
@@ -84,3 +99,139 @@ def test_interpolate_idw(test_data):
     )
     assert isinstance(modeler, Modeler)
     assert modeler.result is not None
+
+
+def test_interpolate_idw_params_grid(test_data):
+    """IDW parameter search picks the best leave-one-out power"""
+    gd = GridData(test_data)
+    modeler = interpolate(
+        griddata=gd,
+        model_type="idw",
+        grid_resolution=5,
+        model_params_grid={"power": [1.0, 2.0, 3.0]},
+    )
+    assert modeler.model._power in (1.0, 2.0, 3.0)
+    assert modeler.result is not None
+
+
+def test_interpolate_search(test_data):
+    """search and search_kwargs are forwarded to the Estimator"""
+    gd = GridData(test_data)
+    with patch("py3dinterpolations.modelling.interpolate.Estimator") as mock:
+        mock.return_value.best_params = {
+            "method": "ordinary3d",
+            "variogram_model": "linear",
+        }
+        interpolate(
+            griddata=gd,
+            model_type="ordinary_kriging",
+            grid_resolution=5,
+            model_params_grid={
+                "method": ["ordinary3d"],
+                "variogram_model": ["linear", "spherical"],
+            },
+            search="random",
+            search_kwargs={"n_iter": 1, "random_state": 0},
+        )
+    assert mock.call_args.kwargs == {"search": "random", "n_iter": 1, "random_state": 0}
+
+
+def test_interpolate_idw_search_raises(test_data):
+    """IDW grids are only searched exhaustively"""
+    gd = GridData(test_data)
+    with pytest.raises(ValueError, match="exhaustively"):
+        interpolate(
+            griddata=gd,
+            model_type="idw",
+            grid_resolution=5,
+            model_params_grid={"power": [1.0, 2.0]},
+            search="random",
+        )
+
+
+def test_interpolate_memory_limit(test_data):
+    """memory_limit is forwarded to the model"""
+    gd = GridData(test_data)
+    with patch(
+        "py3dinterpolations.modelling.interpolate.get_model", wraps=get_model
+    ) as mock:
+        modeler = interpolate(
+            griddata=gd,
+            model_type="idw",
+            grid_resolution=5,
+            model_params={"power": 2},
+            memory_limit="1MB",
+        )
+    mock.assert_called_once_with(
+        "idw", power=2, dtype=np.dtype("float64"), memory_limit="1MB"
+    )
+    assert modeler.result is not None
+
+
+@pytest.mark.parametrize(
+    "model_type,model_params",
+    [
+        ("idw", {"power": 2}),
+        ("ordinary_kriging", {"variogram_model": "linear"}),
+    ],
+)
+def test_interpolate_float32(test_data, model_type, model_params):
+    """float32 is threaded through data, grid, model and result"""
+    gd = GridData(test_data, dtype="float32")
+    modeler = interpolate(
+        griddata=gd,
+        model_type=model_type,
+        grid_resolution=5,
+        model_params=model_params,
+        preprocessing={"normalize_xyz": True, "standardize_v": True},
+    )
+    reference = interpolate(
+        griddata=GridData(test_data),
+        model_type=model_type,
+        grid_resolution=5,
+        model_params=model_params,
+        preprocessing={"normalize_xyz": True, "standardize_v": True},
+    )
+    assert modeler.griddata.dtype == np.float32
+    assert modeler.grid.dtype == np.float32
+    assert modeler.result.interpolated.dtype == np.float32
+    np.testing.assert_allclose(
+        modeler.result.interpolated,
+        reference.result.interpolated,
+        rtol=1e-4,
+        atol=1e-4 * np.abs(reference.result.interpolated).max(),
+    )
+
+
+def test_interpolate_output_path(test_data, tmp_path):
+    """output_path makes interpolate write its result to disk"""
+    gd = GridData(test_data)
+    modeler = interpolate(
+        griddata=gd,
+        model_type="idw",
+        grid_resolution=5,
+        model_params={"power": 2},
+        output_path=tmp_path,
+    )
+    assert isinstance(modeler.result.interpolated, np.memmap)
+    assert (tmp_path / "interpolated.npy").exists()
+
+
+def test_interpolate_max_extrapolation_distance(test_data, tmp_path):
+    """nodes far from every sample are skipped and left NaN"""
+    gd = GridData(test_data)
+    kwargs = {"model_type": "idw", "grid_resolution": 5, "model_params": {"power": 2}}
+    full = interpolate(griddata=gd, **kwargs)
+    modeler = interpolate(griddata=gd, max_extrapolation_distance=6.0, **kwargs)
+
+    mask = modeler.grid.node_mask
+    assert 0 < mask.sum() < mask.size
+    interpolated = modeler.result.interpolated
+    np.testing.assert_allclose(interpolated[mask], full.result.interpolated[mask])
+    assert np.isnan(interpolated[~mask]).all()
+
+    modeler.save(tmp_path)
+    loaded = Modeler.load(tmp_path)
+    assert loaded.grid.max_extrapolation_distance == 6.0
+    np.testing.assert_array_equal(loaded.grid.node_mask, mask)
+    np.testing.assert_array_equal(loaded.predict(masked=True), interpolated)
@@ -2,11 +2,16 @@
 
 import pytest
 import numpy as np
+import pandas as pd
 
 from py3dinterpolations.core.griddata import GridData
-from py3dinterpolations.core.grid3d import create_grid
+from py3dinterpolations.core.grid3d import RegularGrid3D, create_grid
 from py3dinterpolations.modelling.modeler import Modeler
 from py3dinterpolations.modelling.models import get_model
+from py3dinterpolations.modelling.preprocessor import (
+    Preprocessor,
+    apply_preprocessing,
+)
 from py3dinterpolations.core.types import InterpolationResult
 
 scenarios = [
@@ -35,3 +40,363 @@ def test_modeler_init_and_predict(model_name, model_params, test_data):
     assert isinstance(modeler.result, InterpolationResult)
     assert isinstance(modeler.result.interpolated, np.ndarray)
     assert isinstance(interpolated, np.ndarray)
+
+
+@pytest.mark.parametrize("model_name,model_params", scenarios)
+def test_modeler_predict_out_of_core(model_name, model_params, test_data, tmp_path):
+    """slab-wise prediction into memory maps matches in-memory prediction"""
+    gd = GridData(test_data)
+    grid = create_grid(gd, 5)
+
+    in_memory = Modeler(gd, grid, get_model(model_name, **model_params))
+    expected = in_memory.predict()
+    expected_variance = in_memory.result.variance
+
+    modeler = Modeler(gd, grid, get_model(model_name, **model_params))
+    interpolated = modeler.predict(output_path=tmp_path / "out", slab_size=2)
+
+    assert isinstance(interpolated, np.memmap)
+    assert (tmp_path / "out" / "interpolated.npy").exists()
+    np.testing.assert_allclose(interpolated, expected)
+    np.testing.assert_allclose(np.load(tmp_path / "out" / "interpolated.npy"), expected)
+    if expected_variance is None:
+        assert modeler.result.variance is None
+    else:
+        assert isinstance(modeler.result.variance, np.memmap)
+        np.testing.assert_allclose(modeler.result.variance, expected_variance)
+
+
+def test_modeler_predict_out_of_core_probability(test_data, tmp_path):
+    """classifier probabilities are stored along their Z axis"""
+    from sklearn.neighbors import KNeighborsClassifier
+
+    from py3dinterpolations.modelling.models import SklearnModel
+
+    df = test_data.copy()
+    df["V"] = (df["V"] > df["V"].median()).astype(float)
+    gd = GridData(df)
+    grid = create_grid(gd, 5)
+    model = SklearnModel(KNeighborsClassifier(n_neighbors=3))
+
+    expected = Modeler(gd, grid, model).predict()
+    modeler = Modeler(gd, grid, model)
+    modeler.predict(output_path=tmp_path, slab_size=3)
+
+    np.testing.assert_array_equal(modeler.result.interpolated, expected)
+    probability = modeler.result.probability
+    assert probability.shape == (*expected.shape[::-1], 2)
+    np.testing.assert_allclose(probability.sum(axis=-1), 1.0)
+
+
+def test_modeler_predict_out_of_core_invalid_slab(test_data, tmp_path):
+    gd = GridData(test_data)
+    modeler = Modeler(gd, create_grid(gd, 5), get_model("idw"))
+    with pytest.raises(ValueError, match="slab_size"):
+        modeler.predict(output_path=tmp_path, slab_size=0)
+
+
+masked_scenarios = [
+    *scenarios,
+    ("ordinary_kriging", {"variogram_model": "linear", "n_neighbors": 8}),
+    ("ordinary_kriging", {"variogram_model": "linear", "solver": "native"}),
+]
+
+
+@pytest.mark.parametrize("model_name,model_params", masked_scenarios)
+def test_modeler_predict_masked(model_name, model_params, test_data, tmp_path):
+    """only nodes inside the hull are predicted, matching the full grid there"""
+    gd = Preprocessor(GridData(test_data)).preprocess()
+    grid = create_grid(GridData(test_data), {"X": 5, "Y": 4, "Z": 3})
+    mask = grid.node_mask
+    assert mask.shape == (len(grid.Z.grid), len(grid.Y.grid), len(grid.X.grid))
+    assert 0 < mask.sum() < mask.size
+
+    modeler = Modeler(gd, grid, get_model(model_name, **model_params))
+    full = modeler.predict(masked=False).copy()
+    full_variance = modeler.result.variance
+    interpolated = modeler.predict(masked=True)
+
+    np.testing.assert_allclose(interpolated[mask], full[mask], rtol=1e-6)
+    assert np.isnan(interpolated[~mask]).all()
+    if full_variance is not None:
+        variance = modeler.result.variance
+        np.testing.assert_allclose(variance[mask], full_variance[mask], rtol=1e-6)
+        assert np.isnan(variance[~mask]).all()
+
+    modeler.predict(output_path=tmp_path, slab_size=2, masked=True)
+    np.testing.assert_array_equal(modeler.result.interpolated, interpolated)
+    np.testing.assert_allclose(modeler.predict(), full, rtol=1e-6)
+
+
+def test_modeler_predict_masked_probability(test_data):
+    """classifier probabilities are scattered into their (X, Y, Z, C) layout"""
+    from sklearn.neighbors import KNeighborsClassifier
+
+    from py3dinterpolations.modelling.models import SklearnModel
+
+    df = test_data.copy()
+    df["V"] = (df["V"] > df["V"].median()).astype(float)
+    gd = GridData(df)
+    grid = create_grid(gd, {"X": 5, "Y": 5, "Z": 5})
+    modeler = Modeler(gd, grid, SklearnModel(KNeighborsClassifier(n_neighbors=3)))
+
+    full = modeler.predict(masked=False)
+    full_probability = modeler.result.probability
+    interpolated = modeler.predict(masked=True)
+    probability = modeler.result.probability
+
+    mask = grid.node_mask
+    np.testing.assert_array_equal(interpolated[mask], full[mask])
+    assert probability.shape == full_probability.shape
+    inside = mask.transpose()
+    np.testing.assert_allclose(probability[inside], full_probability[inside])
+    assert np.isnan(probability[~inside]).all()
+
+
+@pytest.mark.parametrize("masked", [True, False])
+@pytest.mark.parametrize("model_name,model_params", scenarios)
+def test_modeler_iter_predict(model_name, model_params, masked, test_data):
+    """tiles stitched together match predicting the whole grid"""
+    gd = GridData(test_data)
+    grid = create_grid(gd, {"X": 5, "Y": 4, "Z": 3})
+    modeler = Modeler(gd, None, get_model(model_name, **model_params))
+
+    interpolated = np.full(grid.mesh["X"].transpose(2, 0, 1).shape, -1.0)
+    # Tiles without any node inside the mask have no variance
+    variance = np.full_like(interpolated, np.nan)
+    for tile, result in modeler.iter_predict(grid, tile_shape=(2, 5, 7), masked=masked):
+        assert result.interpolated.shape == tile.shape
+        interpolated[tile.index] = result.interpolated
+        if result.variance is not None:
+            variance[tile.index] = result.variance
+    assert modeler.grid is None
+    assert modeler.result is None
+
+    expected = modeler.predict(grid, masked=masked)
+    np.testing.assert_allclose(interpolated, expected, rtol=1e-6)
+    if modeler.result.variance is not None:
+        np.testing.assert_allclose(variance, modeler.result.variance, rtol=1e-6)
+
+
+def test_modeler_iter_predict_default_tiles(test_data):
+    """default tiles are slabs of whole Z levels"""
+    gd = GridData(test_data)
+    grid = create_grid(gd, 5)
+    modeler = Modeler(gd, grid, get_model("idw"))
+    tiles = [tile for tile, _ in modeler.iter_predict()]
+    assert len(tiles) == 1
+    assert tiles[0].shape == (len(grid.Z.grid), len(grid.Y.grid), len(grid.X.grid))
+    with pytest.raises(ValueError, match="No grid"):
+        next(Modeler(gd, None, get_model("idw")).iter_predict())
+
+
+def test_modeler_predict_out_of_core_empty_slabs(test_data, tmp_path):
+    """slabs masked out entirely are NaN in every result file"""
+    gd = GridData(test_data)
+    grid = RegularGrid3D(
+        0.0,
+        100.0,
+        0.0,
+        50.0,
+        -20.0,
+        20.0,
+        5.0,
+        samples=gd.numpy_data[:, :3],
+        max_extrapolation_distance=4.0,
+    )
+    model = get_model("ordinary_kriging", variogram_model="linear", solver="native")
+    modeler = Modeler(gd, grid, model)
+    expected = modeler.predict(masked=True).copy()
+    expected_variance = modeler.result.variance.copy()
+    assert not grid.node_mask[0].any()
+
+    modeler.predict(output_path=tmp_path, slab_size=1, masked=True)
+    np.testing.assert_allclose(modeler.result.interpolated, expected, rtol=1e-6)
+    np.testing.assert_allclose(modeler.result.variance, expected_variance, rtol=1e-6)
+    assert np.isnan(modeler.result.variance[0]).all()
+
+
+def test_modeler_predict_out_of_core_empty_slabs_after_samples(tmp_path):
+    """slabs masked out entirely after predicted ones are NaN on disk too"""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "ID": np.arange(40).astype(str),
+            "X": rng.uniform(0, 10, 40),
+            "Y": rng.uniform(0, 10, 40),
+            "Z": rng.uniform(4, 6, 40),
+            "V": rng.normal(size=40),
+        }
+    )
+    gd = GridData(data)
+    grid = RegularGrid3D(
+        0.0,
+        10.0,
+        0.0,
+        10.0,
+        0.0,
+        10.0,
+        1.0,
+        samples=gd.numpy_data[:, :3],
+        max_extrapolation_distance=1.0,
+    )
+    model = get_model("ordinary_kriging", variogram_model="linear", solver="native")
+    modeler = Modeler(gd, grid, model)
+    expected = modeler.predict(masked=True).copy()
+    expected_variance = modeler.result.variance.copy()
+    assert not grid.node_mask[-1].any()
+
+    modeler.predict(output_path=tmp_path, slab_size=1, masked=True)
+    np.testing.assert_allclose(modeler.result.interpolated, expected, rtol=1e-6)
+    np.testing.assert_allclose(modeler.result.variance, expected_variance, rtol=1e-6)
+    assert np.isnan(np.load(tmp_path / "variance.npy")[-1]).all()
+
+
+def test_modeler_update_matches_refit(test_data):
+    """adding and removing samples refreshes the prediction like a refit"""
+    gd = GridData(test_data)
+    params = Preprocessor(gd).preprocess().preprocessing_params
+    ids = gd.data.index.get_level_values("ID")
+    initial = GridData(gd.data[ids != ids[0]].reset_index())
+    added = GridData(gd.data[ids == ids[0]].reset_index())
+
+    def build(data, **model_params):
+        return Modeler(
+            griddata=apply_preprocessing(data, params),
+            grid=create_grid(gd, 5),
+            model=get_model("idw", power=2, **model_params),
+        )
+
+    modeler = build(initial, incremental=True)
+    assert modeler.update(added) is None
+    modeler.predict()
+    np.testing.assert_allclose(modeler.result.interpolated, build(gd).predict())
+    assert len(modeler.griddata) == len(gd)
+
+    updated = modeler.update(added, remove=True)
+    np.testing.assert_allclose(updated, build(initial).predict())
+    assert len(modeler.griddata) == len(initial)
+
+
+def test_modeler_update_masked_reuses_sums(test_data, caplog):
+    """masked incremental IDW updates its sums instead of recomputing them"""
+    gd = GridData(test_data)
+    ids = gd.data.index.get_level_values("ID")
+    initial = GridData(gd.data[ids != ids[0]].reset_index())
+    added = GridData(gd.data[ids == ids[0]].reset_index())
+    grid = create_grid(gd, 5, max_extrapolation_distance=10.0)
+    assert not grid.node_mask.all()
+
+    modeler = Modeler(initial, grid, get_model("idw", power=2, incremental=True))
+    modeler.predict(masked=True)
+    with caplog.at_level("INFO", logger="py3dinterpolations.modelling.models.idw"):
+        updated = modeler.update(added)
+    assert "reusing accumulated sums" in caplog.text
+
+    expected = Modeler(gd, grid, get_model("idw", power=2)).predict(masked=True)
+    np.testing.assert_allclose(updated, expected, equal_nan=True)
+    assert np.isnan(updated[~grid.node_mask]).all()
+
+
+def test_modeler_update_unsupported_model(test_data):
+    gd = GridData(test_data)
+    model = get_model("ordinary_kriging", variogram_model="linear")
+    modeler = Modeler(griddata=gd, grid=create_grid(gd, 5), model=model)
+    with pytest.raises(NotImplementedError, match="incremental"):
+        modeler.update(gd)
+
+
+@pytest.mark.parametrize("resolution", [5, {"X": 5, "Y": 4, "Z": 2}])
+def test_modeler_save_load(test_data, tmp_path, resolution):
+    """a loaded Modeler keeps its data, grid and result and predicts alike"""
+    gd = GridData(test_data)
+    preprocessed = Preprocessor(gd).preprocess()
+    modeler = Modeler(
+        griddata=preprocessed,
+        grid=create_grid(gd, resolution),
+        model=get_model("ordinary_kriging", variogram_model="linear"),
+    )
+    interpolated = modeler.predict(dtype="float32")
+    modeler.save(tmp_path)
+
+    loaded = Modeler.load(tmp_path)
+    np.testing.assert_array_equal(loaded.result.interpolated, interpolated)
+    np.testing.assert_array_equal(loaded.result.variance, modeler.result.variance)
+    assert loaded.griddata.preprocessing_params == preprocessed.preprocessing_params
+    pd.testing.assert_frame_equal(loaded.griddata.data, preprocessed.data)
+    assert type(loaded.grid) is type(modeler.grid)
+    assert repr(loaded.grid) == repr(modeler.grid)
+    np.testing.assert_array_equal(
+        loaded.grid.prediction_points(), modeler.grid.prediction_points()
+    )
+    np.testing.assert_array_equal(loaded.predict(dtype="float32"), interpolated)
+
+
+def test_modeler_fits_lazily_once(test_data, monkeypatch):
+    """the model is fitted on first use, then reused across grids"""
+    gd = GridData(test_data)
+    model = get_model("idw", power=2)
+    calls = []
+    fit = model.fit
+    monkeypatch.setattr(model, "fit", lambda *args: calls.append(1) or fit(*args))
+
+    modeler = Modeler(griddata=gd, grid=None, model=model)
+    assert not modeler.is_fitted and not calls
+    with pytest.raises(ValueError, match="No grid"):
+        modeler.predict()
+
+    coarse, fine = create_grid(gd, 10), create_grid(gd, 5)
+    coarse_values = modeler.predict(grid=coarse)
+    fine_values = modeler.predict(grid=fine)
+    assert len(calls) == 1 and modeler.is_fitted
+    assert modeler.grid is fine
+    assert coarse.result.interpolated is coarse_values
+    assert fine.result.interpolated is fine_values
+    assert coarse_values.shape != fine_values.shape
+
+
+def test_modeler_from_fitted(test_data, monkeypatch):
+    """a model fitted elsewhere is wrapped without refitting"""
+    gd = Preprocessor(GridData(test_data)).preprocess()
+    grid = create_grid(gd, 5)
+    reference = Modeler(griddata=gd, grid=grid, model=get_model("idw", power=2))
+    expected = reference.predict()
+
+    model = get_model("idw", power=2)
+    data = gd.numpy_data
+    model.fit(data[:, 0], data[:, 1], data[:, 2], data[:, 3])
+    monkeypatch.setattr(model, "fit", lambda *args: pytest.fail("refitted"))
+    modeler = Modeler.from_fitted(model, gd)
+    assert modeler.is_fitted and modeler.grid is None
+    np.testing.assert_array_equal(modeler.predict(grid=grid), expected)
+
+
+@pytest.mark.parametrize("model_name,model_params", scenarios)
+def test_modeler_predict_points(model_name, model_params, test_data):
+    """points in original units match the grid prediction at its nodes"""
+    gd = GridData(test_data)
+    grid = create_grid(gd, 5)
+    modeler = Modeler(
+        griddata=Preprocessor(gd, normalize_xyz=False, standardize_v=True).preprocess(),
+        grid=grid,
+        model=get_model(model_name, **model_params),
+    )
+    expected = modeler.predict()
+    mz, my, mx = np.meshgrid(
+        grid.grid["Z"], grid.grid["Y"], grid.grid["X"], indexing="ij"
+    )
+    points = np.column_stack([mx.ravel(), my.ravel(), mz.ravel()])
+
+    result = modeler.predict_points(points, batch_size=7)
+    np.testing.assert_allclose(result.interpolated, expected.ravel(), rtol=1e-9)
+    assert modeler.result.interpolated is expected
+
+    # Normalized training data maps the points with its own parameters
+    normalized = Modeler(
+        griddata=Preprocessor(gd, normalize_xyz=True).preprocess(),
+        grid=grid,
+        model=get_model(model_name, **model_params),
+    )
+    samples = gd.data.reset_index()[["X", "Y", "Z"]].to_numpy()
+    at_samples = normalized.predict_points(samples).interpolated
+    np.testing.assert_allclose(at_samples, gd.data["V"].to_numpy(), atol=1e-6)
@@ -8,6 +8,7 @@ from py3dinterpolations.core.griddata import GridData
 from py3dinterpolations.core.types import PreprocessingParams
 from py3dinterpolations.modelling.preprocessor import (
     Preprocessor,
+    apply_preprocessing,
     reverse_preprocessing,
 )
 
@@ -75,7 +76,9 @@ def test_preprocessor_preprocess_output(
     "downsampling_res, normalize_xyz, standardize_v",
     PREPROCESSING_COMBINATIONS,
 )
-def test_reverse_preprocessing(downsampling_res, normalize_xyz, standardize_v, test_data):
+def test_reverse_preprocessing(
+    downsampling_res, normalize_xyz, standardize_v, test_data
+):
     """test reverse_preprocessing restores original data"""
     gd = GridData(test_data)
     pp_gd = Preprocessor(
@@ -101,3 +104,17 @@ def test_reverse_preprocessing_no_params(test_data):
     gd = GridData(test_data)
     with pytest.raises(ValueError, match="No preprocessing"):
         reverse_preprocessing(gd)
+
+
+@pytest.mark.parametrize("normalize_xyz, standardize_v", [(True, True), (False, True)])
+def test_apply_preprocessing(normalize_xyz, standardize_v, test_data):
+    """test apply_preprocessing reproduces a preprocessing run"""
+    gd = GridData(test_data)
+    pp_gd = Preprocessor(
+        gd, normalize_xyz=normalize_xyz, standardize_v=standardize_v
+    ).preprocess()
+
+    applied = apply_preprocessing(gd, pp_gd.preprocessing_params)
+
+    assert applied.preprocessing_params is pp_gd.preprocessing_params
+    assert_frame_equal(applied.data, pp_gd.data)
@@ -47,3 +47,18 @@ def test_normalize():
     assert output_params.max == 50.0
     assert output_series.min() == 0.0
     assert output_series.max() == 1.0
+
+
+def test_normalize_and_standardize_with_params():
+    """given params are applied instead of being computed from the series"""
+    series = pd.Series([0.0, 5.0, 10.0], name="X")
+    normalized, params = normalize(series, NormalizationParams(min=0.0, max=20.0))
+    assert params == NormalizationParams(min=0.0, max=20.0)
+    assert normalized.tolist() == [0.0, 0.25, 0.5]
+    constant, _ = normalize(series, NormalizationParams(min=1.0, max=1.0))
+    assert constant.eq(0.0).all()
+
+    standardized, _ = standardize(series, StandardizationParams(mean=5.0, std=2.5))
+    assert standardized.tolist() == [-2.0, 0.0, 2.0]
+    constant, _ = standardize(series, StandardizationParams(mean=0.0, std=0.0))
+    assert constant.eq(0.0).all()